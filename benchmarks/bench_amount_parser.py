@@ -0,0 +1,92 @@
+"""
+Benchmark the vectorized amount parser against the original per-row apply path.
+
+Usage:
+    python benchmarks/bench_amount_parser.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processor import CURRENCY_PATTERN, parse_amount_series
+
+
+def convert_amount(value):
+    """Per-row converter as previously used by auto_transform_data."""
+    if pd.isna(value) or value == '' or value.lower() == 'nan':
+        return 0
+
+    value = str(value).strip().upper()
+
+    if value.endswith('K'):
+        return float(value[:-1]) * 1000
+    elif value.endswith('M'):
+        return float(value[:-1]) * 1000000
+    elif value.endswith('B'):
+        return float(value[:-1]) * 1000000000
+    else:
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return 0
+
+
+def apply_parser(values: pd.Series) -> pd.Series:
+    """Original apply-based parsing path."""
+    text = values.astype(str).str.replace(CURRENCY_PATTERN, '', regex=True)
+    return text.apply(convert_amount)
+
+
+def make_amounts(rows: int, seed: int = 42) -> pd.Series:
+    """Build a mix of plain, currency-prefixed and K/M/B formatted amounts."""
+    rng = np.random.default_rng(seed)
+    amounts = rng.uniform(1, 999, rows).round(2).astype(str)
+    formats = rng.integers(0, 5, rows)
+    prefixes = np.array(['', '$', '€', '', '£'])[formats]
+    suffixes = np.array(['', 'K', 'M', '', 'B'])[rng.integers(0, 5, rows)]
+    return pd.Series(np.char.add(np.char.add(prefixes, amounts), suffixes), dtype=object)
+
+
+def time_call(func, values: pd.Series, repeat: int) -> float:
+    """Return the best wall time over ``repeat`` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(values)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Number of amounts to parse')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation (best is reported)')
+    args = parser.parse_args()
+
+    values = make_amounts(args.rows)
+
+    pd.testing.assert_series_equal(
+        apply_parser(values.head(10_000)).astype('float64'),
+        parse_amount_series(values.head(10_000)),
+        check_names=False
+    )
+
+    results = {
+        'apply': time_call(apply_parser, values, args.repeat),
+        'vectorized': time_call(parse_amount_series, values, args.repeat)
+    }
+
+    print(f"Parsing {args.rows:,} amounts (best of {args.repeat})")
+    for name, seconds in results.items():
+        print(f"  {name:<11} {seconds:8.3f} s  {args.rows / seconds / 1e6:8.2f} M rows/s")
+    print(f"  speedup     {results['apply'] / results['vectorized']:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark calculate_growth_trends against the original per-region loop.
+
+Usage:
+    python benchmarks/bench_growth_trends.py --groups 10 100 1000 5000
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processor import SalesDataProcessor
+
+logging.disable(logging.WARNING)
+
+
+def loop_growth_trends(data: pd.DataFrame) -> pd.DataFrame:
+    """Per-region filter/sort/concat implementation as previously used."""
+    yearly_data = data.groupby(['Year', 'Region'])['Sales'].sum().reset_index()
+
+    growth_data = []
+    for region in yearly_data['Region'].unique():
+        region_data = yearly_data[yearly_data['Region'] == region].sort_values('Year')
+        region_data['Sales_Growth'] = region_data['Sales'].pct_change() * 100
+        growth_data.append(region_data)
+
+    return pd.concat(growth_data, ignore_index=True)
+
+
+def make_data(groups: int, rows_per_group: int = 50, years: int = 10, seed: int = 42) -> pd.DataFrame:
+    """Build cleaned-shaped data with ``groups`` distinct regions."""
+    rng = np.random.default_rng(seed)
+    rows = groups * rows_per_group
+    return pd.DataFrame({
+        'Region': np.repeat([f"Region {i:05d}" for i in range(groups)], rows_per_group),
+        'Year': rng.integers(2015, 2015 + years, rows),
+        'Sales': rng.uniform(1000, 100000, rows).round(2)
+    })
+
+
+def time_call(func, data: pd.DataFrame, repeat: int) -> float:
+    """Return the best wall time over ``repeat`` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--groups', type=int, nargs='+', default=[10, 100, 1000, 5000],
+                        help='Numbers of distinct regions to benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation (best is reported)')
+    args = parser.parse_args()
+
+    processor = SalesDataProcessor()
+
+    print(f"{'groups':>8} {'loop (s)':>10} {'grouped (s)':>12} {'speedup':>8}")
+    for groups in args.groups:
+        data = make_data(groups)
+
+        pd.testing.assert_frame_equal(loop_growth_trends(data), processor.calculate_growth_trends(data))
+
+        loop_seconds = time_call(loop_growth_trends, data, args.repeat)
+        grouped_seconds = time_call(processor.calculate_growth_trends, data, args.repeat)
+        print(f"{groups:>8} {loop_seconds:>10.4f} {grouped_seconds:>12.4f} {loop_seconds / grouped_seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Check that every installed compute backend produces the same pipeline results as pandas, and time them.
+
+Usage:
+    python benchmarks/compare_backends.py --rows 100000 1000000
+    python benchmarks/compare_backends.py --backends pandas polars --shapes sample
+
+Exits with status 1 if any backend's results differ from the pandas results.
+Sums are compared with a relative tolerance, since multi-threaded engines add
+floating point values in a different order.
+The same equivalence checks run as tests in tests/test_compute_backend.py.
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from compute_backend import BACKENDS, available_backends
+from data_processor import SalesDataProcessor
+from run_benchmarks import SHAPES, make_dataset
+
+logging.disable(logging.WARNING)
+
+DEFAULT_ROWS = [10_000, 100_000]
+
+# Pipeline results that must match across backends
+COMPARED_RESULTS = ['raw_data', 'cleaned_data', 'continent_data', 'country_data', 'growth_trends',
+                    'top_countries', 'top_regions', 'cube']
+
+RELATIVE_TOLERANCE = 1e-9
+
+
+def run_pipeline(backend: str, path: str, seed: int = 42) -> Dict:
+    """Run the full pipeline on ``backend`` and return its results plus the wall time."""
+    # Datasets without a product column get random categories; seed them identically
+    random.seed(seed)
+
+    processor = SalesDataProcessor(backend=backend)
+    start = time.perf_counter()
+    results = processor.process_full_pipeline(path, use_cache=False, use_sidecar=False)
+    # Results are computed lazily, so read them all inside the timed region
+    frames = {key: results[key] for key in COMPARED_RESULTS}
+    frames['seconds'] = time.perf_counter() - start
+    return frames
+
+
+def compare(expected: Dict, actual: Dict) -> List[str]:
+    """Return a message for every result that differs from the reference."""
+    differences = []
+    for key in COMPARED_RESULTS:
+        try:
+            # Text columns may come back as object or str depending on the engine
+            pd.testing.assert_frame_equal(
+                expected[key].reset_index(drop=True), actual[key].reset_index(drop=True),
+                check_dtype=False, check_exact=False, rtol=RELATIVE_TOLERANCE
+            )
+        except AssertionError as e:
+            differences.append(f"{key}: {str(e).splitlines()[0]}")
+    return differences
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help='Dataset sizes in rows')
+    parser.add_argument('--shapes', nargs='+', default=SHAPES, choices=SHAPES, help='Dataset shapes')
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS),
+                        help='Backends to compare against pandas')
+    args = parser.parse_args()
+
+    installed = available_backends()
+    skipped = [name for name in args.backends if name not in installed]
+    backends = [name for name in args.backends if name in installed and name != 'pandas']
+    if skipped:
+        print(f"Not installed, skipped: {', '.join(skipped)}")
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as workdir:
+        for shape in args.shapes:
+            for rows in args.rows:
+                path = os.path.join(workdir, f"{shape}_{rows}.csv")
+                make_dataset(shape, rows).to_csv(path, index=False)
+
+                reference = run_pipeline('pandas', path)
+                print(f"{shape}/{rows}: pandas {reference['seconds']:.3f} s")
+
+                for backend in backends:
+                    results = run_pipeline(backend, path)
+                    differences = compare(reference, results)
+                    status = 'matches pandas' if not differences else f"{len(differences)} difference(s)"
+                    print(f"  {backend:<8} {results['seconds']:.3f} s  {status}")
+                    for message in differences:
+                        print(f"    {message}")
+                    failures += bool(differences)
+
+    if not backends:
+        print("No alternative backend installed; nothing to compare.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+Benchmark every SalesDataProcessor and SalesVisualizer stage across dataset sizes and shapes.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 10000 100000 1000000 --output results.json
+    python benchmarks/run_benchmarks.py --sizes 10000 100000 --baseline results.json
+
+Shapes:
+    sample        Country/Region/Product_Category/Year/Sales/Profit, as data/sample_sales_data.csv
+    tech          Global Tech Gadget Consumption metrics (no Region, Sales or Profit columns)
+    transactions  Real_Dataset_2 style rows (Sales Person, Product, Date, Amount)
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processor import SalesDataProcessor
+from filter_index import FilterIndex
+from synthetic_data import generate_sales_data
+from visualizations import SalesVisualizer
+
+logging.disable(logging.WARNING)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+SHAPES = ['sample', 'tech', 'transactions']
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+REGRESSION_THRESHOLD = 0.20
+# Timed runs per stage; the fastest is reported, as timeit does
+DEFAULT_REPEATS = 5
+
+
+def make_dataset(shape: str, rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a raw dataset of the given shape and size.
+
+    The bundled real datasets are resampled with replacement and jittered so
+    that value distributions and column formats stay realistic.
+    """
+    if shape == 'sample':
+        data = generate_sales_data(rows, seed=seed)
+        return data.astype({col: str for col in ['Country', 'Region', 'Product_Category']})
+
+    source_file = {
+        'tech': 'Global_Tech_Gadget_Consumption.csv',
+        'transactions': 'Real_Dataset_2.csv'
+    }[shape]
+    source = pd.read_csv(os.path.join(DATA_DIR, source_file))
+
+    rng = np.random.default_rng(seed)
+    data = source.iloc[rng.integers(0, len(source), rows)].reset_index(drop=True)
+
+    numeric_columns = data.select_dtypes(include=[np.number]).columns.drop('Year', errors='ignore')
+    for col in numeric_columns:
+        data[col] = (data[col] * rng.uniform(0.9, 1.1, rows)).round(2)
+
+    return data
+
+
+def measure(func: Callable[[], Any], rows: int, repeats: int = DEFAULT_REPEATS) -> Dict[str, float]:
+    """
+    Return wall time, throughput and tracemalloc peak memory for ``func``.
+
+    Memory is measured in a first, untimed run, since tracemalloc slows down
+    allocation-heavy code considerably; that run also warms up caches and
+    lazy imports. The reported time is the best of ``repeats`` timed runs,
+    the least noisy estimate for stages that take milliseconds, with the
+    median kept alongside.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    timings = timeit.repeat(func, repeat=repeats, number=1)
+    seconds = min(timings)
+
+    return {
+        'seconds': seconds,
+        'median_seconds': float(np.median(timings)),
+        'repeats': repeats,
+        'rows_per_second': rows / seconds if seconds > 0 else float('inf'),
+        'peak_memory_mb': peak / 1024 / 1024
+    }
+
+
+def benchmark_dataset(shape: str, rows: int, workdir: str,
+                      repeats: int = DEFAULT_REPEATS) -> Dict[str, Dict[str, float]]:
+    """Benchmark all stages on one dataset, feeding each stage the previous stage's output."""
+    processor = SalesDataProcessor()
+    visualizer = SalesVisualizer()
+    results = {}
+
+    raw_path = os.path.join(workdir, f"{shape}_{rows}.csv")
+    make_dataset(shape, rows).to_csv(raw_path, index=False)
+
+    state = {}
+
+    def run(name: str, func: Callable[[], Any]):
+        def call():
+            state[name] = func()
+        try:
+            results[name] = measure(call, rows, repeats)
+        except Exception as e:
+            # Record the failure and keep benchmarking the remaining stages
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+
+    run('load_data', lambda: processor.load_data(raw_path, use_sidecar=False))
+    processor.load_data(raw_path)  # write the sidecar outside the timed region
+    run('load_data_sidecar', lambda: processor.load_data(raw_path))
+    run('auto_transform_data', lambda: processor.auto_transform_data(state['load_data']))
+    run('clean_data', lambda: processor.clean_data(state['auto_transform_data']))
+
+    cleaned = state['clean_data']
+    run('aggregate_by_continent', lambda: processor.aggregate_by_continent(cleaned))
+    run('aggregate_by_country', lambda: processor.aggregate_by_country(cleaned))
+    run('aggregate_rollup', lambda: processor.aggregate_rollup(cleaned))
+    run('calculate_growth_trends', lambda: processor.calculate_growth_trends(cleaned))
+    run('build_cube', lambda: processor.build_cube(cleaned))
+    run('query_cube', lambda: processor.query_cube(state['build_cube']))
+    run('filter_index', lambda: FilterIndex(cleaned))
+    run('filter_index_take', lambda: state['filter_index'].take(cleaned, {
+        'Region': list(cleaned['Region'].unique()[:2]),
+        'Year': list(cleaned['Year'].unique()[:2]) if 'Year' in cleaned.columns else None
+    }))
+
+    continent_data = state['aggregate_by_continent']
+    country_data = state['aggregate_by_country']
+    growth_trends = state['calculate_growth_trends']
+    run('get_top_performers', lambda: processor.get_top_performers(country_data, 'Total_Sales', 15))
+
+    data_dict = {
+        'cleaned_data': cleaned,
+        'continent_data': continent_data,
+        'country_data': country_data,
+        'growth_trends': growth_trends,
+        'top_countries': state['get_top_performers'],
+        'top_regions': processor.get_top_performers(continent_data, 'Total_Sales', 10)
+    }
+
+    visualizer_calls = {
+        'create_world_map': lambda: visualizer.create_world_map(country_data),
+        'create_continent_bar_chart': lambda: visualizer.create_continent_bar_chart(continent_data),
+        'create_growth_trend_chart': lambda: visualizer.create_growth_trend_chart(growth_trends),
+        'create_top_performers_chart': lambda: visualizer.create_top_performers_chart(country_data.head(10)),
+        'create_profit_vs_sales_scatter': lambda: visualizer.create_profit_vs_sales_scatter(country_data),
+        'create_sales_distribution_pie': lambda: visualizer.create_sales_distribution_pie(continent_data),
+        'create_kpi_cards': lambda: visualizer.create_kpi_cards(data_dict),
+        'create_comprehensive_dashboard': lambda: visualizer.create_comprehensive_dashboard(data_dict)
+    }
+
+    missing = [name for name in dir(SalesVisualizer) if name.startswith('create_') and name not in visualizer_calls]
+    if missing:
+        print(f"  warning: no benchmark for {', '.join(missing)}")
+
+    for name, func in visualizer_calls.items():
+        run(name, func)
+
+    for path in [raw_path, os.path.join(workdir, f".{shape}_{rows}.csv.arrow")]:
+        if os.path.exists(path):
+            os.remove(path)
+
+    return results
+
+
+def compare_to_baseline(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return a message for every stage that got more than ``threshold`` slower than the baseline."""
+    regressions = []
+    for dataset, stages in results['datasets'].items():
+        for stage, stats in stages.items():
+            previous = baseline.get('datasets', {}).get(dataset, {}).get(stage)
+            if 'error' in stats or previous is None or previous.get('seconds', 0) <= 0:
+                continue
+
+            change = stats['seconds'] / previous['seconds'] - 1
+            if change > threshold:
+                regressions.append(
+                    f"{dataset} {stage}: {previous['seconds']:.4f} s -> {stats['seconds']:.4f} s ({change:+.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Dataset sizes in rows')
+    parser.add_argument('--shapes', nargs='+', default=SHAPES, choices=SHAPES, help='Dataset shapes')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--baseline', help='Compare against a previously saved JSON result file')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='Relative slowdown that counts as a regression (default 0.20)')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS,
+                        help='Timed runs per stage; the fastest is reported (default 5)')
+    args = parser.parse_args()
+
+    results = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'datasets': {}
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for shape in args.shapes:
+            for rows in args.sizes:
+                dataset = f"{shape}/{rows}"
+                print(f"Benchmarking {dataset} ...")
+                stages = benchmark_dataset(shape, rows, workdir, args.repeats)
+                results['datasets'][dataset] = stages
+
+                for stage, stats in stages.items():
+                    if 'error' in stats:
+                        print(f"  {stage:<32} failed: {stats['error'][:80]}")
+                        continue
+                    print(f"  {stage:<32} {stats['seconds']:>9.4f} s {stats['rows_per_second']:>14,.0f} rows/s "
+                          f"{stats['peak_memory_mb']:>9.1f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == '__main__':
+    main()
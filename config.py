@@ -42,6 +42,13 @@ EXPORT_DIRECTORY = "exports"
 ## Performance Settings
 MAX_ROWS_DISPLAY = 10000
 CACHE_TTL = 3600  # seconds
+CACHE_MAX_MEMORY_MB = 512  # memory budget for cached pipeline results
+FILTER_CACHE_MAX_ENTRIES = 64  # filter selections kept per process
+COMPUTE_BACKEND = "pandas"  # pandas, polars, duckdb or auto (first installed); polars/duckdb are optional
+PRUNE_COLUMNS_ON_LOAD = True  # parse only the columns the pipeline uses, with declared dtypes; others are left out of the data tables
+DATASET_STORE_PATH = None  # e.g. "data/processed.sqlite" to share processed datasets across processes
+DATASET_STORE_MAX_DATASETS = 20  # datasets kept in the store; older ones are evicted on save
+DATASET_STORE_MAX_AGE = 7 * 24 * 3600  # seconds a stored dataset is kept
 
 ## Feature Flags
 ENABLE_MAP_VISUALIZATION = True
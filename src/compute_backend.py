@@ -0,0 +1,223 @@
+import os
+from typing import IO, Dict, List, Optional, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import duckdb
+    # The DuckDB backend hands data to DuckDB as Arrow tables
+    import pyarrow as pa
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import COMPUTE_BACKEND
+except ImportError:
+    # config.py lives at the project root, which is not always on sys.path
+    COMPUTE_BACKEND = 'pandas'
+
+# Engines tried in order by backend='auto'
+AUTO_BACKEND_ORDER = ['polars', 'duckdb', 'pandas']
+
+# Column types DuckDB may infer when reading CSV; dates and times stay text so
+# clean_data parses them exactly as it does for pandas-loaded data
+DUCKDB_CSV_TYPES = ['BOOLEAN', 'BIGINT', 'DOUBLE', 'VARCHAR']
+
+CsvSource = Union[str, IO]
+DtypeMap = Optional[Dict[str, str]]
+
+
+class PandasBackend:
+    """
+    Single-threaded pandas engine, and the reference the other backends match.
+
+    A backend runs the row-level heavy lifting of SalesDataProcessor: parsing
+    CSV into a DataFrame and summing metrics per group. Every backend takes
+    and returns pandas DataFrames with the same columns, dtypes and row order,
+    so the rest of the pipeline does not depend on the engine.
+    """
+
+    name = 'pandas'
+
+    def read_csv(self, source: CsvSource, usecols: Optional[List[str]] = None,
+                 dtype: DtypeMap = None) -> pd.DataFrame:
+        """
+        Parse CSV from a path or file-like object.
+
+        Args:
+            source (CsvSource): File path or file-like object
+            usecols (Optional[List[str]]): Columns to read, or None for all
+            dtype (DtypeMap): pandas dtype per column; columns not listed are inferred
+
+        Returns:
+            pd.DataFrame: Parsed data
+        """
+        return pd.read_csv(source, usecols=usecols, dtype=dtype)
+
+    def group_sum(self, data: pd.DataFrame, keys: List[str], metrics: List[str],
+                  dropna: bool = True) -> pd.DataFrame:
+        """
+        Sum ``metrics`` and count non-missing Sales per group in one scan.
+
+        Args:
+            data (pd.DataFrame): Data to aggregate
+            keys (List[str]): Grouping columns
+            metrics (List[str]): Columns to sum
+            dropna (bool): Whether to drop groups with missing keys
+
+        Returns:
+            pd.DataFrame: Keys plus the summed metrics and Record_Count, sorted by the keys
+        """
+        grouped = data.groupby(keys, dropna=dropna, observed=True)
+        partials = grouped[metrics].sum()
+        partials['Record_Count'] = grouped['Sales'].count()
+
+        return partials.reset_index()
+
+    @staticmethod
+    def _match_pandas(result: pd.DataFrame, data: pd.DataFrame, keys: List[str],
+                      metrics: List[str]) -> pd.DataFrame:
+        """Give an engine's group_sum result the dtypes and row order pandas produces."""
+        dtypes = {key: data[key].dtype for key in keys}
+        for col in metrics:
+            # pandas sums integers and booleans as int64
+            dtypes[col] = data[col].dtype if pd.api.types.is_float_dtype(data[col]) else np.int64
+        dtypes['Record_Count'] = np.int64
+
+        result = result[keys + metrics + ['Record_Count']].astype(dtypes)
+        for key in keys:
+            if isinstance(dtypes[key], pd.CategoricalDtype):
+                # astype treats unordered categoricals with the same categories as
+                # equal and keeps the engine's order; take the input's order instead
+                result[key] = result[key].cat.set_categories(dtypes[key].categories)
+        # Categorical keys sort by category order, as in groupby(observed=True)
+        return result.sort_values(keys, na_position='last', kind='stable', ignore_index=True)
+
+
+class PolarsBackend(PandasBackend):
+    """Multi-threaded Polars engine; uses every core for CSV parsing and group-bys."""
+
+    name = 'polars'
+
+    # Rows Polars samples to infer column types; larger values scan more of the file
+    INFER_SCHEMA_ROWS = 10_000
+
+    def read_csv(self, source: CsvSource, usecols: Optional[List[str]] = None,
+                 dtype: DtypeMap = None) -> pd.DataFrame:
+        try:
+            data = pl.read_csv(source, columns=usecols, infer_schema_length=self.INFER_SCHEMA_ROWS).to_pandas()
+        except Exception as e:
+            # Types inferred from the sample can fail later in the file
+            logger.warning(f"Polars could not parse the CSV ({str(e)}); falling back to pandas")
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            return super().read_csv(source, usecols, dtype)
+        return data.astype(dtype) if dtype else data
+
+    def group_sum(self, data: pd.DataFrame, keys: List[str], metrics: List[str],
+                  dropna: bool = True) -> pd.DataFrame:
+        # NaN keys become nulls, which group together as pandas' dropna=False does
+        frame = pl.from_pandas(data[keys + metrics], nan_to_null=True)
+        if dropna:
+            frame = frame.drop_nulls(keys)
+
+        result = frame.group_by(keys).agg(
+            [pl.col(col).sum() for col in metrics] + [pl.col('Sales').count().alias('Record_Count')]
+        )
+        return self._match_pandas(result.to_pandas(), data, keys, metrics)
+
+
+class DuckDBBackend(PandasBackend):
+    """Multi-threaded embedded DuckDB engine; runs group-bys as SQL over Arrow data."""
+
+    name = 'duckdb'
+
+    def read_csv(self, source: CsvSource, usecols: Optional[List[str]] = None,
+                 dtype: DtypeMap = None) -> pd.DataFrame:
+        if not isinstance(source, (str, os.PathLike)):
+            return super().read_csv(source, usecols, dtype)
+
+        try:
+            with duckdb.connect() as con:
+                path = os.fspath(source).replace("'", "''")
+                types = ', '.join(f"'{name}'" for name in DUCKDB_CSV_TYPES)
+                select = ', '.join(self._quote(col) for col in usecols) if usecols else '*'
+                data = con.execute(
+                    f"SELECT {select} FROM read_csv('{path}', header = true, auto_type_candidates = [{types}])"
+                ).df()
+        except Exception as e:
+            logger.warning(f"DuckDB could not parse the CSV ({str(e)}); falling back to pandas")
+            return super().read_csv(source, usecols, dtype)
+        return data.astype(dtype) if dtype else data
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return '"' + str(name).replace('"', '""') + '"'
+
+    def group_sum(self, data: pd.DataFrame, keys: List[str], metrics: List[str],
+                  dropna: bool = True) -> pd.DataFrame:
+        key_list = ', '.join(self._quote(key) for key in keys)
+        # SUM over a group with only NULLs is NULL in SQL but 0 in pandas
+        sums = ', '.join(f"COALESCE(SUM({self._quote(col)}), 0) AS {self._quote(col)}" for col in metrics)
+        where = ' AND '.join(f"{self._quote(key)} IS NOT NULL" for key in keys) if dropna else 'TRUE'
+
+        # Arrow turns NaN into NULL, which DuckDB groups together like pandas' dropna=False
+        table = pa.Table.from_pandas(data[keys + metrics], preserve_index=False)
+        with duckdb.connect() as con:
+            con.register('partial_input', table)
+            result = con.execute(
+                f"SELECT {key_list}, {sums}, COUNT({self._quote('Sales')}) AS Record_Count "
+                f"FROM partial_input WHERE {where} GROUP BY {key_list}"
+            ).df()
+
+        return self._match_pandas(result, data, keys, metrics)
+
+
+BACKENDS = {
+    'pandas': (PandasBackend, True),
+    'polars': (PolarsBackend, POLARS_AVAILABLE),
+    'duckdb': (DuckDBBackend, DUCKDB_AVAILABLE)
+}
+
+
+def available_backends() -> List[str]:
+    """Return the names of the backends whose engine is installed."""
+    return [name for name, (_, available) in BACKENDS.items() if available]
+
+
+def get_backend(name: Optional[str] = None) -> PandasBackend:
+    """
+    Return a compute backend by name, falling back to pandas if its engine is not installed.
+
+    Args:
+        name (Optional[str]): 'pandas', 'polars', 'duckdb' or 'auto' (the first
+            installed of AUTO_BACKEND_ORDER); None uses config.COMPUTE_BACKEND
+
+    Returns:
+        PandasBackend: Backend instance
+    """
+    name = (name or COMPUTE_BACKEND).strip().lower()
+
+    if name == 'auto':
+        name = next(candidate for candidate in AUTO_BACKEND_ORDER if BACKENDS[candidate][1])
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown compute backend: {name}. Choose from {', '.join(BACKENDS)} or auto")
+
+    backend_class, available = BACKENDS[name]
+    if not available:
+        logger.warning(f"Compute backend '{name}' is not installed; using pandas")
+        return PandasBackend()
+
+    return backend_class()
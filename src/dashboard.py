@@ -1,6 +1,4 @@
 import streamlit as st
-import pandas as pd
-import io
 import os
 from data_processor import SalesDataProcessor, create_sample_data
 from visualizations import SalesVisualizer
@@ -482,97 +480,65 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
     
     # Data processing
     if data_source == "Upload File" and uploaded_file is not None:
-        # Process uploaded file
-        temp_file = f"temp_{uploaded_file.name}"
-        with open(temp_file, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
+        # Process uploaded file straight from the upload buffer
         try:
-            data_dict = processor.process_full_pipeline(temp_file)
+            data_dict = processor.process_upload(uploaded_file, uploaded_file.name, lean=True)
             st.success("✅ Data uploaded and processed successfully!")
         except Exception as e:
             st.error(f"❌ Error processing file: {str(e)}")
-            data_dict = processor.process_full_pipeline(sample_data_path)
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
     
     elif data_source == "Use Real Data":
         # Process real dataset from Kaggle
         if 'real_data_path' in st.session_state and st.session_state['real_data_path']:
             try:
                 real_data_path = st.session_state['real_data_path']
-                data_dict = processor.process_full_pipeline(real_data_path)
+                data_dict = processor.process_full_pipeline(real_data_path, lean=True)
             except Exception as e:
                 st.error(f"❌ Error processing real dataset: {str(e)}")
                 st.info(" Using sample data instead.")
-                data_dict = processor.process_full_pipeline(sample_data_path)
+                data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
         else:
             st.warning("⚠️ Please load the real dataset first using the button above.")
             st.info("🔄 Using sample data meanwhile...")
-            data_dict = processor.process_full_pipeline(sample_data_path)
+            data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
     
     elif data_source == "Use Real Dataset 2":
         # Process second real dataset
         if 'real_data_path_2' in st.session_state and st.session_state['real_data_path_2']:
             try:
                 real_data_path_2 = st.session_state['real_data_path_2']
-                data_dict = processor.process_full_pipeline(real_data_path_2)
+                data_dict = processor.process_full_pipeline(real_data_path_2, lean=True)
             except Exception as e:
                 st.error(f"❌ Error processing Real Dataset 2: {str(e)}")
                 st.info("💡 Using sample data instead.")
-                data_dict = processor.process_full_pipeline(sample_data_path)
+                data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
         else:
             st.warning("⚠️ Please load Real Dataset 2 first using the button above.")
             st.info("🔄 Using sample data meanwhile...")
-            data_dict = processor.process_full_pipeline(sample_data_path)
+            data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
     
     elif data_source == "Paste CSV Data" and csv_text:
         # Process pasted CSV data with auto-transformation
         try:
-            # Create DataFrame from pasted CSV text
-            csv_data = pd.read_csv(io.StringIO(csv_text))
+            # Run the cached pipeline on the pasted CSV text
+            data_dict = processor.process_csv_text(csv_text, lean=True)
+            csv_preview = data_dict['raw_preview']
+            cleaned_data = data_dict['cleaned_data']
             
             # Show original data preview
-            st.info(f"📋 {len(csv_data)} rows loaded with columns: {', '.join(csv_data.columns)}")
-            
-            # Auto-transform the data to required format
-            transformed_data = processor.auto_transform_data(csv_data)
-            
-            # Clean and process the transformed data
-            cleaned_data = processor.clean_data(transformed_data)
-            
-            # Create aggregations
-            continent_data = processor.aggregate_by_continent(cleaned_data)
-            country_data = processor.aggregate_by_country(cleaned_data)
-            growth_trends = processor.calculate_growth_trends(cleaned_data)
-            
-            # Get top performers
-            top_countries = processor.get_top_performers(country_data, 'Total_Sales', 15)
-            top_regions = processor.get_top_performers(continent_data, 'Total_Sales', 10)
-            
-            data_dict = {
-                'raw_data': csv_data,
-                'transformed_data': transformed_data,
-                'cleaned_data': cleaned_data,
-                'continent_data': continent_data,
-                'country_data': country_data,
-                'growth_trends': growth_trends,
-                'top_countries': top_countries,
-                'top_regions': top_regions
-            }
+            st.info(f"📋 {data_dict['raw_rows']} rows loaded with columns: {', '.join(csv_preview.columns)}")
             
             st.success(f"✅ CSV data auto-transformed and processed! {len(cleaned_data)} records ready for analysis.")
                 
         except Exception as e:
             st.error(f"❌ Error processing CSV data: {str(e)}")
             st.info("💡 The system will auto-transform column names and data formats. Any raw data format should work!")
-            data_dict = processor.process_full_pipeline(sample_data_path)
+            data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
     
     else:
         # Use sample data
-        data_dict = processor.process_full_pipeline(sample_data_path)
+        data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
         if data_source == "Use Sample Data":
             st.info("📋 Using sample data. Upload your own file or paste CSV data to analyze real data.")
     
@@ -592,37 +558,27 @@ def apply_filters(data_dict, device_type):
     
     selected_regions, selected_years, selected_products = filter_content
     
-    # Apply filters to data
-    filtered_data = data_dict['cleaned_data'].copy()
-    
-    if selected_regions:
-        filtered_data = filtered_data[filtered_data['Region'].isin(selected_regions)]
-    
-    if selected_years and 'Year' in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data['Year'].isin(selected_years)]
-        
-    if selected_products and 'Product_Category' in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data['Product_Category'].isin(selected_products)]
-    
-    # Recalculate aggregations with filtered data
+    # Filtered rows come from the bitmap index and aggregates from the cube;
+    # results are memoized per selection, so revisiting one is instant
     processor = SalesDataProcessor()
-    filtered_continent_data = processor.aggregate_by_continent(filtered_data)
-    filtered_country_data = processor.aggregate_by_country(filtered_data)
-    filtered_growth_data = processor.calculate_growth_trends(filtered_data)
-    
-    return {
-        'cleaned_data': filtered_data,
-        'continent_data': filtered_continent_data,
-        'country_data': filtered_country_data,
-        'growth_trends': filtered_growth_data
-    }
+    filtered_data_dict = processor.filter_results(
+        data_dict,
+        regions=selected_regions or None,
+        years=selected_years or None,
+        products=selected_products or None
+    )
+    
+    return filtered_data_dict
 
 def create_filter_content(data_dict, use_sidebar=False):
     """Create filter controls."""
     widget_func = st.sidebar if use_sidebar else st
     
+    # Options come from the cube, so a stored dataset's rows aren't read here
+    filter_options = SalesDataProcessor.filter_options(data_dict)
+    
     # Region filter
-    available_regions = sorted(data_dict['cleaned_data']['Region'].unique())
+    available_regions = filter_options['Region']
     selected_regions = widget_func.multiselect(
         "Select Regions",
         available_regions,
@@ -632,11 +588,9 @@ def create_filter_content(data_dict, use_sidebar=False):
     
     # Year filter (if available)
     selected_years = []
-    if 'Year' in data_dict['cleaned_data'].columns:
-        # Filter out NaN values and get unique years
-        valid_years = data_dict['cleaned_data']['Year'].dropna().unique()
-        if len(valid_years) > 0:
-            available_years = sorted([int(year) for year in valid_years])
+    if 'Year' in filter_options:
+        available_years = filter_options['Year']
+        if len(available_years) > 0:
             selected_years = widget_func.multiselect(
                 "Select Years",
                 available_years,
@@ -649,8 +603,8 @@ def create_filter_content(data_dict, use_sidebar=False):
     
     # Product filter (if available)
     selected_products = []
-    if 'Product_Category' in data_dict['cleaned_data'].columns:
-        available_products = sorted(data_dict['cleaned_data']['Product_Category'].unique())
+    if 'Product_Category' in filter_options:
+        available_products = filter_options['Product_Category']
         selected_products = widget_func.multiselect(
             "Select Product Categories",
             available_products,
@@ -697,25 +651,25 @@ def display_visualizations(visualizer, filtered_data_dict, data_dict, data_sourc
     st.markdown("---")
     
     # Show data transformation info if available
-    if data_source == "Paste CSV Data" and 'transformed_data' in data_dict:
+    if data_source == "Paste CSV Data" and 'transformed_preview' in data_dict:
         with st.expander("🔄 Data Transformation Summary", expanded=False):
             if device_type == "mobile":
                 # Mobile layout - single column
                 st.markdown("**Original Data Preview:**")
-                st.write(data_dict['raw_data'].head(3))
+                st.write(data_dict['raw_preview'].head(3))
                 st.markdown("**Transformed Data Preview:**")
-                st.write(data_dict['transformed_data'].head(3))
+                st.write(data_dict['transformed_preview'].head(3))
             else:
                 # Desktop layout - two columns
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.markdown("**Original Data Preview:**")
-                    st.write(data_dict['raw_data'].head(3))
+                    st.write(data_dict['raw_preview'].head(3))
                 
                 with col2:
                     st.markdown("**Transformed Data Preview:**")
-                    st.write(data_dict['transformed_data'].head(3))
+                    st.write(data_dict['transformed_preview'].head(3))
             
             st.info("🔄 Data was automatically transformed to match dashboard requirements!")
     
@@ -817,6 +771,9 @@ def display_visualizations(visualizer, filtered_data_dict, data_dict, data_sourc
     # Data table
     with st.expander("📋 View Raw Data", expanded=False):
         st.dataframe(filtered_data_dict['cleaned_data'], use_container_width=True)
+        if data_dict.get('skipped_columns'):
+            st.caption(f"Columns the dashboard doesn't use are not loaded: {', '.join(map(str, data_dict['skipped_columns']))}. "
+                       "Set PRUNE_COLUMNS_ON_LOAD = False in config.py to include them.")
 
     # Add developer footer
     st.markdown("---")
@@ -5,6 +5,7 @@ import plotly.graph_objects as go
 import pandas as pd
 import dash_bootstrap_components as dbc
 from data_processor import SalesDataProcessor, create_sample_data
+from pipeline_cache import FILTER_CACHE_MAX_ENTRIES, PipelineCache
 from visualizations import SalesVisualizer
 import os
 
@@ -24,7 +25,11 @@ if not os.path.exists(sample_data_path):
     sample_data.to_csv(sample_data_path, index=False)
 
 # Process data
-data_dict = processor.process_full_pipeline(sample_data_path)
+data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
+filter_options = processor.filter_options(data_dict)
+
+# Rendered callback outputs per filter selection
+output_cache = PipelineCache(max_entries=FILTER_CACHE_MAX_ENTRIES)
 
 # App layout
 app.layout = dbc.Container([
@@ -50,8 +55,8 @@ app.layout = dbc.Container([
                     dcc.Dropdown(
                         id='region-dropdown',
                         options=[{'label': region, 'value': region} 
-                                for region in sorted(data_dict['cleaned_data']['Region'].unique())],
-                        value=sorted(data_dict['cleaned_data']['Region'].unique()),
+                                for region in filter_options['Region']],
+                        value=filter_options['Region'],
                         multi=True,
                         className="mb-3"
                     ),
@@ -61,8 +66,8 @@ app.layout = dbc.Container([
                     dcc.Dropdown(
                         id='year-dropdown',
                         options=[{'label': str(year), 'value': year} 
-                                for year in sorted(data_dict['cleaned_data']['Year'].unique())],
-                        value=sorted(data_dict['cleaned_data']['Year'].unique()),
+                                for year in filter_options.get('Year', [])],
+                        value=filter_options.get('Year', []),
                         multi=True,
                         className="mb-3"
                     ),
@@ -72,8 +77,8 @@ app.layout = dbc.Container([
                     dcc.Dropdown(
                         id='product-dropdown',
                         options=[{'label': product, 'value': product} 
-                                for product in sorted(data_dict['cleaned_data']['Product_Category'].unique())],
-                        value=sorted(data_dict['cleaned_data']['Product_Category'].unique()),
+                                for product in filter_options.get('Product_Category', [])],
+                        value=filter_options.get('Product_Category', []),
                         multi=True
                     )
                 ])
@@ -172,32 +177,32 @@ def format_number(num):
      Input('product-dropdown', 'value')]
 )
 def update_dashboard(selected_regions, selected_years, selected_products):
-    # Filter data
-    filtered_data = data_dict['cleaned_data'][
-        (data_dict['cleaned_data']['Region'].isin(selected_regions)) &
-        (data_dict['cleaned_data']['Year'].isin(selected_years)) &
-        (data_dict['cleaned_data']['Product_Category'].isin(selected_products))
-    ]
+    # Revisiting an earlier selection reuses its rendered outputs
+    key = processor.filter_cache_key(
+        data_dict['fingerprint'], selected_regions, selected_years, selected_products
+    )
+    return output_cache.get_or_compute(
+        key, lambda: render_dashboard(selected_regions, selected_years, selected_products)
+    )
+
+def render_dashboard(selected_regions, selected_years, selected_products):
+    # Filter the pre-aggregated cube and derive the aggregations from it
+    filtered_data_dict = processor.query_cube(
+        data_dict['cube'], selected_regions, selected_years, selected_products
+    )
     
-    if filtered_data.empty:
+    if filtered_data_dict['cube'].empty:
         # Return empty components
         empty_fig = go.Figure()
         empty_fig.add_annotation(text="No data matches the selected filters", 
                                xref="paper", yref="paper", x=0.5, y=0.5)
         return [], empty_fig, empty_fig, empty_fig, empty_fig, [], []
     
-    # Recalculate aggregations
-    filtered_continent_data = processor.aggregate_by_continent(filtered_data)
-    filtered_country_data = processor.aggregate_by_country(filtered_data)
-    filtered_growth_data = processor.calculate_growth_trends(filtered_data)
+    filtered_continent_data = filtered_data_dict['continent_data']
+    filtered_country_data = filtered_data_dict['country_data']
+    filtered_growth_data = filtered_data_dict['growth_trends']
     
     # Calculate KPIs
-    filtered_data_dict = {
-        'cleaned_data': filtered_data,
-        'continent_data': filtered_continent_data,
-        'country_data': filtered_country_data,
-        'growth_trends': filtered_growth_data
-    }
     kpis = visualizer.create_kpi_cards(filtered_data_dict)
     
     # Create KPI cards
@@ -1743,70 +1743,35 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
     
     # Data processing
     if data_source == "Upload File" and uploaded_file is not None:
-        # Process uploaded file
-        temp_file = f"temp_{uploaded_file.name}"
-        with open(temp_file, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
+        # Process uploaded file straight from the upload buffer
         try:
-            data_dict = processor.process_full_pipeline(temp_file)
+            data_dict = processor.process_upload(uploaded_file, uploaded_file.name, lean=True)
             st.success("✅ Data uploaded and processed successfully!")
         except Exception as e:
             st.error(f"❌ Error processing file: {str(e)}")
-            data_dict = processor.process_full_pipeline(sample_data_path)
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
     
     elif data_source == "Paste CSV Data" and csv_text:
         # Process pasted CSV data with auto-transformation
         try:
-            import pandas as pd
-            import io
-            
-            # Create DataFrame from pasted CSV text
-            csv_data = pd.read_csv(io.StringIO(csv_text))
+            # Run the cached pipeline on the pasted CSV text
+            data_dict = processor.process_csv_text(csv_text, lean=True)
+            csv_preview = data_dict['raw_preview']
+            cleaned_data = data_dict['cleaned_data']
             
             # Show original data preview
-            st.info(f"📋 {len(csv_data)} rows loaded with columns: {', '.join(csv_data.columns)}")
-            
-            # Auto-transform the data to required format
-            transformed_data = processor.auto_transform_data(csv_data)
-            
-            # Clean and process the transformed data
-            cleaned_data = processor.clean_data(transformed_data)
-            
-            # Create aggregations
-            continent_data = processor.aggregate_by_continent(cleaned_data)
-            country_data = processor.aggregate_by_country(cleaned_data)
-            growth_trends = processor.calculate_growth_trends(cleaned_data)
-            
-            # Get top performers
-            top_countries = processor.get_top_performers(country_data, 'Total_Sales', 15)
-            top_regions = processor.get_top_performers(continent_data, 'Total_Sales', 10)
-            
-            data_dict = {
-                'raw_data': csv_data,
-                'transformed_data': transformed_data,
-                'cleaned_data': cleaned_data,
-                'continent_data': continent_data,
-                'country_data': country_data,
-                'growth_trends': growth_trends,
-                'top_countries': top_countries,
-                'top_regions': top_regions
-            }
+            st.info(f"📋 {data_dict['raw_rows']} rows loaded with columns: {', '.join(csv_preview.columns)}")
             
             st.success(f"✅ CSV data auto-transformed and processed! {len(cleaned_data)} records ready for analysis.")
                 
         except Exception as e:
             st.error(f"❌ Error processing CSV data: {str(e)}")
             st.info("💡 The system will auto-transform column names and data formats. Any raw data format should work!")
-            data_dict = processor.process_full_pipeline(sample_data_path)
+            data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
     
     else:
         # Use sample data
-        data_dict = processor.process_full_pipeline(sample_data_path)
+        data_dict = processor.process_full_pipeline(sample_data_path, lean=True)
         if data_source == "Use Sample Data":
             st.info("📋 Using sample data. Upload your own file or paste CSV data to analyze real data.")
     
@@ -1838,12 +1803,15 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
     
     # Filters that automatically adapt to screen size
     with st.expander("🔍 Filter Data", expanded=False):
+        # Options come from the cube, so a stored dataset's rows aren't read here
+        filter_options = processor.filter_options(data_dict)
+        
         # Mobile: vertical layout, Desktop: horizontal layout
         col1, col2, col3 = st.columns([1, 1, 1])
         
         with col1:
             # Region filter
-            available_regions = sorted(data_dict['cleaned_data']['Region'].unique())
+            available_regions = filter_options['Region']
             selected_regions = st.multiselect(
                 "Select Regions",
                 available_regions,
@@ -1852,8 +1820,8 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
         
         with col2:
             # Year filter (if available)
-            if 'Year' in data_dict['cleaned_data'].columns:
-                available_years = sorted(data_dict['cleaned_data']['Year'].unique())
+            if 'Year' in filter_options:
+                available_years = filter_options['Year']
                 selected_years = st.multiselect(
                     "Select Years",
                     available_years,
@@ -1864,8 +1832,8 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
         
         with col3:
             # Product filter (if available)
-            if 'Product_Category' in data_dict['cleaned_data'].columns:
-                available_products = sorted(data_dict['cleaned_data']['Product_Category'].unique())
+            if 'Product_Category' in filter_options:
+                available_products = filter_options['Product_Category']
                 selected_products = st.multiselect(
                     "Select Product Categories",
                     available_products,
@@ -1874,26 +1842,14 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
             else:
                 selected_products = []
     
-    # Apply filters
-    filtered_data = data_dict['cleaned_data'][data_dict['cleaned_data']['Region'].isin(selected_regions)]
-    
-    if 'Year' in data_dict['cleaned_data'].columns and selected_years:
-        filtered_data = filtered_data[filtered_data['Year'].isin(selected_years)]
-    
-    if 'Product_Category' in data_dict['cleaned_data'].columns and selected_products:
-        filtered_data = filtered_data[filtered_data['Product_Category'].isin(selected_products)]
-    
-    # Recalculate aggregations with filtered data
-    filtered_continent_data = processor.aggregate_by_continent(filtered_data)
-    filtered_country_data = processor.aggregate_by_country(filtered_data)
-    filtered_growth_data = processor.calculate_growth_trends(filtered_data)
-    
-    filtered_data_dict = {
-        'cleaned_data': filtered_data,
-        'continent_data': filtered_continent_data,
-        'country_data': filtered_country_data,
-        'growth_trends': filtered_growth_data
-    }
+    # Filtered rows come from the bitmap index and aggregates from the cube;
+    # results are memoized per selection, so revisiting one is instant
+    filtered_data_dict = processor.filter_results(
+        data_dict,
+        regions=selected_regions,
+        years=selected_years or None,
+        products=selected_products or None
+    )
     
     # Generate KPIs
     kpis = visualizer.create_kpi_cards(filtered_data_dict)
@@ -2106,19 +2062,19 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Show data transformation info if available
-    if data_source == "Paste CSV Data" and 'transformed_data' in data_dict:
+    if data_source == "Paste CSV Data" and 'transformed_preview' in data_dict:
         with st.expander("🔄 Data Transformation Summary", expanded=False):
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("**📊 Original Data:**")
-                st.write(data_dict['raw_data'].head())
-                st.write(f"Original columns: {', '.join(data_dict['raw_data'].columns)}")
+                st.write(data_dict['raw_preview'].head())
+                st.write(f"Original columns: {', '.join(data_dict['raw_preview'].columns)}")
             
             with col2:
                 st.markdown("**✅ Transformed Data:**")
-                st.write(data_dict['transformed_data'].head())
-                st.write(f"Mapped columns: {', '.join(data_dict['transformed_data'].columns)}")
+                st.write(data_dict['transformed_preview'].head())
+                st.write(f"Mapped columns: {', '.join(data_dict['transformed_preview'].columns)}")
         
         st.markdown("---")
     
@@ -2157,7 +2113,7 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
     # Handle mobile selectbox navigation
     if chart_option == "🌍 World Map":
         st.subheader("🌍 Global Sales Distribution")
-        world_map = visualizer.create_world_map(filtered_country_data, device_type='responsive')
+        world_map = visualizer.create_world_map(filtered_data_dict['country_data'], device_type='responsive')
         st.plotly_chart(world_map, use_container_width=True, key="chart_selection_world_map")
     
     elif chart_option == "📊 Regional Analysis":
@@ -2167,17 +2123,17 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
         col1, col2 = st.columns([1, 1])
         
         with col1:
-            bar_chart = visualizer.create_continent_bar_chart(filtered_continent_data, device_type='responsive')
+            bar_chart = visualizer.create_continent_bar_chart(filtered_data_dict['continent_data'], device_type='responsive')
             st.plotly_chart(bar_chart, use_container_width=True, key="chart_selection_bar")
         
         with col2:
-            pie_chart = visualizer.create_sales_distribution_pie(filtered_continent_data, device_type='responsive')
+            pie_chart = visualizer.create_sales_distribution_pie(filtered_data_dict['continent_data'], device_type='responsive')
             st.plotly_chart(pie_chart, use_container_width=True, key="chart_selection_pie")
     
     elif chart_option == "📈 Growth Trends":
-        if len(filtered_growth_data) > 0:
+        if len(filtered_data_dict['growth_trends']) > 0:
             st.subheader("📈 Growth Trends")
-            growth_chart = visualizer.create_growth_trend_chart(filtered_growth_data, device_type='responsive')
+            growth_chart = visualizer.create_growth_trend_chart(filtered_data_dict['growth_trends'], device_type='responsive')
             st.plotly_chart(growth_chart, use_container_width=True, key="chart_selection_growth")
         else:
             st.info("📊 Growth trend data not available with current filters.")
@@ -2189,7 +2145,7 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
         
         with col1:
             top_countries_chart = visualizer.create_top_performers_chart(
-                filtered_country_data, 
+                filtered_data_dict['country_data'], 
                 metric='Total_Sales', 
                 title="Top 10 Countries by Sales",
                 device_type='responsive'
@@ -2197,7 +2153,7 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
             st.plotly_chart(top_countries_chart, use_container_width=True, key="chart_selection_top_countries")
         
         with col2:
-            profit_scatter = visualizer.create_profit_vs_sales_scatter(filtered_country_data, device_type='responsive')
+            profit_scatter = visualizer.create_profit_vs_sales_scatter(filtered_data_dict['country_data'], device_type='responsive')
             st.plotly_chart(profit_scatter, use_container_width=True, key="chart_selection_profit_scatter")
     
     st.markdown('</div>', unsafe_allow_html=True)  # Close mobile div
@@ -2208,7 +2164,7 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
     
     with tab1:
         st.subheader("🌍 Global Sales Distribution")
-        world_map = visualizer.create_world_map(filtered_country_data, device_type='responsive')
+        world_map = visualizer.create_world_map(filtered_data_dict['country_data'], device_type='responsive')
         st.plotly_chart(world_map, use_container_width=True, key="tab_world_map")
     
     with tab2:
@@ -2217,17 +2173,17 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
         col1, col2 = st.columns(2)
         
         with col1:
-            bar_chart = visualizer.create_continent_bar_chart(filtered_continent_data, device_type='responsive')
+            bar_chart = visualizer.create_continent_bar_chart(filtered_data_dict['continent_data'], device_type='responsive')
             st.plotly_chart(bar_chart, use_container_width=True, key="tab_bar_chart")
         
         with col2:
-            pie_chart = visualizer.create_sales_distribution_pie(filtered_continent_data, device_type='responsive')
+            pie_chart = visualizer.create_sales_distribution_pie(filtered_data_dict['continent_data'], device_type='responsive')
             st.plotly_chart(pie_chart, use_container_width=True, key="tab_pie_chart")
     
     with tab3:
-        if len(filtered_growth_data) > 0:
+        if len(filtered_data_dict['growth_trends']) > 0:
             st.subheader("📈 Growth Trends")
-            growth_chart = visualizer.create_growth_trend_chart(filtered_growth_data, device_type='responsive')
+            growth_chart = visualizer.create_growth_trend_chart(filtered_data_dict['growth_trends'], device_type='responsive')
             st.plotly_chart(growth_chart, use_container_width=True, key="tab_growth_chart")
         else:
             st.info("📊 Growth trend data not available with current filters.")
@@ -2239,7 +2195,7 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
         
         with col1:
             top_countries_chart = visualizer.create_top_performers_chart(
-                filtered_country_data, 
+                filtered_data_dict['country_data'], 
                 metric='Total_Sales', 
                 title="Top 10 Countries by Sales",
                 device_type='responsive'
@@ -2247,14 +2203,17 @@ def display_dashboard_content(processor, visualizer, sample_data_path, data_sour
             st.plotly_chart(top_countries_chart, use_container_width=True, key="tab_top_countries")
         
         with col2:
-            profit_scatter = visualizer.create_profit_vs_sales_scatter(filtered_country_data, device_type='responsive')
+            profit_scatter = visualizer.create_profit_vs_sales_scatter(filtered_data_dict['country_data'], device_type='responsive')
             st.plotly_chart(profit_scatter, use_container_width=True, key="tab_profit_scatter")
     
     st.markdown('</div>', unsafe_allow_html=True)  # Close desktop div
     
     # Data table (visible on all devices)
     with st.expander("📋 View Data Table", expanded=False):
-        st.dataframe(filtered_data, use_container_width=True)
+        st.dataframe(filtered_data_dict['cleaned_data'], use_container_width=True)
+        if data_dict.get('skipped_columns'):
+            st.caption(f"Columns the dashboard doesn't use are not loaded: {', '.join(map(str, data_dict['skipped_columns']))}. "
+                       "Set PRUNE_COLUMNS_ON_LOAD = False in config.py to include them.")
     
     # Footer section with enhanced design
     st.markdown("---")
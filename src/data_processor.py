@@ -1,27 +1,349 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import logging
+import glob
+import io
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+
+from pandas.tseries.api import guess_datetime_format
+
+from compute_backend import get_backend
+from dataset_store import DatasetStore
+from filter_index import FILTER_DIMENSIONS, FilterIndex
+from instrumentation import PipelineProfiler
+from pipeline_result import PipelineResult
+from transform_plan import (COUNTRY_NAME_FIXES, COUNTRY_TO_REGION, TECH_CATEGORY_KEYWORDS, compile_transform_plan,
+                            plan_load_columns, plan_matches, schema_fingerprint)
+from pipeline_cache import (FILTER_CACHE_MAX_ENTRIES, HASH_CHUNK_SIZE, PipelineCache, hash_bytes, hash_file,
+                            read_sidecar, read_sidecar_header, write_sidecar)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared across processor instances so Streamlit reruns (which build a new
+# processor each time) can reuse results for unchanged input
+pipeline_cache = PipelineCache()
+
+# Filtered aggregates per (dataset fingerprint, selection), so flipping back to
+# an earlier filter combination in the dashboards is a cache hit
+filter_cache = PipelineCache(max_entries=FILTER_CACHE_MAX_ENTRIES)
+
+# Compiled auto_transform_data plans per schema fingerprint, and the date
+# format inferred per (date scope, schema fingerprint, column); see
+# SalesDataProcessor.date_scope
+TRANSFORM_PLAN_CACHE_ENTRIES = 128
+transform_plan_cache = PipelineCache(max_entries=TRANSFORM_PLAN_CACHE_ENTRIES)
+date_format_cache = PipelineCache(max_entries=TRANSFORM_PLAN_CACHE_ENTRIES)
+
+# Cube and append signature of the last processed version of each file for
+# process_incremental_pipeline; entries don't expire, since a file may only
+# grow once a day
+INGEST_STATE_ENTRIES = 64
+ingest_state_cache = PipelineCache(ttl=float('inf'), max_entries=INGEST_STATE_ENTRIES)
+
+# Cache keys a background thread is writing to the dataset store, so
+# concurrent cache misses on the same data save it once
+storing_keys = set()
+storing_lock = threading.Lock()
+
+try:
+    from config import DATASET_STORE_PATH, PRUNE_COLUMNS_ON_LOAD
+except ImportError:
+    # config.py lives at the project root, which is not always on sys.path
+    DATASET_STORE_PATH = None
+    PRUNE_COLUMNS_ON_LOAD = True
+
+# Dtypes declared when loading the raw sources of these standard columns with
+# pruning on. Money columns are left out: they may hold text like "$1.5K" and
+# parse_amount_series makes them float64, as float32 would lose cents on large
+# totals. Year is left out too: the nullable Int16 that blank years need
+# parses slower than inferring int64/float64, for a few MB saved.
+LOAD_DTYPES = {'Country': 'category', 'Region': 'category', 'Product_Category': 'category'}
+
+# Unparseable date values quoted in the warning logged for a column
+DATE_FAILURE_EXAMPLES = 5
+
+# Rows per chunk for process_streaming_pipeline
+STREAMING_CHUNK_SIZE = 100_000
+
+# File extensions process_directory_pipeline picks up from a directory
+INGEST_EXTENSIONS = ('csv', 'xlsx', 'xls')
+
+# Rows kept in raw_preview/transformed_preview, which survive lean mode
+PREVIEW_ROWS = 5
+
+# Frames lean mode releases after processing; they are recomputed if requested
+LEAN_DROPPED_FRAMES = ['raw_data', 'transformed_data']
+
+# Loads the raw data of a pipeline run with the processor it is given. Cached
+# results keep their loader to recompute dropped frames, so it must not
+# capture the processor that ran the pipeline
+RawLoader = Callable[['SalesDataProcessor'], pd.DataFrame]
+
+# Pipeline results computed on first access, grouped by the profiler stage
+# that reports them when profiling forces them to be computed eagerly
+PROFILED_AGGREGATE_STAGES = {
+    'aggregate': ['continent_data', 'country_data'],
+    'growth': ['growth_trends'],
+    'top_n': ['top_countries', 'top_regions'],
+    'cube': ['cube'],
+    'filter_index': ['filter_index']
+}
+LAZY_AGGREGATES = [key for keys in PROFILED_AGGREGATE_STAGES.values() for key in keys]
+
+# Dimensions the dashboards filter and group by, pre-aggregated by build_cube
+CUBE_DIMENSIONS = ['Region', 'Country', 'Year', 'Product_Category']
+
+# Text dimensions stored as categoricals from clean_data onwards, and whether
+# clean_data title-cases and strips their values
+DIMENSION_COLUMNS = {'Country': True, 'Region': True, 'Product_Category': False}
+
+# Period columns calculate_growth_trends can derive from a Date column
+PERIOD_FREQUENCIES = {'Quarter': 'Q', 'Month': 'M'}
+
+
+AMOUNT_MULTIPLIERS = {'K': 1e3, 'M': 1e6, 'B': 1e9}
+CURRENCY_PATTERN = r'[$€£¥₹,]'
+
+def parse_amount_series(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of money amounts into floats without a per-row Python call.
+    
+    Currency symbols and thousands separators are stripped and K/M/B suffixes
+    are expanded, so "$1.5K" becomes 1500.0. Missing or unparseable values
+    become 0.
+    
+    Args:
+        values (pd.Series): Raw amounts, numeric or text
+        
+    Returns:
+        pd.Series: Parsed amounts as float64
+    """
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.astype('float64').fillna(0)
+    
+    text = values.astype(str).str.replace(CURRENCY_PATTERN, '', regex=True).str.strip().str.upper()
+    
+    # Split off a trailing K/M/B suffix and look up its multiplier
+    multipliers = text.str[-1:].map(AMOUNT_MULTIPLIERS)
+    has_suffix = multipliers.notna()
+    number_text = text.where(~has_suffix, text.str[:-1].str.strip())
+    
+    try:
+        # Clean columns take the fast cast; anything unparseable falls back to coercion
+        numbers = number_text.astype('float64')
+    except (ValueError, TypeError):
+        numbers = pd.to_numeric(number_text, errors='coerce')
+    
+    return (numbers * multipliers.fillna(1.0)).astype('float64').fillna(0)
+
+def parse_date_series(values: pd.Series, date_format: Optional[str] = None,
+                      errors: str = 'coerce') -> Tuple[pd.Series, Optional[str]]:
+    """
+    Parse a column of dates, converting each distinct value only once.
+    
+    Transactional files repeat the same few hundred dates across many rows, so
+    parsing the unique values and mapping them back avoids most of the work.
+    As with pd.to_datetime, the format is inferred from the first non-null
+    value; a known ``date_format`` skips the inference as long as it fits that
+    value.
+    
+    Args:
+        values (pd.Series): Raw date values
+        date_format (Optional[str]): Previously inferred strptime format to try first
+        errors (str): 'coerce' turns unparseable values into NaT, 'raise' raises
+        
+    Returns:
+        Tuple[pd.Series, Optional[str]]: Parsed dates and the format used (None if
+            values had to be parsed one by one)
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values, date_format
+    
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Index(uniques)
+    
+    if len(uniques) > 0 and isinstance(uniques[0], str):
+        first = uniques[:1]
+        if date_format is None or pd.to_datetime(first, format=date_format, errors='coerce').isna().any():
+            date_format = guess_datetime_format(uniques[0])
+    else:
+        date_format = None
+    
+    parsed = pd.DatetimeIndex(pd.to_datetime(uniques, format=date_format, errors=errors))
+    dates = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
+    
+    return pd.Series(dates, index=values.index, name=values.name), date_format
+
+def encode_dimension(values: pd.Series, normalize: bool = True,
+                     replacements: Optional[Dict[str, str]] = None) -> pd.Series:
+    """
+    Dictionary-encode a text dimension as a categorical with sorted categories.
+    
+    Normalization (title case, surrounding whitespace stripped) and
+    replacements run on the distinct values only, and values that end up
+    equal share one category. Sorted categories keep codes stable for a given
+    set of values, so groupby output order matches plain strings. Missing
+    values stay missing.
+    
+    Args:
+        values (pd.Series): Raw dimension values
+        normalize (bool): Whether to title-case and strip the values
+        replacements (Optional[Dict[str, str]]): Whole-value fixes applied after normalization
+        
+    Returns:
+        pd.Series: Categorical series with the same index and name
+    """
+    codes, uniques = pd.factorize(values)
+    labels = pd.Index(uniques)
+    if isinstance(labels, pd.CategoricalIndex):
+        labels = labels.astype(labels.categories.dtype)
+    
+    if normalize:
+        labels = labels.astype(str).str.title().str.strip()
+    if replacements:
+        labels = labels.map(lambda label: replacements.get(label, label))
+    
+    merged_codes, categories = pd.factorize(labels, sort=True)
+    new_codes = np.full(len(codes), -1, dtype=merged_codes.dtype)
+    valid = codes >= 0
+    new_codes[valid] = merged_codes[codes[valid]]
+    
+    return pd.Series(pd.Categorical.from_codes(new_codes, categories=categories),
+                     index=values.index, name=values.name)
+
+@lru_cache(maxsize=64)
+def classify_tech_columns(columns: Tuple[str, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Group columns by the tech product category they measure.
+    
+    A column belongs to the first category whose keyword appears in its name.
+    The result only depends on the header, so it is cached per schema.
+    
+    Args:
+        columns (Tuple[str, ...]): Column names of the dataset
+        
+    Returns:
+        Tuple[Tuple[str, ...], ...]: Column names per category, in TECH_CATEGORY_KEYWORDS order
+    """
+    groups = {category: [] for category in TECH_CATEGORY_KEYWORDS}
+    for col in columns:
+        for category, keyword in TECH_CATEGORY_KEYWORDS.items():
+            if keyword in str(col).lower():
+                groups[category].append(col)
+                break
+    return tuple(tuple(cols) for cols in groups.values())
+
+def infer_tech_categories(data: pd.DataFrame) -> pd.Series:
+    """
+    Assign each row the tech product category with the highest summed metrics.
+    
+    Negative and missing values don't count. Rows without any positive metric
+    are labelled 'Tech Gadgets'.
+    
+    Args:
+        data (pd.DataFrame): Tech dataset with per-product metric columns
+        
+    Returns:
+        pd.Series: Product category per row
+    """
+    column_groups = classify_tech_columns(tuple(data.columns))
+    scores = np.zeros((len(data), len(column_groups)))
+    
+    for i, cols in enumerate(column_groups):
+        for col in cols:
+            values = pd.to_numeric(data[col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            scores[:, i] += np.where(values > 0, values, 0)
+    
+    categories = np.array(list(TECH_CATEGORY_KEYWORDS), dtype=object)
+    best = categories[scores.argmax(axis=1)]
+    return pd.Series(np.where(scores.max(axis=1) > 0, best, 'Tech Gadgets'), index=data.index)
+
+# Tech industry profit margins by product category
+TECH_PROFIT_MARGINS = {
+    'Smartphones': 0.25,
+    'Laptops': 0.15,
+    'Gaming Consoles': 0.10,
+    'Smartwatches': 0.30
+}
+DEFAULT_TECH_MARGIN = 0.20
+
 class SalesDataProcessor:
     """
     A class to handle sales data processing and preparation for dashboard visualization.
+    
+    CSV parsing and the grouped sums behind the rollup, cube and streaming
+    aggregates run on a pluggable compute backend (see compute_backend);
+    ``backend`` picks 'pandas', 'polars', 'duckdb' or 'auto', and None uses
+    config.COMPUTE_BACKEND. Engines that are not installed fall back to pandas.
+    
+    With ``prune_columns`` (None uses config.PRUNE_COLUMNS_ON_LOAD) files are
+    loaded in two phases: the header is read first to compile the transform
+    plan, then only the columns the pipeline uses are parsed, with LOAD_DTYPES
+    declared up front.
+    
+    With a ``store`` (None opens config.DATASET_STORE_PATH if set) cached
+    pipeline results are also persisted in SQLite and shared across processes;
+    see dataset_store.DatasetStore.
     """
     
-    def __init__(self):
+    def __init__(self, profit_margins: Optional[Dict[str, float]] = None,
+                 default_margin: float = DEFAULT_TECH_MARGIN, profile: Optional[bool] = None,
+                 backend: Optional[str] = None, prune_columns: Optional[bool] = None,
+                 store: Optional[DatasetStore] = None):
         self.data = None
+        self.backend = get_backend(backend)
+        self.prune_columns = PRUNE_COLUMNS_ON_LOAD if prune_columns is None else prune_columns
+        if store is None and DATASET_STORE_PATH:
+            store = DatasetStore(DATASET_STORE_PATH)
+        self.store = store
+        # Column -> number of rows and example values that failed to parse as dates
+        self.date_parse_failures: Dict[str, Dict] = {}
+        # Source columns the last load skipped because the pipeline doesn't use them
+        self.skipped_columns: List[str] = []
+        # Identifies the data being processed while a pipeline runs (e.g. its
+        # content hash), so a date format inferred from one frame is only reused
+        # for frames of the same data, such as later chunks of the same file.
+        # None infers the format for every frame, as pd.to_datetime does
+        self.date_scope: Optional[str] = None
         self.processed_data = None
+        # None defers to the SALES_DASHBOARD_PROFILE environment variable
+        self.profile = profile
+        self.profit_margins = dict(TECH_PROFIT_MARGINS if profit_margins is None else profit_margins)
+        self.default_margin = default_margin
+    
+    def get_profit_margins(self, categories: pd.Series) -> pd.Series:
+        """
+        Look up the profit margin for each product category.
+        
+        Args:
+            categories (pd.Series): Product category per row
+            
+        Returns:
+            pd.Series: Margin per row, using the default margin for unknown categories
+        """
+        return categories.map(self.profit_margins).astype('float64').fillna(self.default_margin)
         
-    def load_data(self, file_path: str) -> pd.DataFrame:
+    def load_data(self, file_path: str, use_sidecar: bool = True) -> pd.DataFrame:
         """
         Load sales data from various file formats.
         
+        After the first parse a columnar sidecar is written next to the file
+        (see pipeline_cache.write_sidecar) and later loads of the unchanged
+        file memory-map it instead of re-parsing CSV or Excel.
+        
         Args:
             file_path (str): Path to the data file
+            use_sidecar (bool): Whether to read and write the columnar sidecar
             
         Returns:
             pd.DataFrame: Loaded data
@@ -29,12 +351,26 @@ class SalesDataProcessor:
         try:
             file_extension = file_path.split('.')[-1].lower()
             
-            if file_extension == 'csv':
-                self.data = pd.read_csv(file_path)
-            elif file_extension in ['xlsx', 'xls']:
-                self.data = pd.read_excel(file_path)
-            else:
+            if file_extension not in ['csv', 'xlsx', 'xls']:
                 raise ValueError(f"Unsupported file format: {file_extension}")
+            
+            # The sidecar records the source header, so a warm load picks its
+            # columns without reopening the source (a whole workbook for Excel)
+            header = read_sidecar_header(file_path) if use_sidecar else None
+            if header is not None:
+                usecols, _ = self._load_schema(header)
+                sidecar_data = read_sidecar(file_path, usecols)
+                if sidecar_data is not None:
+                    self.data = sidecar_data
+                    logger.info(f"Loaded data from sidecar with shape: {self.data.shape}")
+                    return self.data
+            
+            header = self._read_header(file_path, file_extension)
+            usecols, dtypes = self._load_schema(header)
+            self.data = self._read_source(file_path, file_extension, usecols, dtypes)
+            
+            if use_sidecar:
+                write_sidecar(file_path, self.data, complete=usecols is None, header=header)
                 
             logger.info(f"Successfully loaded data with shape: {self.data.shape}")
             return self.data
@@ -43,6 +379,117 @@ class SalesDataProcessor:
             logger.error(f"Error loading data: {str(e)}")
             raise
     
+    def load_buffer(self, content: bytes, file_name: str) -> pd.DataFrame:
+        """
+        Load sales data from an in-memory upload without writing it to disk.
+        
+        Args:
+            content (bytes): Raw file contents
+            file_name (str): File name or bare extension (e.g. 'sales.xlsx' or 'csv'),
+                used only to pick the format
+            
+        Returns:
+            pd.DataFrame: Loaded data
+        """
+        try:
+            file_extension = file_name.split('.')[-1].lower()
+            
+            if file_extension not in INGEST_EXTENSIONS:
+                raise ValueError(f"Unsupported file format: {file_extension}")
+            
+            # BytesIO shares a bytes object's memory instead of copying it
+            buffer = io.BytesIO(content)
+            usecols, dtypes = self._load_schema(self._read_header(buffer, file_extension))
+            self.data = self._read_source(buffer, file_extension, usecols, dtypes)
+            
+            logger.info(f"Successfully loaded uploaded data with shape: {self.data.shape}")
+            return self.data
+            
+        except Exception as e:
+            logger.error(f"Error loading uploaded data: {str(e)}")
+            raise
+    
+    def _read_header(self, source: Union[str, IO[bytes]], file_extension: str) -> Optional[List[str]]:
+        """
+        Sniff the column names of a file, if pruning needs them.
+        
+        Args:
+            source (Union[str, IO[bytes]]): File path or binary buffer, rewound afterwards
+            file_extension (str): 'csv', 'xlsx' or 'xls'
+            
+        Returns:
+            Optional[List[str]]: Column names, or None when pruning is off
+        """
+        if not self.prune_columns:
+            return None
+        
+        if file_extension == 'csv':
+            header = list(pd.read_csv(source, nrows=0).columns)
+        else:
+            header = list(pd.read_excel(source, nrows=0).columns)
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return header
+    
+    def _load_schema(self, header: Optional[List[str]]) -> Tuple[Optional[List[str]], Optional[Dict[str, str]]]:
+        """
+        Decide which columns of a file to parse and with which dtypes.
+        
+        The columns left out are recorded in ``skipped_columns``.
+        
+        Args:
+            header (Optional[List[str]]): Column names of the file
+            
+        Returns:
+            Tuple[Optional[List[str]], Optional[Dict[str, str]]]: Columns to read (None
+                for all) and declared dtypes, both None when pruning is off or the
+                header is unknown
+        """
+        self.skipped_columns = []
+        if not self.prune_columns or header is None:
+            return None, None
+        
+        plan = self.get_transform_plan(header)
+        load_columns = plan_load_columns(plan, header)
+        dtypes = {
+            col: LOAD_DTYPES[plan['renames'].get(col, col)]
+            for col in load_columns if plan['renames'].get(col, col) in LOAD_DTYPES
+        }
+        
+        if len(load_columns) < len(header):
+            self.skipped_columns = [col for col in header if col not in load_columns]
+            logger.info(f"Loading {len(load_columns)} of {len(header)} columns, skipping {self.skipped_columns}")
+            return load_columns, dtypes
+        return None, dtypes
+    
+    def _read_source(self, source: Union[str, IO[bytes]], file_extension: str,
+                     usecols: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """
+        Parse a CSV or Excel file, falling back to inferred dtypes if the declared ones don't fit.
+        
+        Args:
+            source (Union[str, IO[bytes]]): File path or binary buffer
+            file_extension (str): 'csv', 'xlsx' or 'xls'
+            usecols (Optional[List[str]]): Columns to read, or None for all
+            dtypes (Optional[Dict[str, str]]): Declared dtype per column
+            
+        Returns:
+            pd.DataFrame: Parsed data
+        """
+        read = self.backend.read_csv if file_extension == 'csv' else pd.read_excel
+        
+        try:
+            return read(source, usecols=usecols, dtype=dtypes or None)
+        except (ValueError, TypeError) as e:
+            if not dtypes:
+                raise
+            # e.g. a year column holding "FY2022"; clean_data copes with those values
+            logger.warning(f"Declared dtypes don't fit the data ({str(e)}); reading with inferred dtypes")
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            return read(source, usecols=usecols)
+    
     def validate_data(self, data: pd.DataFrame) -> bool:
         """
         Validate that the data has required columns.
@@ -61,330 +508,164 @@ class SalesDataProcessor:
             
         return True
     
-    def auto_transform_data(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _parse_dates(self, values: pd.Series, schema: str, errors: str = 'coerce') -> pd.Series:
+        """
+        Parse a date column with the format cached for its date scope, schema and column.
+        
+        Outside a date scope the format is inferred from this column's first
+        value, so files with the same header but different date conventions
+        (day-first vs month-first) are each parsed their own way.
+        
+        Rows whose value is present but can't be parsed are counted in
+        date_parse_failures and logged with a few example values.
+        
+        Args:
+            values (pd.Series): Raw date values
+            schema (str): Schema fingerprint of the frame the column belongs to
+            errors (str): 'coerce' or 'raise', as for pd.to_datetime
+            
+        Returns:
+            pd.Series: Parsed dates
+        """
+        if self.date_scope is None:
+            dates, _ = parse_date_series(values, errors=errors)
+        else:
+            key = (self.date_scope, schema, values.name)
+            dates, date_format = parse_date_series(values, date_format_cache.get(key), errors)
+            if date_format is not None:
+                date_format_cache.set(key, date_format)
+        
+        failed = dates.isna() & values.notna()
+        if failed.any():
+            examples = values[failed].unique()[:DATE_FAILURE_EXAMPLES].tolist()
+            self.date_parse_failures[values.name] = {'rows': int(failed.sum()), 'examples': examples}
+            logger.warning(f"{int(failed.sum())} rows in '{values.name}' could not be parsed as dates, "
+                           f"e.g. {examples}")
+        
+        return dates
+    
+    @contextmanager
+    def _date_scope(self, scope: Optional[str]) -> Iterator[None]:
+        """Share inferred date formats between the frames parsed inside the block."""
+        previous, self.date_scope = self.date_scope, scope
+        try:
+            yield
+        finally:
+            self.date_scope = previous
+    
+    def get_transform_plan(self, columns: List[str]) -> Dict:
+        """
+        Return the transform plan for a header, compiling it on first use.
+        
+        Plans are cached per schema fingerprint, so every file and chunk with
+        the same columns skips column detection entirely.
+        
+        Args:
+            columns (List[str]): Column names of the raw data
+            
+        Returns:
+            Dict: Transform plan (see transform_plan.compile_transform_plan)
+        """
+        return transform_plan_cache.get_or_compute(
+            schema_fingerprint(columns), lambda: compile_transform_plan(columns)
+        )
+    
+    def auto_transform_data(self, data: pd.DataFrame, plan: Optional[Dict] = None) -> pd.DataFrame:
         """
         Automatically transform raw data to match required format.
         
+        Column detection is compiled into a transform plan once per header and
+        replayed here; a plan saved earlier (it is JSON-serializable) can also
+        be passed in directly.
+        
         Args:
             data (pd.DataFrame): Raw data with potentially different column names
+            plan (Optional[Dict]): Transform plan to replay; compiled or fetched
+                from the plan cache when None or compiled for other columns
             
         Returns:
             pd.DataFrame: Transformed data with standardized columns
         """
         logger.info("Auto-transforming raw data to required format...")
-        transformed_data = data.copy()
-        
-        # Define column mapping patterns for auto-detection
-        column_mappings = {
-            'Country': ['country', 'nation', 'state', 'location', 'place', 'territory', 'country_name'],
-            'Region': ['region', 'continent', 'area', 'zone', 'territory', 'geography', 'geo_region'],
-            'Sales': [
-                'sales', 'revenue', 'income', 'turnover', 'amount', 'value', 'total_sales', 'gross_sales',
-                'average consumer spending on gadgets ($)', 'consumer spending', 'spending', 'gadget spending'
-            ],
-            'Profit': ['profit', 'margin', 'net_income', 'earnings', 'gain', 'net_profit', 'profit_amount'],
-            'Year': ['year', 'yr', 'fiscal_year', 'period', 'time_period'],
-            'Product_Category': ['product', 'category', 'item', 'product_type', 'item_category', 'product_name', 'goods'],
-            # Tech-specific mappings for your dataset
-            'Smartphone_Sales': ['smartphone sales (millions)', 'smartphone sales', 'phone sales'],
-            'Laptop_Shipments': ['laptop shipments (millions)', 'laptop shipments', 'laptop sales'],
-            'Gaming_Console_Adoption': ['gaming console adoption (%)', 'gaming adoption', 'console adoption'],
-            'Smartwatch_Penetration': ['smartwatch penetration (%)', 'smartwatch penetration', 'watch penetration'],
-            'E_Waste_Generated': ['e-waste generated (metric tons)', 'e-waste', 'electronic waste'],
-            'G5_Penetration': ['5g penetration rate (%)', '5g penetration', '5g rate']
-        }
+        if plan is None or not plan_matches(plan, data.columns):
+            plan = self.get_transform_plan(list(data.columns))
         
-        # Auto-detect and rename columns
-        for target_col, possible_names in column_mappings.items():
-            for col in transformed_data.columns:
-                if col.lower().strip() in [name.lower() for name in possible_names]:
-                    if target_col not in transformed_data.columns:
-                        transformed_data.rename(columns={col: target_col}, inplace=True)
-                        logger.info(f"Mapped '{col}' -> '{target_col}'")
-                        break
-        
-        # Handle special cases and data cleaning
-        if 'Country' in transformed_data.columns:
-            # Clean country names
-            transformed_data['Country'] = transformed_data['Country'].astype(str).str.title().str.strip()
-            
-            # Handle common country name variations
-            country_fixes = {
-                'Usa': 'United States',
-                'Us': 'United States',
-                'America': 'United States',
-                'Uk': 'United Kingdom',
-                'Britain': 'United Kingdom',
-                'Deutschland': 'Germany',
-                'Brasil': 'Brazil',
-                'Espana': 'Spain',
-                'Nippon': 'Japan'
-            }
-            
-            for old_name, new_name in country_fixes.items():
-                transformed_data['Country'] = transformed_data['Country'].replace(old_name, new_name)
-        
-        # Special handling for Global Tech Gadget Consumption dataset
-        if 'Average Consumer Spending On Gadgets ($)' in transformed_data.columns:
-            logger.info("Detected Global Tech Gadget Consumption dataset - applying specialized transformations")
-            
+        transformed_data = data.rename(columns=plan['renames'])
+        
+        if plan['encode_country']:
+            # Clean country names on the distinct values rather than every row
+            transformed_data['Country'] = encode_dimension(
+                transformed_data['Country'], replacements=COUNTRY_NAME_FIXES
+            )
+        
+        if plan['sales_from']:
             # Use consumer spending as primary sales metric
-            if 'Sales' not in transformed_data.columns:
-                transformed_data['Sales'] = transformed_data['Average Consumer Spending On Gadgets ($)']
-                logger.info("Mapped 'Average Consumer Spending on Gadgets ($)' -> 'Sales'")
-            
-            # Create comprehensive sales from multiple tech metrics
-            tech_sales_columns = []
-            for col in transformed_data.columns:
-                if any(keyword in col.lower() for keyword in ['smartphone sales', 'laptop shipments', 'consumer spending']):
-                    tech_sales_columns.append(col)
-            
-            if len(tech_sales_columns) > 1:
-                # Create aggregated tech sales (normalize different units)
-                normalized_sales = 0
-                for col in tech_sales_columns:
-                    if 'millions' in col.lower():
-                        # Convert millions to dollars (assume average price)
-                        if 'smartphone' in col.lower():
-                            normalized_sales += transformed_data[col] * 500  # $500 per smartphone
-                        elif 'laptop' in col.lower():
-                            normalized_sales += transformed_data[col] * 800  # $800 per laptop
-                    elif '$' in col or 'spending' in col.lower():
-                        normalized_sales += transformed_data[col]
-                
-                if 'Sales' not in transformed_data.columns:
-                    transformed_data['Sales'] = normalized_sales
-                    logger.info("Created aggregated Sales from multiple tech metrics")
-        
-        # Auto-generate Region if missing but Country exists
-        if 'Country' in transformed_data.columns and 'Region' not in transformed_data.columns:
-            logger.info("Auto-generating Region from Country data...")
-            
-            # Country to region mapping (enhanced for your dataset)
-            country_to_region = {
-                'United States': 'North America',
-                'USA': 'North America',
-                'Canada': 'North America',
-                'Mexico': 'North America',
-                'Brazil': 'South America',
-                'Argentina': 'South America',
-                'Chile': 'South America',
-                'Peru': 'South America',
-                'Colombia': 'South America',
-                'United Kingdom': 'Europe',
-                'UK': 'Europe',
-                'Germany': 'Europe',
-                'France': 'Europe',
-                'Italy': 'Europe',
-                'Spain': 'Europe',
-                'Netherlands': 'Europe',
-                'Sweden': 'Europe',
-                'Norway': 'Europe',
-                'Poland': 'Europe',
-                'Russia': 'Europe',
-                'China': 'Asia',
-                'Japan': 'Asia',
-                'India': 'Asia',
-                'South Korea': 'Asia',
-                'Thailand': 'Asia',
-                'Singapore': 'Asia',
-                'Malaysia': 'Asia',
-                'Indonesia': 'Asia',
-                'Philippines': 'Asia',
-                'Australia': 'Oceania',
-                'New Zealand': 'Oceania',
-                'South Africa': 'Africa',
-                'Nigeria': 'Africa',
-                'Egypt': 'Africa',
-                'Kenya': 'Africa',
-                'Morocco': 'Africa'
-            }
-            
-            transformed_data['Region'] = transformed_data['Country'].map(country_to_region)
+            transformed_data['Sales'] = transformed_data[plan['sales_from']]
+            logger.info(f"Mapped '{plan['sales_from']}' -> 'Sales'")
+        
+        if plan['derive_region']:
+            transformed_data['Region'] = transformed_data['Country'].map(COUNTRY_TO_REGION)
             
             # Fill missing regions with 'Other'
             transformed_data['Region'] = transformed_data['Region'].fillna('Other')
             logger.info(f"Generated regions for {transformed_data['Region'].notna().sum()} countries")
         
         # Handle sales amount conversions (remove currency symbols, convert K/M notation)
-        if 'Sales' in transformed_data.columns:
-            logger.info("Processing Sales data...")
-            sales_col = transformed_data['Sales'].astype(str)
-            
-            # Remove currency symbols
-            sales_col = sales_col.str.replace(r'[$€£¥₹,]', '', regex=True)
-            
-            # Handle K/M/B notation
-            def convert_amount(value):
-                if pd.isna(value) or value == '' or value.lower() == 'nan':
-                    return 0
-                
-                value = str(value).strip().upper()
-                
-                # Handle K, M, B notation
-                if value.endswith('K'):
-                    return float(value[:-1]) * 1000
-                elif value.endswith('M'):
-                    return float(value[:-1]) * 1000000
-                elif value.endswith('B'):
-                    return float(value[:-1]) * 1000000000
-                else:
-                    try:
-                        return float(value)
-                    except (ValueError, TypeError):
-                        return 0
-            
-            transformed_data['Sales'] = sales_col.apply(convert_amount)
+        for money_col in plan['money_columns']:
+            transformed_data[money_col] = parse_amount_series(transformed_data[money_col])
         
-        # Handle Profit column similarly
-        if 'Profit' in transformed_data.columns:
-            logger.info("Processing Profit data...")
-            profit_col = transformed_data['Profit'].astype(str)
-            profit_col = profit_col.str.replace(r'[$€£¥₹,]', '', regex=True)
-            
-            def convert_amount(value):
-                if pd.isna(value) or value == '' or value.lower() == 'nan':
-                    return 0
-                
-                value = str(value).strip().upper()
-                
-                if value.endswith('K'):
-                    return float(value[:-1]) * 1000
-                elif value.endswith('M'):
-                    return float(value[:-1]) * 1000000
-                elif value.endswith('B'):
-                    return float(value[:-1]) * 1000000000
-                else:
-                    try:
-                        return float(value)
-                    except (ValueError, TypeError):
-                        return 0
-            
-            transformed_data['Profit'] = profit_col.apply(convert_amount)
-        
-        # Handle Date/Year extraction
-        date_patterns = ['Date', 'date', 'Date_Time', 'datetime', 'timestamp', 'time']
-        for date_col in date_patterns:
-            if date_col in transformed_data.columns and 'Year' not in transformed_data.columns:
-                try:
-                    transformed_data['Year'] = pd.to_datetime(transformed_data[date_col]).dt.year
-                    logger.info(f"Extracted Year from {date_col}")
-                    break
-                except (ValueError, TypeError, pd.errors.ParserError):
-                    continue
+        # Parsing can fail per file, so the candidate date columns are tried in order
+        for date_col in plan['year_from_date']:
+            try:
+                dates = self._parse_dates(transformed_data[date_col], plan['schema'], errors='raise')
+                transformed_data['Year'] = dates.dt.year
+                logger.info(f"Extracted Year from {date_col}")
+                break
+            except (ValueError, TypeError, pd.errors.ParserError):
+                continue
         
-        # Ensure required columns exist
-        required_columns = ['Country', 'Region', 'Sales']
-        missing_required = [col for col in required_columns if col not in transformed_data.columns]
-        
-        if missing_required:
-            logger.warning(f"Still missing required columns after transformation: {missing_required}")
-            
-            # Create dummy data for missing required columns
-            if 'Country' not in transformed_data.columns:
-                transformed_data['Country'] = 'Unknown'
-            if 'Region' not in transformed_data.columns:
-                transformed_data['Region'] = 'Unknown'
-            if 'Sales' not in transformed_data.columns:
-                transformed_data['Sales'] = 0
-        
-        # Add optional columns if missing
-        if 'Profit' not in transformed_data.columns:
-            # Generate profit based on tech industry standards
-            if any('smartphone' in col.lower() or 'gadget' in col.lower() for col in transformed_data.columns):
-                logger.info("Generating tech industry profit margins")
-                
-                # Tech industry profit margins vary by product
-                profit_margins = []
-                for _, row in transformed_data.iterrows():
-                    if 'Product_Category' in transformed_data.columns:
-                        category = row.get('Product_Category', 'Tech Gadgets')
-                        if category == 'Smartphones':
-                            margin = 0.25  # 25% margin for smartphones
-                        elif category == 'Laptops':
-                            margin = 0.15  # 15% margin for laptops
-                        elif category == 'Gaming Consoles':
-                            margin = 0.10  # 10% margin for gaming consoles
-                        elif category == 'Smartwatches':
-                            margin = 0.30  # 30% margin for smartwatches
-                        else:
-                            margin = 0.20  # 20% default for tech gadgets
-                    else:
-                        margin = 0.20  # Default tech margin
-                    
-                    profit_margins.append(margin)
-                
-                transformed_data['Profit'] = transformed_data['Sales'] * profit_margins
-                logger.info("Generated Profit column with tech industry margins")
-            else:
-                # Estimate profit as 20% of sales for general products
-                transformed_data['Profit'] = transformed_data['Sales'] * 0.2
-                logger.info("Generated Profit column as 20% of Sales")
+        for col, default in plan['required_defaults'].items():
+            transformed_data[col] = default
+        if plan['required_defaults']:
+            logger.warning(f"Filled missing required columns: {list(plan['required_defaults'])}")
         
-        if 'Year' not in transformed_data.columns:
-            # Use current year
+        if plan['profit'] == 'tech_by_category':
+            # Tech industry profit margins vary by product
+            profit_margins = self.get_profit_margins(transformed_data['Product_Category'])
+            transformed_data['Profit'] = transformed_data['Sales'] * profit_margins
+        elif plan['profit'] == 'tech_default':
+            transformed_data['Profit'] = transformed_data['Sales'] * self.default_margin
+        elif plan['profit'] == 'flat':
+            # Estimate profit as 20% of sales for general products
+            transformed_data['Profit'] = transformed_data['Sales'] * 0.2
+        
+        if plan['current_year'] and 'Year' not in transformed_data.columns:
             from datetime import datetime
             transformed_data['Year'] = datetime.now().year
             logger.info(f"Generated Year column with current year: {datetime.now().year}")
         
-        if 'Product_Category' not in transformed_data.columns:
-            # Generate tech-specific product categories based on dataset
-            if any('smartphone' in col.lower() for col in transformed_data.columns):
-                logger.info("Generating tech product categories based on Global Tech Gadget dataset")
-                
-                # Create product categories based on the strongest sales metric per row
-                categories = []
-                for _, row in transformed_data.iterrows():
-                    # Determine dominant product category based on relative values
-                    smartphone_score = 0
-                    laptop_score = 0
-                    gaming_score = 0
-                    smartwatch_score = 0
-                    
-                    # Score based on available metrics
-                    for col in transformed_data.columns:
-                        if 'smartphone' in col.lower() and pd.notna(row[col]):
-                            smartphone_score += row[col] if row[col] > 0 else 0
-                        elif 'laptop' in col.lower() and pd.notna(row[col]):
-                            laptop_score += row[col] if row[col] > 0 else 0
-                        elif 'gaming' in col.lower() and pd.notna(row[col]):
-                            gaming_score += row[col] if row[col] > 0 else 0
-                        elif 'smartwatch' in col.lower() and pd.notna(row[col]):
-                            smartwatch_score += row[col] if row[col] > 0 else 0
-                    
-                    # Determine category based on highest score
-                    scores = {
-                        'Smartphones': smartphone_score,
-                        'Laptops': laptop_score,
-                        'Gaming Consoles': gaming_score,
-                        'Smartwatches': smartwatch_score
-                    }
-                    
-                    if max(scores.values()) > 0:
-                        categories.append(max(scores, key=scores.get))
-                    else:
-                        categories.append('Tech Gadgets')
-                
-                transformed_data['Product_Category'] = categories
-                logger.info("Generated tech-specific product categories")
-            else:
-                # Generate random product categories for non-tech datasets
-                import random
-                categories = ['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books', 'Food & Beverage']
-                transformed_data['Product_Category'] = [random.choice(categories) for _ in range(len(transformed_data))]
-                logger.info("Generated general product categories")
+        if plan['product_category'] == 'tech':
+            # Create product categories based on the strongest sales metric per row
+            transformed_data['Product_Category'] = infer_tech_categories(transformed_data)
+        elif plan['product_category'] == 'random':
+            # Generate random product categories for non-tech datasets
+            import random
+            categories = ['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books', 'Food & Beverage']
+            transformed_data['Product_Category'] = [random.choice(categories) for _ in range(len(transformed_data))]
         
         logger.info(f"Data transformation completed. Final shape: {transformed_data.shape}")
-        logger.info(f"Final columns: {list(transformed_data.columns)}")
         
         return transformed_data
     
-    def clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
+    def clean_data(self, data: pd.DataFrame, apply_fallbacks: bool = True) -> pd.DataFrame:
         """
         Clean and prepare the data for analysis.
         
         Args:
             data (pd.DataFrame): Raw data
+            apply_fallbacks (bool): Whether to fill in the current year when no year
+                is valid and sample data when nothing survives cleaning. Streaming
+                ingest turns this off per chunk and decides once for the whole file.
             
         Returns:
             pd.DataFrame: Cleaned data
@@ -414,27 +695,23 @@ class SalesDataProcessor:
                         (cleaned_data[col] >= 1900) & (cleaned_data[col] <= 2100)
                     )
                 else:
-                    cleaned_data[col] = pd.to_datetime(cleaned_data[col], errors='coerce')
+                    cleaned_data[col] = self._parse_dates(cleaned_data[col], schema_fingerprint(cleaned_data.columns))
                     cleaned_data['Year'] = cleaned_data[col].dt.year
                 break
         
         # If Year column exists but has no valid data, regenerate it
-        if 'Year' in cleaned_data.columns:
+        if apply_fallbacks and 'Year' in cleaned_data.columns:
             valid_years = cleaned_data['Year'].dropna()
             if len(valid_years) == 0:
                 from datetime import datetime
                 logger.warning("No valid year data found. Using current year for all records.")
                 cleaned_data['Year'] = datetime.now().year
         
-        # Standardize country names
-        cleaned_data['Country'] = cleaned_data['Country'].str.title().str.strip()
-        cleaned_data['Region'] = cleaned_data['Region'].str.title().str.strip()
-        
         # Remove rows with invalid sales data
         cleaned_data = cleaned_data[cleaned_data['Sales'] > 0]
         
         # Check if data is empty after cleaning
-        if len(cleaned_data) == 0:
+        if apply_fallbacks and len(cleaned_data) == 0:
             logger.warning("All data was filtered out during cleaning. Creating minimal sample data.")
             # Create minimal sample data to prevent empty dataset
             cleaned_data = pd.DataFrame({
@@ -446,6 +723,12 @@ class SalesDataProcessor:
                 'Product_Category': ['Sample Product']
             })
         
+        # Standardize and dictionary-encode dimensions so later stages group
+        # and filter on integer codes
+        for col, normalize in DIMENSION_COLUMNS.items():
+            if col in cleaned_data.columns:
+                cleaned_data[col] = encode_dimension(cleaned_data[col], normalize=normalize)
+        
         logger.info(f"Data cleaned. Shape after cleaning: {cleaned_data.shape}")
         return cleaned_data
     
@@ -459,7 +742,7 @@ class SalesDataProcessor:
         Returns:
             pd.DataFrame: Aggregated data by continent
         """
-        continent_agg = data.groupby('Region').agg({
+        continent_agg = data.groupby('Region', observed=True).agg({
             'Sales': ['sum', 'mean', 'count'],
             'Profit': 'sum' if 'Profit' in data.columns else lambda x: 0
         }).round(2)
@@ -488,7 +771,7 @@ class SalesDataProcessor:
         Returns:
             pd.DataFrame: Aggregated data by country
         """
-        country_agg = data.groupby(['Country', 'Region']).agg({
+        country_agg = data.groupby(['Country', 'Region'], observed=True).agg({
             'Sales': ['sum', 'mean'],
             'Profit': 'sum' if 'Profit' in data.columns else lambda x: 0
         }).round(2)
@@ -506,38 +789,105 @@ class SalesDataProcessor:
         
         return country_agg
     
-    def calculate_growth_trends(self, data: pd.DataFrame) -> pd.DataFrame:
+    def aggregate_rollup(self, data: pd.DataFrame,
+                         hierarchy: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Aggregate sales data at every level of a geographic hierarchy in one scan.
+        
+        The data is grouped once at the finest level; each coarser level is then
+        summed from the partials of the level below it rather than from the rows.
+        With the default hierarchy this returns the same tables as
+        aggregate_by_continent and aggregate_by_country.
+        
+        Args:
+            data (pd.DataFrame): Cleaned data
+            hierarchy (Optional[List[str]]): Levels from coarsest to finest,
+                defaults to ['Region', 'Country']
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Aggregated table per level name
+        """
+        hierarchy = hierarchy or ['Region', 'Country']
+        partials = self._partial_sums(data, hierarchy)
+        return self._rollup_partials(partials, hierarchy)
+    
+    def _rollup_partials(self, partials: pd.DataFrame, hierarchy: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Roll partial sums up a hierarchy, from the finest level to the coarsest.
+        
+        Args:
+            partials (pd.DataFrame): Sales/Profit/Record_Count sums at or below the finest level
+            hierarchy (List[str]): Levels from coarsest to finest
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Aggregated table per level name, in the
+                aggregate_by_continent / aggregate_by_country output format
+        """
+        metrics = [col for col in ['Sales', 'Profit', 'Record_Count'] if col in partials.columns]
+        tables = {}
+        
+        for depth in range(len(hierarchy), 0, -1):
+            # Finest key first, e.g. (Country, Region), matching aggregate_by_country
+            keys = hierarchy[:depth][::-1]
+            partials = partials.groupby(keys, observed=True)[metrics].sum().reset_index()
+            
+            table = partials[keys].copy()
+            table['Total_Sales'] = partials['Sales'].round(2)
+            table['Average_Sales'] = (partials['Sales'] / partials['Record_Count']).round(2)
+            if depth == 1:
+                # Only the top level reports record counts, as aggregate_by_continent does
+                table['Number_of_Records'] = partials['Record_Count']
+            table['Total_Profit'] = partials['Profit'].round(2) if 'Profit' in partials.columns else 0
+            
+            tables[hierarchy[depth - 1]] = table
+        
+        return tables
+    
+    def calculate_growth_trends(self, data: pd.DataFrame, group_by: Union[str, List[str]] = 'Region',
+                                period: str = 'Year') -> pd.DataFrame:
         """
         Calculate growth trends over time.
         
+        Sales are summed per period and group, then period-over-period growth is
+        computed for every group at once with a grouped pct_change.
+        
         Args:
             data (pd.DataFrame): Data with time dimension
+            group_by (Union[str, List[str]]): Dimension(s) to compute growth for,
+                e.g. 'Region', 'Country' or 'Product_Category'
+            period (str): Period column, or 'Quarter' / 'Month' to derive the
+                period from a Date column
             
         Returns:
-            pd.DataFrame: Growth trends data
+            pd.DataFrame: Sales and Sales_Growth (in %) per period and group
         """
-        if 'Year' not in data.columns:
-            logger.warning("No Year column found. Cannot calculate growth trends.")
-            return pd.DataFrame()
+        group_columns = [group_by] if isinstance(group_by, str) else list(group_by)
+        
+        if period not in data.columns:
+            if period in PERIOD_FREQUENCIES and 'Date' in data.columns:
+                dates = self._parse_dates(data['Date'], schema_fingerprint(data.columns))
+                data = data.assign(**{period: dates.dt.to_period(PERIOD_FREQUENCIES[period])})
+            else:
+                logger.warning(f"No {period} column found. Cannot calculate growth trends.")
+                return pd.DataFrame()
         
         try:
-            # Aggregate by year and region
-            yearly_data = data.groupby(['Year', 'Region'])['Sales'].sum().reset_index()
-            
-            # Calculate year-over-year growth
-            growth_data = []
-            for region in yearly_data['Region'].unique():
-                region_data = yearly_data[yearly_data['Region'] == region].sort_values('Year')
-                region_data['Sales_Growth'] = region_data['Sales'].pct_change() * 100
-                growth_data.append(region_data)
-            
-            # Check if growth_data has any data before concatenating
-            if not growth_data:
+            # Aggregate by period and group
+            period_data = data.groupby([period] + group_columns, observed=True)['Sales'].sum().reset_index()
+            
+            if period_data.empty:
                 logger.warning("No growth data available for calculation.")
                 return pd.DataFrame()
             
-            growth_trends = pd.concat(growth_data, ignore_index=True)
-            return growth_trends
+            # Keep groups in order of first appearance, each sorted by period
+            group_order = period_data.groupby(group_columns, sort=False, observed=True).ngroup()
+            period_data = period_data.iloc[np.argsort(group_order.to_numpy(), kind='stable')]
+            
+            period_data['Sales_Growth'] = period_data.groupby(
+                group_columns, sort=False, observed=True
+            )['Sales'].pct_change() * 100
+            
+            return period_data.reset_index(drop=True)
             
         except Exception as e:
             logger.warning(f"Error calculating growth trends: {str(e)}. Returning empty DataFrame.")
@@ -563,79 +913,971 @@ class SalesDataProcessor:
         top_performers = data.nlargest(top_n, metric)
         return top_performers
     
-    def process_full_pipeline(self, file_path: str) -> Dict[str, pd.DataFrame]:
+    def build_cube(self, data: pd.DataFrame) -> pd.DataFrame:
         """
-        Run the complete data processing pipeline with auto-transformation.
+        Pre-aggregate cleaned data by every filterable dimension.
+        
+        The cube holds one row per (Region, Country, Year, Product_Category)
+        combination present in the data, with summed Sales and Profit and the
+        number of underlying records. Its Sales/Profit/Country/Region/Year
+        columns mean the same as in cleaned data, so sums and distinct counts
+        over the cube equal those over the rows.
         
         Args:
-            file_path (str): Path to the data file
+            data (pd.DataFrame): Cleaned data
             
         Returns:
-            Dict[str, pd.DataFrame]: Dictionary containing all processed data
+            pd.DataFrame: Dimension cube
         """
-        # Load raw data
-        raw_data = self.load_data(file_path)
-        
-        # Auto-transform data to standard format
-        transformed_data = self.auto_transform_data(raw_data)
-        
-        # Validate transformed data
-        if not self.validate_data(transformed_data):
-            logger.warning("Data validation failed after transformation. Attempting basic fixes...")
-            # Try to fix basic issues
-            transformed_data = self._fix_basic_data_issues(transformed_data)
+        dimensions = [col for col in CUBE_DIMENSIONS if col in data.columns]
+        return self._partial_sums(data, dimensions, dropna=False)
+    
+    def _partial_sums(self, data: pd.DataFrame, keys: List[str], dropna: bool = True) -> pd.DataFrame:
+        """
+        Sum Sales and Profit and count records per group in one scan on the compute backend.
         
-        # Clean data
-        cleaned_data = self.clean_data(transformed_data)
+        Args:
+            data (pd.DataFrame): Cleaned data
+            keys (List[str]): Grouping columns
+            dropna (bool): Whether to drop groups with missing keys
+            
+        Returns:
+            pd.DataFrame: Keys plus Sales, Profit and Record_Count columns
+        """
+        metrics = [col for col in ['Sales', 'Profit'] if col in data.columns]
+        return self.backend.group_sum(data, keys, metrics, dropna=dropna)
+    
+    def query_cube(self, cube: pd.DataFrame, regions: Optional[List[str]] = None,
+                   years: Optional[List[int]] = None,
+                   products: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Filter the dimension cube and derive the dashboard aggregates from it.
         
-        # Ensure we have valid data after cleaning
-        if len(cleaned_data) == 0:
-            logger.error("No valid data remaining after cleaning process")
-            raise ValueError("Dataset is empty after processing. Please check data quality.")
+        A selection of None leaves that dimension unfiltered; a list (even an
+        empty one) keeps only the listed values. Work is proportional to the
+        number of cube groups rather than the number of rows.
         
-        try:
-            # Create aggregations
-            continent_data = self.aggregate_by_continent(cleaned_data)
-            country_data = self.aggregate_by_country(cleaned_data)
-            
-            # Calculate trends if possible
-            growth_trends = self.calculate_growth_trends(cleaned_data)
-            
-            # Get top performers
-            top_countries = self.get_top_performers(country_data, 'Total_Sales', 15)
-            top_regions = self.get_top_performers(continent_data, 'Total_Sales', 10)
+        Args:
+            cube (pd.DataFrame): Cube from build_cube
+            regions (Optional[List[str]]): Regions to keep
+            years (Optional[List[int]]): Years to keep
+            products (Optional[List[str]]): Product categories to keep
             
-        except Exception as e:
-            logger.error(f"Error during data aggregation: {str(e)}")
-            # Return basic structure with empty DataFrames if aggregation fails
-            continent_data = pd.DataFrame()
-            country_data = pd.DataFrame()
-            growth_trends = pd.DataFrame()
-            top_countries = pd.DataFrame()
-            top_regions = pd.DataFrame()
+        Returns:
+            Dict[str, pd.DataFrame]: Filtered cube plus continent_data, country_data,
+                growth_trends, top_countries and top_regions
+        """
+        mask = pd.Series(True, index=cube.index)
+        for col, selected in [('Region', regions), ('Year', years), ('Product_Category', products)]:
+            if selected is not None and col in cube.columns:
+                mask &= cube[col].isin(selected)
+        filtered_cube = cube[mask]
+        
+        rollup = self._rollup_partials(filtered_cube, ['Region', 'Country'])
+        continent_data = rollup['Region']
+        country_data = rollup['Country']
         
         return {
-            'raw_data': raw_data,
-            'transformed_data': transformed_data,
-            'cleaned_data': cleaned_data,
+            'cube': filtered_cube,
             'continent_data': continent_data,
             'country_data': country_data,
-            'growth_trends': growth_trends,
-            'top_countries': top_countries,
-            'top_regions': top_regions
+            'growth_trends': self.calculate_growth_trends(filtered_cube),
+            'top_countries': self.get_top_performers(country_data, 'Total_Sales', 15),
+            'top_regions': self.get_top_performers(continent_data, 'Total_Sales', 10)
         }
     
-    def _fix_basic_data_issues(self, data: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def filter_cache_key(fingerprint: str, regions: Optional[List[str]] = None,
+                         years: Optional[List[int]] = None,
+                         products: Optional[List[str]] = None) -> Tuple:
         """
-        Fix basic data issues when validation fails.
+        Build the canonical filter_cache key for a dataset and filter selection.
+        
+        Selections become frozensets, so order and duplicates don't matter,
+        while None (no filter) stays distinct from an empty selection.
         
         Args:
-            data (pd.DataFrame): Data with potential issues
+            fingerprint (str): Dataset fingerprint from the pipeline result
+            regions (Optional[List[str]]): Selected regions
+            years (Optional[List[int]]): Selected years
+            products (Optional[List[str]]): Selected product categories
             
         Returns:
-            pd.DataFrame: Fixed data
+            Tuple: Hashable cache key
         """
-        fixed_data = data.copy()
+        return (fingerprint,) + tuple(
+            None if selected is None else frozenset(selected) for selected in (regions, years, products)
+        )
+    
+    @staticmethod
+    def filter_options(data_dict: Dict[str, pd.DataFrame]) -> Dict[str, List]:
+        """
+        Return the values each filter dimension can be set to, for the dashboards' filter widgets.
+        
+        The values come from the cube, which holds every dimension value of the
+        rows, so a result loaded from the dataset store doesn't read its whole
+        cleaned table just to fill the widgets.
+        
+        Args:
+            data_dict (Dict[str, pd.DataFrame]): Result of process_full_pipeline or process_csv_text
+            
+        Returns:
+            Dict[str, List]: Sorted non-missing values per filter dimension the data has;
+                years are ints
+        """
+        source = data_dict.get('cube')
+        if source is None or source.empty:
+            source = data_dict['cleaned_data']
+        
+        options = {}
+        for col in FILTER_DIMENSIONS:
+            if col in source.columns:
+                values = source[col].dropna().unique()
+                options[col] = sorted(int(value) for value in values) if col == 'Year' else sorted(values)
+        return options
+    
+    def filter_results(self, data_dict: Dict[str, pd.DataFrame], regions: Optional[List[str]] = None,
+                       years: Optional[List[int]] = None,
+                       products: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Filter a pipeline result to a region/year/product selection.
+        
+        Aggregates come from query_cube and the matching rows from the filter
+        index. Results are memoized in filter_cache under the dataset
+        fingerprint and the selection; results without a fingerprint (run with
+        use_cache=False) are recomputed on every call.
+        
+        Args:
+            data_dict (Dict[str, pd.DataFrame]): Result of process_full_pipeline or process_csv_text
+            regions (Optional[List[str]]): Regions to keep, None for all
+            years (Optional[List[int]]): Years to keep, None for all
+            products (Optional[List[str]]): Product categories to keep, None for all
+            
+        Returns:
+            Dict[str, pd.DataFrame]: query_cube results plus the filtered cleaned_data
+        """
+        fingerprint = data_dict.get('fingerprint')
+        if fingerprint is None:
+            return self._compute_filter_results(data_dict, regions, years, products)
+        
+        key = self.filter_cache_key(fingerprint, regions, years, products)
+        results = filter_cache.get_or_compute(
+            key, lambda: self._compute_filter_results(data_dict, regions, years, products)
+        )
+        return dict(results)
+    
+    def _compute_filter_results(self, data_dict: Dict[str, pd.DataFrame], regions: Optional[List[str]],
+                                years: Optional[List[int]],
+                                products: Optional[List[str]]) -> Dict[str, pd.DataFrame]:
+        """Run the cube query and row filter behind filter_results."""
+        if self._serves_from_store(data_dict):
+            # Filter the stored rows and cube with indexed SQL instead of
+            # reading the whole cleaned table into this process
+            fingerprint = data_dict['fingerprint']
+            selections = {'Region': regions, 'Year': years, 'Product_Category': products}
+            try:
+                results = self.query_cube(self.store.read_table(fingerprint, 'cube', selections))
+                results['cleaned_data'] = self.store.read_table(fingerprint, 'cleaned_data', selections)
+                return results
+            except KeyError:
+                # Evicted since it was loaded: the frames read below recompute
+                # it from the source, so filter those in memory
+                data_dict['from_store'] = False
+        
+        cleaned_data = data_dict.get('cleaned_data')
+        
+        cube = data_dict.get('cube')
+        if (cube is None or cube.empty) and cleaned_data is not None:
+            cube = self.build_cube(cleaned_data)
+        
+        results = self.query_cube(cube, regions, years, products)
+        
+        if cleaned_data is not None:
+            filter_index = data_dict.get('filter_index')
+            if filter_index is None:
+                filter_index = FilterIndex(cleaned_data)
+            results['cleaned_data'] = filter_index.take(cleaned_data, {
+                'Region': regions,
+                'Year': years,
+                'Product_Category': products
+            })
+        
+        return results
+    
+    def _serves_from_store(self, data_dict: Dict[str, pd.DataFrame]) -> bool:
+        """Return True if a result was loaded from the store and its cleaned rows aren't in memory."""
+        return (self.store is not None and isinstance(data_dict, PipelineResult)
+                and data_dict.get('from_store', False) and not data_dict.is_computed('cleaned_data'))
+    
+    def process_full_pipeline(self, file_path: str, use_cache: bool = True,
+                              use_sidecar: bool = True, lean: bool = False) -> PipelineResult:
+        """
+        Run the complete data processing pipeline with auto-transformation.
+        
+        Results are cached by a content hash of the file, so repeated calls with
+        an unchanged file skip loading and processing entirely.
+        
+        Args:
+            file_path (str): Path to the data file
+            use_cache (bool): Whether to read from and write to the pipeline cache
+            use_sidecar (bool): Whether load_data may use a columnar sidecar file
+            lean (bool): Release raw_data and transformed_data once processed; they are
+                reloaded from file_path if requested later
+            
+        Returns:
+            PipelineResult: Dict-like result containing all processed data
+        """
+        if not use_cache:
+            return self._run_pipeline(lambda processor: processor.load_data(file_path, use_sidecar), lean)
+        
+        file_extension = file_path.split('.')[-1].lower()
+        cache_key = self._content_cache_key(file_extension, hash_file(file_path))
+        return self._cached_pipeline(cache_key, lambda processor: processor.load_data(file_path, use_sidecar), lean)
+    
+    def process_csv_text(self, csv_text: str, use_cache: bool = True, lean: bool = False) -> PipelineResult:
+        """
+        Run the complete data processing pipeline on pasted CSV text.
+        
+        Args:
+            csv_text (str): Raw CSV content
+            use_cache (bool): Whether to read from and write to the pipeline cache
+            lean (bool): Release raw_data and transformed_data once processed; they are
+                re-parsed from csv_text if requested later
+            
+        Returns:
+            PipelineResult: Dict-like result containing all processed data
+        """
+        def load(processor):
+            processor.data = processor.backend.read_csv(io.StringIO(csv_text))
+            return processor.data
+        
+        if not use_cache:
+            return self._run_pipeline(load, lean)
+        
+        return self._cached_pipeline(f"text:{hash_bytes(csv_text)}:{self._settings_digest()}", load, lean,
+                                     source_bytes=len(csv_text))
+    
+    def process_upload(self, content: Union[bytes, bytearray, memoryview, IO[bytes]], file_name: str,
+                       use_cache: bool = True, lean: bool = False) -> PipelineResult:
+        """
+        Run the complete data processing pipeline on an uploaded file held in memory.
+        
+        The upload is parsed straight from its buffer, so nothing is written to
+        the working directory and concurrent sessions uploading files with the
+        same name can't collide. The cache key is the content hash with the
+        extension, the same key process_full_pipeline uses, so uploading a file
+        that was already processed from disk is a cache hit.
+        
+        Args:
+            content (Union[bytes, bytearray, memoryview, IO[bytes]]): File contents, or a
+                binary file-like object such as a Streamlit UploadedFile
+            file_name (str): File name or bare extension, used to pick the format
+            use_cache (bool): Whether to read from and write to the pipeline cache
+            lean (bool): Release raw_data and transformed_data once processed; they are
+                re-parsed from the upload if requested later
+            
+        Returns:
+            PipelineResult: Dict-like result containing all processed data
+        """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            content = bytes(content)
+        elif hasattr(content, 'getvalue'):
+            content = content.getvalue()
+        else:
+            content.seek(0)
+            content = content.read()
+        
+        def load(processor):
+            return processor.load_buffer(content, file_name)
+        
+        if not use_cache:
+            return self._run_pipeline(load, lean)
+        
+        file_extension = file_name.split('.')[-1].lower()
+        # The cached result keeps the upload to re-parse dropped frames from
+        return self._cached_pipeline(self._content_cache_key(file_extension, hash_bytes(content)), load, lean,
+                                     source_bytes=len(content))
+    
+    def _content_cache_key(self, file_extension: str, content_hash: str) -> str:
+        """Return the pipeline cache key for file contents; pruned loads keep fewer columns, so they're keyed apart."""
+        return f"{file_extension}:{content_hash}:{self._settings_digest()}" + (':pruned' if self.prune_columns else '')
+    
+    def _settings_digest(self) -> str:
+        """Return a digest of the settings that change pipeline results, so cache keys tell processors apart."""
+        settings = json.dumps([sorted(self.profit_margins.items()), self.default_margin])
+        return hash_bytes(settings)[:16]
+    
+    def _cached_pipeline(self, cache_key: str, load: RawLoader,
+                         lean: bool = False, source_bytes: int = 0) -> PipelineResult:
+        """
+        Return the cached pipeline result for a content key, computing it on a miss.
+        
+        Lean and full results share one cache entry: a lean caller gets a copy
+        without the dropped frames, and a full caller recomputes any frame a
+        lean run dropped on first access.
+        
+        Args:
+            cache_key (str): Content hash based cache key
+            load (RawLoader): Loads the raw data on a cache miss
+            lean (bool): Whether to hand out the result without the intermediate frames
+            source_bytes (int): Size of the in-memory source ``load`` keeps alive,
+                counted towards the cache's memory budget
+            
+        Returns:
+            PipelineResult: Dict-like result containing all processed data
+        """
+        results = pipeline_cache.get(cache_key)
+        if results is not None:
+            logger.info(f"Using cached pipeline results for {cache_key[:16]}")
+        else:
+            results = self._load_stored(cache_key, load)
+            if results is None:
+                # The key hashes the content, so formats cached under it fit this data
+                with self._date_scope(cache_key):
+                    results = self._run_pipeline(load, lean)
+                # Identifies the dataset for filter_cache keys
+                results['fingerprint'] = cache_key
+                if self.store is not None:
+                    self._store_in_background(cache_key, results)
+            results.retained_bytes = source_bytes
+            pipeline_cache.set(cache_key, results)
+        
+        # Hand out a copy so callers can't alter the cached entry's keys, and
+        # frames recomputed on the copy don't grow the cache
+        results = results.copy()
+        if lean:
+            results.drop(*LEAN_DROPPED_FRAMES)
+        elif results.is_computed('raw_data'):
+            self.data = results['raw_data']
+        
+        return results
+    
+    def _store_in_background(self, cache_key: str, results: PipelineResult) -> None:
+        """
+        Persist a pipeline result in the dataset store on a background thread.
+        
+        Writing the rows to SQLite takes longer than processing them, so the
+        caller doesn't wait for it. A key already being saved isn't saved again.
+        The thread is a daemon, so it doesn't hold up interpreter exit; a save
+        cut short is rolled back by SQLite and redone on the next cache miss.
+        
+        Args:
+            cache_key (str): Content hash based cache key
+            results (PipelineResult): Result to store; the thread saves a copy
+        """
+        with storing_lock:
+            if cache_key in storing_keys:
+                return
+            storing_keys.add(cache_key)
+        
+        # A copy, so frames the save computes don't grow the cached entry
+        threading.Thread(target=self._store_results, args=(cache_key, results.copy()),
+                         name=f"store-{cache_key[:16]}", daemon=True).start()
+    
+    def _store_results(self, cache_key: str, results: PipelineResult) -> None:
+        """Persist a pipeline result in the dataset store, logging failures."""
+        try:
+            self.store.save(cache_key, results)
+        except Exception as e:
+            logger.error(f"Could not store dataset {cache_key[:16]}: {str(e)}")
+        finally:
+            with storing_lock:
+                storing_keys.discard(cache_key)
+    
+    def _load_stored(self, cache_key: str, load: RawLoader) -> Optional[PipelineResult]:
+        """
+        Build a pipeline result backed by the dataset store, if it holds ``cache_key``.
+        
+        Only the previews are read up front; each frame is read from SQLite on
+        first access, and raw_data/transformed_data are recomputed via ``load``.
+        If the store evicts the dataset while the result is still cached, the
+        frames not yet read are recomputed via ``load`` as well (see
+        _rebuild_evicted).
+        
+        Args:
+            cache_key (str): Content hash based cache key
+            load (RawLoader): Loads the raw data
+            
+        Returns:
+            Optional[PipelineResult]: Stored result, or None if there is no store or no stored copy
+        """
+        if self.store is None:
+            return None
+        
+        try:
+            info = self.store.info(cache_key)
+            if info is None:
+                return None
+            
+            @lru_cache(maxsize=None)
+            def rebuild():
+                results['from_store'] = False
+                return self._rebuild_evicted(cache_key, load, results.retained_bytes)
+            
+            def read(name):
+                def factory():
+                    try:
+                        return self.store.read_table(cache_key, name)
+                    except KeyError:
+                        return rebuild()[name]
+                return factory
+            
+            results = PipelineResult({
+                'raw_rows': info['raw_rows'],
+                'skipped_columns': info['skipped_columns'],
+                'raw_preview': self.store.read_table(cache_key, 'raw_preview'),
+                'transformed_preview': self.store.read_table(cache_key, 'transformed_preview'),
+                'fingerprint': cache_key,
+                'from_store': True
+            }, factories={
+                **self._reload_factories(load),
+                'cleaned_data': read('cleaned_data'),
+                **{name: self._lazy_aggregate(read(name)) for name in LAZY_AGGREGATES if name != 'filter_index'},
+                'filter_index': self._lazy_aggregate(lambda: FilterIndex(results['cleaned_data']), empty=None)
+            }, shared=LAZY_AGGREGATES + ['cleaned_data'])
+        except Exception as e:
+            logger.error(f"Could not read stored dataset {cache_key[:16]}: {str(e)}")
+            return None
+        
+        logger.info(f"Using stored pipeline results for {cache_key[:16]}")
+        return results
+    
+    def _rebuild_evicted(self, cache_key: str, load: RawLoader, retained_bytes: int) -> PipelineResult:
+        """
+        Recompute a store-backed result whose dataset the store has since evicted.
+        
+        Runs on a throwaway processor (see reload_frame) and replaces the
+        pipeline_cache entry, so later calls get the recomputed result.
+        
+        Args:
+            cache_key (str): Content hash based cache key
+            load (RawLoader): Loads the raw data
+            retained_bytes (int): Source size the cached entry counted, see _cached_pipeline
+            
+        Returns:
+            PipelineResult: Recomputed result without raw_data/transformed_data
+        """
+        logger.warning(f"Dataset {cache_key[:16]} was evicted from the store; recomputing it")
+        processor = SalesDataProcessor(**self._processor_options())
+        with processor._date_scope(cache_key):
+            results = processor._run_pipeline(load, lean=True)
+        results['fingerprint'] = cache_key
+        results.retained_bytes = retained_bytes
+        pipeline_cache.set(cache_key, results)
+        return results
+    
+    def _reload_factories(self, load: RawLoader) -> Dict[str, Callable[[], pd.DataFrame]]:
+        """
+        Return PipelineResult factories that recompute raw_data and transformed_data.
+        
+        They reload on a throwaway processor with this one's options (see
+        reload_frame), so a cached result neither keeps this processor alive
+        nor sets its ``data`` to a frame the cache doesn't account for.
+        
+        Args:
+            load (RawLoader): Loads the raw data
+            
+        Returns:
+            Dict[str, Callable[[], pd.DataFrame]]: Factory per frame name
+        """
+        options = self._processor_options()
+        return {
+            'raw_data': partial(reload_frame, load, options),
+            'transformed_data': partial(reload_frame, load, options, transform=True)
+        }
+    
+    def _processor_options(self) -> Dict:
+        """Return the keyword arguments that build a processor producing the same results as this one."""
+        return {
+            'profit_margins': self.profit_margins,
+            'default_margin': self.default_margin,
+            'backend': self.backend.name,
+            'prune_columns': self.prune_columns,
+            'store': self.store
+        }
+    
+    def _run_pipeline(self, load: RawLoader, lean: bool = False) -> PipelineResult:
+        """
+        Load, transform, clean and aggregate the data.
+        
+        When profiling is enabled the result also holds a 'profile' dict with
+        wall time, CPU time, rows in/out and peak memory per stage. The result
+        always holds small raw_preview/transformed_preview heads, the raw row
+        count and the source columns column pruning skipped (skipped_columns);
+        raw_data and transformed_data can be recomputed via ``load``.
+        
+        Args:
+            load (RawLoader): Loads the raw data
+            lean (bool): Release raw_data and transformed_data before returning
+            
+        Returns:
+            PipelineResult: Dict-like result containing all processed data
+        """
+        profiler = PipelineProfiler(self.profile)
+        self.skipped_columns = []
+        
+        with profiler.stage('load') as stage:
+            raw_data = load(self)
+            stage['rows_out'] = len(raw_data)
+        
+        # Auto-transform data to standard format
+        with profiler.stage('auto_transform', rows_in=len(raw_data)) as stage:
+            transformed_data = self.auto_transform_data(raw_data)
+            stage['rows_out'] = len(transformed_data)
+        
+        # Validate transformed data
+        with profiler.stage('validate', rows_in=len(transformed_data)) as stage:
+            transformed_data = self._ensure_valid(transformed_data)
+            stage['rows_out'] = len(transformed_data)
+        
+        # Clean data
+        with profiler.stage('clean', rows_in=len(transformed_data)) as stage:
+            cleaned_data = self.clean_data(transformed_data)
+            stage['rows_out'] = len(cleaned_data)
+        
+        # Ensure we have valid data after cleaning
+        if len(cleaned_data) == 0:
+            logger.error("No valid data remaining after cleaning process")
+            raise ValueError("Dataset is empty after processing. Please check data quality.")
+        
+        # Aggregates are computed on first access, so callers only pay for
+        # what they read; continent and country data share one rollup scan
+        rollup = lru_cache(maxsize=None)(lambda: self.aggregate_rollup(cleaned_data))
+        
+        results = PipelineResult({
+            'raw_data': raw_data,
+            'transformed_data': transformed_data,
+            'raw_rows': len(raw_data),
+            'skipped_columns': list(self.skipped_columns),
+            'raw_preview': raw_data.head(PREVIEW_ROWS).copy(),
+            'transformed_preview': transformed_data.head(PREVIEW_ROWS).copy(),
+            'cleaned_data': cleaned_data
+        }, factories={
+            **self._reload_factories(load),
+            'continent_data': self._lazy_aggregate(lambda: rollup()['Region']),
+            'country_data': self._lazy_aggregate(lambda: rollup()['Country']),
+            'growth_trends': self._lazy_aggregate(lambda: self.calculate_growth_trends(cleaned_data)),
+            'top_countries': self._lazy_aggregate(
+                lambda: self.get_top_performers(results['country_data'], 'Total_Sales', 15)
+            ),
+            'top_regions': self._lazy_aggregate(
+                lambda: self.get_top_performers(results['continent_data'], 'Total_Sales', 10)
+            ),
+            # Pre-aggregate for fast filtering in the dashboards
+            'cube': self._lazy_aggregate(lambda: self.build_cube(cleaned_data)),
+            # Index the filter dimensions so row-level filtering skips isin scans
+            'filter_index': self._lazy_aggregate(lambda: FilterIndex(cleaned_data), empty=None)
+        }, shared=LAZY_AGGREGATES)
+        
+        if profiler.enabled:
+            # A profile should cover every stage, so compute them all up front
+            for stage_name, keys in PROFILED_AGGREGATE_STAGES.items():
+                with profiler.stage(stage_name, rows_in=len(cleaned_data)) as stage:
+                    values = [results[key] for key in keys]
+                    stage['rows_out'] = sum(len(value) for value in values if isinstance(value, pd.DataFrame))
+        
+        profile = profiler.finish()
+        if profile is not None:
+            results['profile'] = profile
+        
+        if lean:
+            results.drop(*LEAN_DROPPED_FRAMES)
+            self.data = None
+        
+        return results
+    
+    def process_streaming_pipeline(self, file_path: str,
+                                   chunksize: int = STREAMING_CHUNK_SIZE) -> Dict[str, pd.DataFrame]:
+        """
+        Run the pipeline over a CSV file in chunks with bounded memory.
+        
+        Each chunk is transformed and cleaned on its own and folded into a running
+        dimension cube (see build_cube), so only one chunk and the (small) cube
+        are held at a time. The aggregate tables match the in-memory pipeline;
+        row-level frames (raw, transformed, cleaned data) are not returned.
+        
+        Args:
+            file_path (str): Path to the CSV file
+            chunksize (int): Number of rows to read per chunk
+            
+        Returns:
+            Dict[str, pd.DataFrame]: cube, continent_data, country_data, growth_trends,
+                top_countries and top_regions
+        """
+        file_extension = file_path.split('.')[-1].lower()
+        if file_extension != 'csv':
+            raise ValueError(f"Streaming ingest only supports CSV files, got: {file_extension}")
+        
+        profiler = PipelineProfiler(self.profile)
+        chunks = pd.read_csv(file_path, chunksize=chunksize)
+        cube_partials, total_rows = self._fold_chunks(chunks, profiler)
+        
+        if total_rows == 0:
+            logger.error("No valid data remaining after cleaning process")
+            raise ValueError("Dataset is empty after processing. Please check data quality.")
+        
+        logger.info(f"Streamed {total_rows} cleaned rows from {file_path}")
+        cube_partials = self._apply_cube_fallbacks(cube_partials)
+        
+        with profiler.stage('aggregate', rows_in=len(cube_partials)):
+            results = self.query_cube(cube_partials)
+        
+        profile = profiler.finish()
+        if profile is not None:
+            results['profile'] = profile
+        
+        return results
+    
+    def _fold_chunks(self, chunks: Iterator[pd.DataFrame], profiler: PipelineProfiler,
+                     cube_partials: Optional[pd.DataFrame] = None,
+                     date_scope: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], int]:
+        """
+        Transform and clean raw chunks one at a time and fold them into a cube.
+        
+        Chunks are cleaned without the whole-dataset fallbacks; apply
+        _apply_cube_fallbacks to the final cube instead. Later chunks parse
+        their dates with the formats inferred from the first one (as long as
+        they fit), as the in-memory pipeline does for the whole file.
+        
+        Args:
+            chunks (Iterator[pd.DataFrame]): Raw data chunks
+            profiler (PipelineProfiler): Profiler recording the per-stage stats
+            cube_partials (Optional[pd.DataFrame]): Cube to fold the chunks into
+            date_scope (Optional[str]): Date scope of the data the chunks belong to;
+                None starts a new one
+            
+        Returns:
+            Tuple[Optional[pd.DataFrame], int]: Combined cube (None if there were no
+                chunks) and the number of cleaned rows folded in
+        """
+        total_rows = 0
+        
+        with self._date_scope(date_scope or uuid.uuid4().hex):
+            while True:
+                with profiler.stage('load') as stage:
+                    chunk = next(chunks, None)
+                    stage['rows_out'] = 0 if chunk is None else len(chunk)
+                if chunk is None:
+                    break
+            
+                with profiler.stage('auto_transform', rows_in=len(chunk)) as stage:
+                    transformed_chunk = self.auto_transform_data(chunk)
+                    stage['rows_out'] = len(transformed_chunk)
+            
+                with profiler.stage('validate', rows_in=len(transformed_chunk)) as stage:
+                    if not self.validate_data(transformed_chunk):
+                        transformed_chunk = self._fix_basic_data_issues(transformed_chunk)
+                    stage['rows_out'] = len(transformed_chunk)
+            
+                with profiler.stage('clean', rows_in=len(transformed_chunk)) as stage:
+                    cleaned_chunk = self.clean_data(transformed_chunk, apply_fallbacks=False)
+                    stage['rows_out'] = len(cleaned_chunk)
+            
+                total_rows += len(cleaned_chunk)
+                with profiler.stage('cube', rows_in=len(cleaned_chunk)) as stage:
+                    cube_partials = self._fold_partials(cube_partials, self.build_cube(cleaned_chunk))
+                    stage['rows_out'] = len(cube_partials)
+        
+        return cube_partials, total_rows
+    
+    def process_directory_pipeline(self, source: str, max_workers: Optional[int] = None,
+                                   use_sidecar: bool = True) -> Dict[str, pd.DataFrame]:
+        """
+        Run the pipeline over every data file in a directory or matching a glob pattern.
+        
+        Files are loaded, transformed and cleaned independently in a process
+        pool, each reduced to a dimension cube (see build_cube). Only the cubes
+        come back to this process and are merged, so the aggregate tables match
+        running the in-memory pipeline on all files concatenated, without ever
+        holding the combined rows. A file that fails is logged and reported
+        but does not stop the batch.
+        
+        Args:
+            source (str): Directory (all CSV and Excel files in it) or glob pattern
+            max_workers (Optional[int]): Worker processes, defaults to the CPU count;
+                1 processes the files in this process
+            use_sidecar (bool): Whether workers read and write columnar sidecars
+            
+        Returns:
+            Dict[str, pd.DataFrame]: cube, continent_data, country_data, growth_trends,
+                top_countries and top_regions, plus files with the File, Rows,
+                Cleaned_Rows, Seconds and Error of every input file
+        """
+        if os.path.isdir(source):
+            file_paths = sorted(
+                path for path in glob.glob(os.path.join(source, '*'))
+                if path.split('.')[-1].lower() in INGEST_EXTENSIONS
+            )
+        else:
+            file_paths = sorted(glob.glob(source))
+        
+        if not file_paths:
+            raise ValueError(f"No data files found for: {source}")
+        
+        ingest = partial(ingest_file, processor_options=self._processor_options(), use_sidecar=use_sidecar)
+        
+        if max_workers == 1 or len(file_paths) == 1:
+            outcomes = [ingest(path) for path in file_paths]
+        else:
+            workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Results come back in file order, so the merged sums don't depend on scheduling
+                outcomes = list(executor.map(ingest, file_paths))
+        
+        cube_partials = None
+        for cube, _ in outcomes:
+            if cube is not None:
+                cube_partials = self._fold_partials(cube_partials, cube)
+        
+        files = pd.DataFrame([report for _, report in outcomes])
+        failed = int(files['Error'].notna().sum())
+        total_rows = int(files['Cleaned_Rows'].sum())
+        logger.info(f"Ingested {len(files) - failed} of {len(files)} files ({total_rows} cleaned rows) "
+                    f"in {files['Seconds'].sum():.2f} s of worker time")
+        
+        if total_rows == 0:
+            logger.error("No valid data remaining after cleaning process")
+            raise ValueError("Dataset is empty after processing. Please check data quality.")
+        
+        results = self.query_cube(self._apply_cube_fallbacks(cube_partials))
+        results['files'] = files
+        return results
+    
+    def process_incremental_pipeline(self, file_path: str,
+                                     chunksize: int = STREAMING_CHUNK_SIZE) -> Dict[str, pd.DataFrame]:
+        """
+        Run the streaming pipeline over a CSV file, processing only rows appended since the last run.
+        
+        The dimension cube, size and append signature of the last processed
+        version of the file are kept per path. If the file has only grown
+        since, just the new tail is parsed, transformed and cleaned and its
+        cube is folded into the stored one, so a refresh costs time
+        proportional to the appended data. Any other change (rewrite,
+        truncation, edited head) falls back to a full streaming pass.
+        
+        Appends are recognized by the file size and a hash of the first and
+        last HASH_CHUNK_SIZE bytes of the previous version, not the whole
+        prefix, so edits in the middle of a file that keep both its size and
+        those bytes unchanged go unnoticed.
+        
+        Args:
+            file_path (str): Path to the CSV file
+            chunksize (int): Number of rows to read per chunk
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Same tables as process_streaming_pipeline, plus
+                ingest with the Mode ('full', 'append' or 'unchanged'), New_Bytes,
+                New_Rows and Total_Rows of this run
+        """
+        file_extension = file_path.split('.')[-1].lower()
+        if file_extension != 'csv':
+            raise ValueError(f"Incremental ingest only supports CSV files, got: {file_extension}")
+        
+        # The stored cube holds profits computed with this processor's margins
+        state_key = f"{os.path.abspath(file_path)}:{self._settings_digest()}"
+        state = ingest_state_cache.get(state_key)
+        size = os.path.getsize(file_path)
+        offset = self._append_offset(file_path, size, state)
+        profiler = PipelineProfiler(self.profile)
+        
+        if offset is None:
+            mode, offset = 'full', 0
+            # Appended rows are dates of the same file, so they keep its formats
+            date_scope = uuid.uuid4().hex
+            columns = list(pd.read_csv(file_path, nrows=0).columns)
+            chunks = pd.read_csv(file_path, chunksize=chunksize)
+            cube_partials, new_rows = self._fold_chunks(chunks, profiler, date_scope=date_scope)
+            total_rows = new_rows
+        elif offset == size:
+            mode, new_rows = 'unchanged', 0
+            columns, cube_partials, total_rows = state['columns'], state['cube'], state['rows']
+            date_scope = state['date_scope']
+        else:
+            mode = 'append'
+            with open(file_path, 'rb') as f:
+                f.seek(offset)
+                # Stop at the size checked above, even if the file is still growing
+                tail = f.read(size - offset)
+            # The tail has no header row; parse it with the columns of the first run
+            columns, date_scope = state['columns'], state['date_scope']
+            chunks = pd.read_csv(io.BytesIO(tail), header=None, names=columns, chunksize=chunksize)
+            cube_partials, new_rows = self._fold_chunks(chunks, profiler, state['cube'], date_scope)
+            total_rows = state['rows'] + new_rows
+        
+        logger.info(f"Incremental ingest of {file_path}: {mode}, {size - offset} new bytes, "
+                    f"{new_rows} new cleaned rows, {total_rows} in total")
+        
+        if total_rows == 0:
+            logger.error("No valid data remaining after cleaning process")
+            raise ValueError("Dataset is empty after processing. Please check data quality.")
+        
+        with open(file_path, 'rb') as f:
+            f.seek(size - 1)
+            ends_with_newline = f.read(1) in (b'\n', b'\r')
+        ingest_state_cache.set(state_key, {
+            'size': size,
+            'signature': self._append_signature(file_path, size),
+            'ends_with_newline': ends_with_newline,
+            'columns': columns,
+            'cube': cube_partials,
+            'rows': total_rows,
+            'date_scope': date_scope
+        })
+        
+        # The stored cube is folded into on the next append, so apply the
+        # fallbacks to a copy
+        with profiler.stage('aggregate', rows_in=len(cube_partials)):
+            results = self.query_cube(self._apply_cube_fallbacks(cube_partials.copy()))
+        
+        results['ingest'] = pd.DataFrame([{
+            'Mode': mode, 'New_Bytes': size - offset, 'New_Rows': new_rows, 'Total_Rows': total_rows
+        }])
+        
+        profile = profiler.finish()
+        if profile is not None:
+            results['profile'] = profile
+        
+        return results
+    
+    @staticmethod
+    def _append_signature(file_path: str, length: int) -> str:
+        """
+        Hash the first and last HASH_CHUNK_SIZE bytes of the first ``length`` bytes of a file.
+        
+        Args:
+            file_path (str): Path to the file
+            length (int): Length of the version to sign
+            
+        Returns:
+            str: Hex digest
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(min(length, HASH_CHUNK_SIZE))
+            f.seek(max(length - HASH_CHUNK_SIZE, 0))
+            end = f.read(length - f.tell())
+        return hash_bytes(head + end)
+    
+    def _append_offset(self, file_path: str, size: int, state: Optional[Dict]) -> Optional[int]:
+        """
+        Return where the rows appended since the stored state start, or None if the file wasn't only appended to.
+        
+        Args:
+            file_path (str): Path to the CSV file
+            size (int): Current size of the file
+            state (Optional[Dict]): Stored state of the last processed version
+            
+        Returns:
+            Optional[int]: Byte offset of the new tail (equal to ``size`` if
+                nothing was appended), or None if a full pass is needed
+        """
+        if state is None or size < state['size'] or size == 0:
+            return None
+        
+        if self._append_signature(file_path, state['size']) != state['signature']:
+            logger.info(f"{file_path} changed before its previous end; reprocessing it in full")
+            return None
+        
+        if size > state['size'] and not state['ends_with_newline']:
+            # The previous last line had no line break, so the appended bytes
+            # may continue it rather than start a new row
+            with open(file_path, 'rb') as f:
+                f.seek(state['size'])
+                if f.read(1) not in (b'\n', b'\r'):
+                    return None
+        
+        return state['size']
+    
+    @staticmethod
+    def _apply_cube_fallbacks(cube: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the clean_data fallbacks that need the whole dataset to a merged cube.
+        
+        Args:
+            cube (pd.DataFrame): Cube merged from chunks or files cleaned without fallbacks
+            
+        Returns:
+            pd.DataFrame: Cube with the fallbacks applied
+        """
+        if 'Year' in cube.columns and cube['Year'].notna().sum() == 0:
+            # Same fallback clean_data applies when no row has a valid year
+            from datetime import datetime
+            logger.warning("No valid year data found. Using current year for all records.")
+            cube['Year'] = datetime.now().year
+        return cube
+    
+    @staticmethod
+    def _fold_partials(partials: Optional[pd.DataFrame], chunk_cube: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge a chunk's cube into the running cube built from earlier chunks.
+        
+        Args:
+            partials (Optional[pd.DataFrame]): Cube of the chunks so far
+            chunk_cube (pd.DataFrame): Cube of the current chunk
+            
+        Returns:
+            pd.DataFrame: Combined cube
+        """
+        if partials is None:
+            return chunk_cube
+        
+        dimensions = [col for col in CUBE_DIMENSIONS if col in chunk_cube.columns]
+
+        # Chunks encode only the values they saw; merge the dictionaries so the
+        # combined dimensions stay categorical instead of falling back to object
+        partials, chunk_cube = partials.copy(), chunk_cube.copy()
+        for col in dimensions:
+            if isinstance(partials[col].dtype, pd.CategoricalDtype) and \
+                    isinstance(chunk_cube[col].dtype, pd.CategoricalDtype):
+                categories = partials[col].cat.categories.union(chunk_cube[col].cat.categories)
+                partials[col] = partials[col].cat.set_categories(categories)
+                chunk_cube[col] = chunk_cube[col].cat.set_categories(categories)
+
+        combined = pd.concat([partials, chunk_cube], ignore_index=True)
+        return combined.groupby(dimensions, dropna=False, observed=True).sum().reset_index()
+    
+    @staticmethod
+    def _lazy_aggregate(compute: Callable[[], object],
+                        empty: Optional[Callable[[], object]] = pd.DataFrame) -> Callable[[], object]:
+        """
+        Wrap an aggregate computation for lazy evaluation in a PipelineResult.
+        
+        Failures are logged and yield an empty result instead of raising, so
+        one broken aggregate doesn't take down the rest of the dashboard.
+        
+        Args:
+            compute (Callable[[], object]): Computes the aggregate
+            empty (Callable[[], object]): Builds the fallback value, or None for None
+            
+        Returns:
+            Callable[[], object]: Factory for PipelineResult
+        """
+        def factory():
+            try:
+                return compute()
+            except Exception as e:
+                logger.error(f"Error during data aggregation: {str(e)}")
+                return empty() if empty is not None else None
+        return factory
+    
+    def _ensure_valid(self, transformed_data: pd.DataFrame) -> pd.DataFrame:
+        """Validate transformed data, applying basic fixes if validation fails."""
+        if not self.validate_data(transformed_data):
+            logger.warning("Data validation failed after transformation. Attempting basic fixes...")
+            # Try to fix basic issues
+            transformed_data = self._fix_basic_data_issues(transformed_data)
+        return transformed_data
+    
+    def _fix_basic_data_issues(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fix basic data issues when validation fails.
+        
+        Args:
+            data (pd.DataFrame): Data with potential issues
+            
+        Returns:
+            pd.DataFrame: Fixed data
+        """
+        fixed_data = data.copy()
         
         # Ensure required columns exist
         if 'Country' not in fixed_data.columns:
@@ -655,6 +1897,70 @@ class SalesDataProcessor:
         logger.info("Applied basic fixes to data")
         return fixed_data
 
+def ingest_file(file_path: str, processor_options: Optional[Dict] = None,
+                use_sidecar: bool = True) -> Tuple[Optional[pd.DataFrame], Dict]:
+    """
+    Load, transform and clean one file and reduce it to a dimension cube.
+    
+    Runs in the worker processes of SalesDataProcessor.process_directory_pipeline,
+    so it is a module-level function and never raises: failures are returned
+    in the report instead.
+    
+    Args:
+        file_path (str): Path to the data file
+        processor_options (Optional[Dict]): Keyword arguments for SalesDataProcessor
+        use_sidecar (bool): Whether to read and write the columnar sidecar
+        
+    Returns:
+        Tuple[Optional[pd.DataFrame], Dict]: Cube (None if the file failed) and a
+            report with File, Rows, Cleaned_Rows, Seconds and Error
+    """
+    start = time.perf_counter()
+    report = {'File': file_path, 'Rows': 0, 'Cleaned_Rows': 0, 'Seconds': 0.0, 'Error': None}
+    cube = None
+    
+    try:
+        processor = SalesDataProcessor(**(processor_options or {}))
+        data = processor.load_data(file_path, use_sidecar)
+        report['Rows'] = len(data)
+        
+        transformed_data = processor.auto_transform_data(data)
+        if not processor.validate_data(transformed_data):
+            transformed_data = processor._fix_basic_data_issues(transformed_data)
+        
+        cleaned_data = processor.clean_data(transformed_data, apply_fallbacks=False)
+        report['Cleaned_Rows'] = len(cleaned_data)
+        if len(cleaned_data) > 0:
+            cube = processor.build_cube(cleaned_data)
+    except Exception as e:
+        logger.warning(f"Skipping {file_path}: {str(e)}")
+        report['Error'] = f"{type(e).__name__}: {str(e)}"
+    
+    report['Seconds'] = time.perf_counter() - start
+    return cube, report
+
+def reload_frame(load: RawLoader, processor_options: Optional[Dict] = None,
+                 transform: bool = False) -> pd.DataFrame:
+    """
+    Reload the raw (or transformed) data of a cached pipeline result.
+    
+    Runs on a throwaway processor, so the frame is only referenced by the
+    result that asked for it.
+    
+    Args:
+        load (RawLoader): Loads the raw data
+        processor_options (Optional[Dict]): Keyword arguments for SalesDataProcessor
+        transform (bool): Return the auto-transformed and validated data instead
+        
+    Returns:
+        pd.DataFrame: Raw or transformed data
+    """
+    processor = SalesDataProcessor(**(processor_options or {}))
+    data = load(processor)
+    if transform:
+        data = processor._ensure_valid(processor.auto_transform_data(data))
+    return data
+
 def create_sample_data() -> pd.DataFrame:
     """
     Create sample sales data for testing purposes.
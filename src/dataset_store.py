@@ -0,0 +1,258 @@
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Mapping, Optional
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import DATASET_STORE_MAX_AGE, DATASET_STORE_MAX_DATASETS
+except ImportError:
+    # config.py lives at the project root, which is not always on sys.path
+    DATASET_STORE_MAX_AGE = 7 * 24 * 3600
+    DATASET_STORE_MAX_DATASETS = 20
+
+# Pipeline results persisted per dataset
+STORED_TABLES = ['cleaned_data', 'continent_data', 'country_data', 'growth_trends', 'top_countries',
+                 'top_regions', 'cube', 'raw_preview', 'transformed_preview']
+
+# Tables queried by filter selections, and the columns indexed on them
+FILTERED_TABLES = ['cleaned_data', 'cube']
+INDEXED_DIMENSIONS = ['Region', 'Country', 'Year', 'Product_Category']
+
+# Column holding the original row labels, so filtered rows keep their index
+ROW_ID_COLUMN = '__row_id'
+
+# Seconds a writer waits for another process's lock before giving up
+SQLITE_TIMEOUT = 30
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class DatasetStore:
+    """
+    Processed pipeline results persisted in a local SQLite file.
+
+    Each dataset is stored under its pipeline cache key (a content hash), one
+    table per result frame, with the filter dimensions indexed on the cleaned
+    rows and the cube. Several dashboard processes can point at the same
+    file: the first one to process a dataset saves it, and the others load
+    the stored tables instead of parsing and aggregating again. Column dtypes
+    (categoricals, dates) are recorded and restored on read.
+
+    Every save evicts datasets beyond the newest ``max_datasets`` or saved
+    more than ``max_age`` seconds ago, so the file doesn't grow with every
+    upload. A process still reading an evicted dataset's tables fails over
+    to processing it again.
+    """
+
+    def __init__(self, path: str, max_datasets: Optional[int] = DATASET_STORE_MAX_DATASETS,
+                 max_age: Optional[float] = DATASET_STORE_MAX_AGE):
+        self.path = path
+        self.max_datasets = max_datasets
+        self.max_age = max_age
+        with closing(self._connect()) as con, con:
+            # Lets evict hand the pages of dropped tables back to the file
+            # system; only takes effect on a new file
+            con.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            # WAL lets readers in other processes continue while a dataset is written
+            con.execute('PRAGMA journal_mode=WAL')
+            con.execute(
+                'CREATE TABLE IF NOT EXISTS datasets ('
+                'key TEXT PRIMARY KEY, prefix TEXT NOT NULL, created REAL NOT NULL, '
+                'raw_rows INTEGER NOT NULL, skipped_columns TEXT NOT NULL, tables TEXT NOT NULL)'
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT)
+
+    @staticmethod
+    def _prefix(key: str) -> str:
+        """Return the table name prefix for a dataset key."""
+        return 'd' + hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+
+    def info(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the metadata of a stored dataset.
+
+        Args:
+            key (str): Pipeline cache key of the dataset
+
+        Returns:
+            Optional[Dict[str, Any]]: prefix, created, raw_rows, skipped_columns and the
+                column dtypes per stored table, or None if the dataset isn't stored
+        """
+        with closing(self._connect()) as con:
+            row = con.execute(
+                'SELECT prefix, created, raw_rows, skipped_columns, tables FROM datasets WHERE key = ?', (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {'prefix': row[0], 'created': row[1], 'raw_rows': row[2],
+                'skipped_columns': json.loads(row[3]), 'tables': json.loads(row[4])}
+
+    def has(self, key: str) -> bool:
+        """Return True if a dataset is stored under ``key``."""
+        return self.info(key) is not None
+
+    def save(self, key: str, results: Mapping[str, Any]) -> None:
+        """
+        Persist the result frames of a pipeline run in one transaction.
+
+        Args:
+            key (str): Pipeline cache key of the dataset
+            results (Mapping[str, Any]): Pipeline result; lazy entries are computed
+        """
+        prefix = self._prefix(key)
+        tables = {}
+        start = time.perf_counter()
+
+        with closing(self._connect()) as con, con:
+            for name in STORED_TABLES:
+                frame = results.get(name)
+                if not isinstance(frame, pd.DataFrame) or len(frame.columns) == 0:
+                    continue
+
+                table = f"{prefix}_{name}"
+                tables[name] = {str(col): str(dtype) for col, dtype in frame.dtypes.items()}
+                # Categoricals keep their full category list, including unobserved ones
+                tables[name].update({
+                    str(col): {'categories': dtype.categories.tolist()}
+                    for col, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+                })
+                # Categoricals are written as their labels and re-encoded on read
+                frame.astype({
+                    col: object for col, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+                }).to_sql(table, con, if_exists='replace', index=True, index_label=ROW_ID_COLUMN)
+
+                if name in FILTERED_TABLES:
+                    for dim in INDEXED_DIMENSIONS:
+                        if dim in frame.columns:
+                            con.execute(
+                                f"CREATE INDEX IF NOT EXISTS {_quote(f'{table}_{dim}')} "
+                                f"ON {_quote(table)} ({_quote(dim)})"
+                            )
+
+            con.execute(
+                'INSERT OR REPLACE INTO datasets (key, prefix, created, raw_rows, skipped_columns, tables) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, prefix, time.time(), int(results.get('raw_rows', 0)),
+                 json.dumps(list(results.get('skipped_columns', []))), json.dumps(tables))
+            )
+
+        logger.info(f"Stored dataset {key[:16]} in {self.path} ({time.perf_counter() - start:.2f} s)")
+        self.evict()
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a stored dataset and its tables.
+
+        Args:
+            key (str): Pipeline cache key of the dataset
+
+        Returns:
+            bool: True if the dataset was stored
+        """
+        info = self.info(key)
+        if info is None:
+            return False
+
+        with closing(self._connect()) as con, con:
+            for name in info['tables']:
+                # Indexes are dropped with their table
+                con.execute(f"DROP TABLE IF EXISTS {_quote(info['prefix'] + '_' + name)}")
+            con.execute('DELETE FROM datasets WHERE key = ?', (key,))
+
+        logger.info(f"Deleted dataset {key[:16]} from {self.path}")
+        return True
+
+    def evict(self) -> int:
+        """
+        Delete the datasets beyond ``max_datasets`` (oldest first) or older than ``max_age``.
+
+        Returns:
+            int: Number of datasets deleted
+        """
+        keys = []
+        with closing(self._connect()) as con:
+            if self.max_age is not None:
+                keys += [row[0] for row in con.execute(
+                    'SELECT key FROM datasets WHERE created < ?', (time.time() - self.max_age,)
+                )]
+            if self.max_datasets is not None:
+                keys += [row[0] for row in con.execute(
+                    'SELECT key FROM datasets ORDER BY created DESC LIMIT -1 OFFSET ?', (self.max_datasets,)
+                )]
+
+        deleted = sum(self.delete(key) for key in dict.fromkeys(keys))
+        if deleted:
+            with closing(self._connect()) as con:
+                # execute() steps the pragma once, freeing a single page;
+                # executescript runs it to completion
+                con.executescript('PRAGMA incremental_vacuum;')
+        return deleted
+
+    def read_table(self, key: str, name: str,
+                   selections: Optional[Dict[str, Optional[List]]] = None) -> pd.DataFrame:
+        """
+        Read a stored result frame, optionally filtered by dimension values in SQL.
+
+        Args:
+            key (str): Pipeline cache key of the dataset
+            name (str): Result name, e.g. 'cleaned_data' or 'cube'
+            selections (Optional[Dict[str, Optional[List]]]): Selected values per
+                dimension; None (or a column the table lacks) does not filter, an
+                empty list matches nothing, and missing values never match
+
+        Returns:
+            pd.DataFrame: The stored frame, or an empty DataFrame if it wasn't stored
+        """
+        info = self.info(key)
+        if info is None:
+            raise KeyError(f"Dataset {key} is not stored in {self.path}")
+        if name not in info['tables']:
+            return pd.DataFrame()
+
+        dtypes = info['tables'][name]
+        conditions, params = [], []
+        for dim, selected in (selections or {}).items():
+            if selected is None or dim not in dtypes:
+                continue
+            # numpy scalars (e.g. years from unique()) aren't SQLite parameters
+            values = [value.item() if hasattr(value, 'item') else value for value in selected]
+            conditions.append(f"{_quote(dim)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        query = f"SELECT * FROM {_quote(info['prefix'] + '_' + name)}{where} ORDER BY rowid"
+
+        with closing(self._connect()) as con:
+            frame = pd.read_sql_query(query, con, params=params)
+
+        frame = frame.set_index(ROW_ID_COLUMN)
+        frame.index.name = None
+        return self._restore_dtypes(frame, dtypes)
+
+    @staticmethod
+    def _restore_dtypes(frame: pd.DataFrame, dtypes: Dict[str, Any]) -> pd.DataFrame:
+        """Convert columns read from SQLite back to the dtypes they were saved with."""
+        for col, dtype in dtypes.items():
+            if isinstance(dtype, dict):
+                frame[col] = pd.Categorical(frame[col], categories=dtype['categories'])
+            elif dtype.startswith('datetime64'):
+                frame[col] = pd.to_datetime(frame[col], format='ISO8601').astype(dtype)
+            elif str(frame[col].dtype) != dtype:
+                try:
+                    frame[col] = frame[col].astype(dtype)
+                except (TypeError, ValueError):
+                    # e.g. an int column whose filtered rows came back as float; keep what SQLite gave
+                    logger.debug(f"Could not restore {col} to {dtype}")
+        return frame
@@ -0,0 +1,119 @@
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns the dashboards offer multiselect filters for
+FILTER_DIMENSIONS = ['Region', 'Year', 'Product_Category']
+
+# Dimensions with more distinct values than this keep per-row codes instead of
+# one bitmap per value, which would cost n_values * n_rows / 8 bytes
+MAX_BITMAP_VALUES = 256
+
+
+class FilterIndex:
+    """
+    Bitmap index over the filter dimensions of one DataFrame.
+
+    Every value of a low-cardinality dimension gets a packed bitmap of the
+    rows holding it. A selection ORs the bitmaps of the selected values within
+    a dimension and ANDs the result across dimensions, so any combination of
+    multiselect filters resolves without scanning or copying the frame.
+    Missing values never match a selection, as with ``Series.isin``.
+    """
+
+    def __init__(self, data: pd.DataFrame, dimensions: Optional[List[str]] = None):
+        self.n_rows = len(data)
+        self.values: Dict[str, pd.Index] = {}
+        self.bitmaps: Dict[str, np.ndarray] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        self.complete: Dict[str, bool] = {}
+
+        for dim in dimensions or FILTER_DIMENSIONS:
+            if dim not in data.columns:
+                continue
+
+            codes, values = pd.factorize(data[dim])
+            self.values[dim] = pd.Index(values)
+            self.complete[dim] = bool((codes >= 0).all())
+
+            if len(values) <= MAX_BITMAP_VALUES:
+                self.bitmaps[dim] = np.stack([
+                    np.packbits(codes == code) for code in range(len(values))
+                ]) if len(values) else np.empty((0, (self.n_rows + 7) // 8), dtype=np.uint8)
+            else:
+                logger.info(f"{dim} has {len(values)} distinct values; indexing it by code instead of bitmaps")
+                self.codes[dim] = codes
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the bitmaps and codes."""
+        return sum(array.nbytes for array in [*self.bitmaps.values(), *self.codes.values()])
+
+    def _dimension_mask(self, dim: str, selected: List) -> Optional[np.ndarray]:
+        """Return the packed bitmap of rows matching ``selected`` in one dimension, or None if all rows match."""
+        selected_codes = self.values[dim].get_indexer(pd.Index(list(selected)).unique())
+        selected_codes = selected_codes[selected_codes >= 0]
+
+        if len(selected_codes) == len(self.values[dim]) and self.complete[dim]:
+            return None
+
+        if dim in self.bitmaps:
+            if len(selected_codes) == 0:
+                return np.zeros(self.bitmaps[dim].shape[1], dtype=np.uint8)
+            return np.bitwise_or.reduce(self.bitmaps[dim][selected_codes], axis=0)
+
+        lookup = np.zeros(len(self.values[dim]) + 1, dtype=bool)
+        lookup[selected_codes] = True
+        # Missing values have code -1, which indexes the trailing False
+        return np.packbits(lookup[self.codes[dim]])
+
+    def positions(self, selections: Dict[str, Optional[List]]) -> Optional[np.ndarray]:
+        """
+        Resolve a filter selection to row positions.
+
+        Args:
+            selections (Dict[str, Optional[List]]): Selected values per dimension;
+                None (or an unindexed dimension) does not filter, an empty list matches nothing
+
+        Returns:
+            Optional[np.ndarray]: Sorted positions of matching rows, or None if every row matches
+        """
+        mask = None
+        for dim, selected in selections.items():
+            if selected is None or dim not in self.values:
+                continue
+
+            dim_mask = self._dimension_mask(dim, selected)
+            if dim_mask is not None:
+                mask = dim_mask if mask is None else mask & dim_mask
+
+        if mask is None:
+            return None
+
+        return np.flatnonzero(np.unpackbits(mask, count=self.n_rows))
+
+    def take(self, data: pd.DataFrame, selections: Dict[str, Optional[List]]) -> pd.DataFrame:
+        """
+        Return the rows of ``data`` matching ``selections``.
+
+        ``data`` must be the frame the index was built from. When nothing is
+        filtered out the frame itself is returned instead of a copy.
+
+        Args:
+            data (pd.DataFrame): The indexed data
+            selections (Dict[str, Optional[List]]): Selected values per dimension
+
+        Returns:
+            pd.DataFrame: Matching rows in their original order
+        """
+        if len(data) != self.n_rows:
+            raise ValueError(f"FilterIndex covers {self.n_rows} rows but the data has {len(data)}")
+
+        positions = self.positions(selections)
+        if positions is None:
+            return data
+        return data.iloc[positions]
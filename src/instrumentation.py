@@ -0,0 +1,112 @@
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Set to 1/true/yes to record per-stage timings and memory for every pipeline run
+PROFILE_ENV_VAR = 'SALES_DASHBOARD_PROFILE'
+
+
+def profiling_enabled() -> bool:
+    """Return True if stage profiling is switched on via the environment."""
+    return os.environ.get(PROFILE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class PipelineProfiler:
+    """
+    Records wall time, CPU time, row counts and peak memory per pipeline stage.
+
+    Peak memory is the most a stage allocated on top of what was already
+    traced when it started.
+
+    When disabled, ``stage`` does no measuring at all, so leaving the
+    instrumentation in place costs next to nothing. Stages with the same name
+    (e.g. one per chunk in streaming mode) are accumulated into one entry.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self.enabled = profiling_enabled() if enabled is None else enabled
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._started_tracing = False
+        self._start_time = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Measure one pipeline stage.
+
+        Yields a dict the caller can set ``rows_out`` on once the stage's result
+        is known.
+
+        Args:
+            name (str): Stage name, e.g. 'load' or 'clean'
+            rows_in (Optional[int]): Number of rows entering the stage
+        """
+        record = {}
+        if not self.enabled:
+            yield record
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        # Memory still held from earlier stages isn't this stage's peak
+        memory_start = tracemalloc.get_traced_memory()[0]
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            peak_memory = (tracemalloc.get_traced_memory()[1] - memory_start) / 1024 / 1024
+
+            stats = self.stages.setdefault(name, {
+                'calls': 0,
+                'wall_time_s': 0.0,
+                'cpu_time_s': 0.0,
+                'rows_in': None,
+                'rows_out': None,
+                'peak_memory_mb': 0.0
+            })
+            stats['calls'] += 1
+            stats['wall_time_s'] += wall_time
+            stats['cpu_time_s'] += cpu_time
+            stats['peak_memory_mb'] = max(stats['peak_memory_mb'], peak_memory)
+            for key, rows in [('rows_in', rows_in), ('rows_out', record.get('rows_out'))]:
+                if rows is not None:
+                    stats[key] = (stats[key] or 0) + rows
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """
+        Stop memory tracing (if this profiler started it) and return the report.
+
+        Returns:
+            Optional[Dict[str, Any]]: Per-stage stats and total wall time, or None when disabled
+        """
+        if not self.enabled:
+            return None
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        report = {
+            'stages': self.stages,
+            'total_wall_time_s': time.perf_counter() - self._start_time
+        }
+
+        for name, stats in self.stages.items():
+            logger.info(
+                f"[profile] {name}: {stats['wall_time_s'] * 1000:.1f} ms wall, "
+                f"{stats['cpu_time_s'] * 1000:.1f} ms cpu, rows {stats['rows_in']} -> {stats['rows_out']}, "
+                f"peak {stats['peak_memory_mb']:.1f} MB"
+            )
+
+        return report
@@ -0,0 +1,307 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+import logging
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    SIDECAR_AVAILABLE = True
+except ImportError:
+    SIDECAR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import CACHE_TTL, CACHE_MAX_MEMORY_MB, FILTER_CACHE_MAX_ENTRIES
+except ImportError:
+    # config.py lives at the project root, which is not always on sys.path
+    # (e.g. when launched via `streamlit run src/dashboard.py`)
+    CACHE_TTL = 3600
+    CACHE_MAX_MEMORY_MB = 512
+    FILTER_CACHE_MAX_ENTRIES = 64
+
+HASH_CHUNK_SIZE = 1024 * 1024
+SIDECAR_METADATA_KEY = b'sales_dashboard_source'
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Compute a fast content hash of a file, reading it in chunks.
+
+    Args:
+        file_path (str): Path to the file
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def hash_bytes(content: Union[bytes, str]) -> str:
+    """
+    Compute a fast content hash of in-memory bytes or text.
+
+    Args:
+        content (Union[bytes, str]): Uploaded bytes or pasted text
+
+    Returns:
+        str: Hex digest of the content
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint in bytes of a cached value.
+
+    DataFrames are measured with ``memory_usage(deep=True)``; dicts and lists
+    are measured recursively; other objects count their ``nbytes`` if they
+    have one, or zero otherwise.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sum(estimate_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    return int(getattr(value, 'nbytes', 0))
+
+
+class PipelineCache:
+    """
+    A thread-safe LRU cache with a time-to-live and a memory budget.
+
+    Entries expire ``ttl`` seconds after insertion. When the estimated size of
+    all entries exceeds ``max_memory_bytes``, or there are more than
+    ``max_entries`` of them, the least recently used entries are evicted until
+    the cache fits again. Keys can be any hashable value.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL, max_memory_bytes: int = CACHE_MAX_MEMORY_MB * 1024 * 1024,
+                 max_entries: Optional[int] = None):
+        self.ttl = ttl
+        self.max_memory_bytes = max_memory_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting old entries if needed."""
+        size = estimate_size(value)
+        if size > self.max_memory_bytes:
+            logger.info(f"Result of {size / 1e6:.1f} MB exceeds cache budget, not caching")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + self.ttl)
+            self._memory_bytes += size
+
+            while self._entries and (self._memory_bytes > self.max_memory_bytes or
+                                     (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                logger.info(f"Evicted cache entry {str(oldest_key)[:40]}")
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'memory_bytes': self._memory_bytes
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._memory_bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def sidecar_path(file_path: str) -> str:
+    """Return the path of the columnar sidecar stored next to a source file."""
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, f".{name}.arrow")
+
+
+def _source_signature(file_path: str) -> Dict[str, int]:
+    stat = os.stat(file_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def read_sidecar(file_path: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Load a file's columnar sidecar if it is still valid for the source.
+
+    The sidecar is used directly when the source size and mtime match. If only
+    the mtime changed (e.g. the file was copied or touched) the content hash
+    decides. The Arrow IPC file is memory-mapped rather than read into memory,
+    so reading a subset of its columns only touches those columns.
+
+    Args:
+        file_path (str): Path to the source data file
+        columns (Optional[List[str]]): Columns to read, or None for all columns
+            of the source; a sidecar holding only some columns is valid only
+            if it has all of the requested ones
+
+    Returns:
+        Optional[pd.DataFrame]: The cached data, or None if there is no valid sidecar
+    """
+    path = sidecar_path(file_path)
+    if not SIDECAR_AVAILABLE or not os.path.exists(path):
+        return None
+
+    try:
+        table = feather.read_table(path, memory_map=True)
+        stored = json.loads(table.schema.metadata[SIDECAR_METADATA_KEY])
+        current = _source_signature(file_path)
+
+        if stored['size'] != current['size']:
+            return None
+        if stored['mtime_ns'] != current['mtime_ns'] and stored['hash'] != hash_file(file_path):
+            return None
+
+        # Sidecars written before column pruning hold every column
+        stored_columns = stored.get('columns')
+        if columns is None:
+            return table.to_pandas() if stored_columns is None else None
+        if stored_columns is not None and not set(columns) <= set(stored_columns):
+            return None
+
+        return table.select(columns).to_pandas()
+
+    except (OSError, KeyError, TypeError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Ignoring unreadable sidecar {path}: {str(e)}")
+        return None
+
+
+def read_sidecar_header(file_path: str) -> Optional[List[str]]:
+    """
+    Return the source header recorded in a file's sidecar.
+
+    Only the sidecar's schema is read, and it is not checked against the
+    source; read_sidecar does that when the data is read.
+
+    Args:
+        file_path (str): Path to the source data file
+
+    Returns:
+        Optional[List[str]]: Column names of the source, or None if there is no
+            sidecar or it predates recording the header
+    """
+    path = sidecar_path(file_path)
+    if not SIDECAR_AVAILABLE or not os.path.exists(path):
+        return None
+
+    try:
+        with pa.memory_map(path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata
+        stored = json.loads(metadata[SIDECAR_METADATA_KEY])
+        return stored.get('header')
+    except (OSError, KeyError, TypeError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Ignoring unreadable sidecar {path}: {str(e)}")
+        return None
+
+
+def write_sidecar(file_path: str, data: pd.DataFrame, complete: bool = True,
+                  header: Optional[List[str]] = None) -> bool:
+    """
+    Write a parsed DataFrame as an uncompressed Arrow IPC sidecar next to its source.
+
+    Failures (read-only directory, columns Arrow can't represent) are logged
+    and otherwise ignored, since the sidecar is only an optimization.
+
+    Args:
+        file_path (str): Path to the source data file
+        data (pd.DataFrame): Parsed contents of the source
+        complete (bool): False if ``data`` holds only some of the source's columns
+        header (Optional[List[str]]): All column names of the source, recorded so a
+            later load can choose its columns without reopening the source;
+            defaults to the columns of ``data``
+
+    Returns:
+        bool: True if the sidecar was written
+    """
+    if not SIDECAR_AVAILABLE:
+        return False
+
+    path = sidecar_path(file_path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        signature = _source_signature(file_path)
+        signature['hash'] = hash_file(file_path)
+        signature['columns'] = None if complete else [str(col) for col in data.columns]
+        signature['header'] = [str(col) for col in (data.columns if header is None else header)]
+
+        table = pa.Table.from_pandas(data)
+        metadata = dict(table.schema.metadata or {})
+        metadata[SIDECAR_METADATA_KEY] = json.dumps(signature).encode('utf-8')
+        table = table.replace_schema_metadata(metadata)
+
+        # Uncompressed so the file can be memory-mapped without decoding
+        feather.write_feather(table, temp_path, compression='uncompressed')
+        os.replace(temp_path, path)
+        return True
+
+    except (OSError, TypeError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Could not write sidecar for {file_path}: {str(e)}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
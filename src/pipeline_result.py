@@ -0,0 +1,91 @@
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from pipeline_cache import estimate_size
+
+
+class PipelineResult(MutableMapping):
+    """
+    Dict-like pipeline result whose entries can be (re)computed on demand.
+
+    Entries are either stored values or factories. Reading an entry that only
+    has a factory calls it once and keeps the value, so a dropped frame is
+    recomputed transparently the first time it is requested again. Membership
+    tests and iteration include factory-backed keys without computing them.
+
+    Keys listed in ``shared`` are computed on the original even when read
+    through a copy, so small derived results (e.g. aggregates) are computed
+    once per cached result, while large frames recomputed through a copy stay
+    with that copy.
+
+    ``retained_bytes`` is memory the factories themselves keep alive (e.g. the
+    uploaded bytes a dropped frame is re-parsed from); it counts towards
+    ``nbytes`` so cache budgets see it.
+    """
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None,
+                 factories: Optional[Dict[str, Callable[[], Any]]] = None,
+                 shared: Iterable[str] = (), retained_bytes: int = 0):
+        self._values = dict(values or {})
+        self._factories = dict(factories or {})
+        self._shared = frozenset(shared)
+        self.retained_bytes = retained_bytes
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key not in self._factories:
+            raise KeyError(key)
+
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = self._factories[key]()
+            return self._values[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._values and key not in self._factories:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._factories.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._values
+        yield from (key for key in self._factories if key not in self._values)
+
+    def __len__(self) -> int:
+        return len(self._values.keys() | self._factories.keys())
+
+    def __repr__(self) -> str:
+        computed = ', '.join(self._values)
+        pending = ', '.join(key for key in self._factories if key not in self._values)
+        return f"PipelineResult(computed=[{computed}], pending=[{pending}])"
+
+    def is_computed(self, key: str) -> bool:
+        """Return True if ``key`` holds a value, without computing it."""
+        return key in self._values
+
+    def drop(self, *keys: str) -> None:
+        """Release the stored values of ``keys``; entries with a factory stay readable."""
+        for key in keys:
+            self._values.pop(key, None)
+
+    def copy(self) -> 'PipelineResult':
+        """Return a shallow copy; only shared keys computed on the copy reach the original."""
+        factories = {
+            key: (lambda key=key: self[key]) if key in self._shared else factory
+            for key, factory in self._factories.items()
+        }
+        return PipelineResult(self._values, factories, self._shared, self.retained_bytes)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the computed values and the factories' retained data."""
+        return sum(estimate_size(value) for value in self._values.values()) + self.retained_bytes
@@ -0,0 +1,223 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Countries and regions used by create_sample_data; larger cardinalities are
+# filled with numbered synthetic countries spread across the same regions
+BASE_COUNTRIES = [
+    ('United States', 'North America'), ('Canada', 'North America'), ('Mexico', 'North America'),
+    ('Brazil', 'South America'), ('Argentina', 'South America'), ('Chile', 'South America'),
+    ('United Kingdom', 'Europe'), ('Germany', 'Europe'), ('France', 'Europe'), ('Italy', 'Europe'), ('Spain', 'Europe'),
+    ('China', 'Asia'), ('Japan', 'Asia'), ('India', 'Asia'), ('South Korea', 'Asia'),
+    ('Australia', 'Oceania'), ('New Zealand', 'Oceania'),
+    ('South Africa', 'Africa'), ('Nigeria', 'Africa'), ('Egypt', 'Africa')
+]
+REGIONS = ['North America', 'South America', 'Europe', 'Asia', 'Oceania', 'Africa']
+BASE_PRODUCTS = ['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books']
+
+# Regional sales multipliers, as in create_sample_data
+REGION_SALES_FACTORS = {'North America': 1.5, 'Europe': 1.3, 'Asia': 1.2}
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+SALES_PERSON_POOL = 250
+
+
+def _dimension_values(n_countries: int, n_products: int) -> Tuple[List[str], List[str], List[str]]:
+    """Return country names, their regions and product names for the requested cardinality."""
+    countries = [name for name, _ in BASE_COUNTRIES[:n_countries]]
+    regions = [region for _, region in BASE_COUNTRIES[:n_countries]]
+    for i in range(len(countries), n_countries):
+        countries.append(f"Country {i + 1:05d}")
+        regions.append(REGIONS[i % len(REGIONS)])
+
+    products = BASE_PRODUCTS[:n_products]
+    products += [f"Product {i + 1:04d}" for i in range(len(products), n_products)]
+
+    return countries, regions, products
+
+
+def generate_sales_data(n_rows: int, n_countries: int = 20, n_products: int = 5, n_years: int = 5,
+                        start_year: int = 2020, include_date: bool = False,
+                        include_sales_person: bool = False, seed: Optional[int] = 42) -> pd.DataFrame:
+    """
+    Generate realistic synthetic sales data with vectorized NumPy sampling.
+
+    Rows draw a random country, product and year; sales follow the same
+    regional pattern as create_sample_data. The same arguments and seed
+    always produce the same data.
+
+    Args:
+        n_rows (int): Number of rows to generate
+        n_countries (int): Number of distinct countries
+        n_products (int): Number of distinct product categories
+        n_years (int): Number of distinct years, starting at start_year
+        start_year (int): First year
+        include_date (bool): Add a Date column within each row's year
+        include_sales_person (bool): Add a 'Sales Person' column
+        seed (Optional[int]): Random seed
+
+    Returns:
+        pd.DataFrame: Synthetic sales data
+    """
+    rng = np.random.default_rng(seed)
+    countries, regions, products = _dimension_values(n_countries, n_products)
+
+    country_codes = rng.integers(0, len(countries), n_rows)
+    product_codes = rng.integers(0, len(products), n_rows)
+    years = rng.integers(start_year, start_year + n_years, n_rows).astype('int16')
+
+    region_codes = np.array([REGIONS.index(region) for region in regions])
+    region_factors = np.array([REGION_SALES_FACTORS.get(region, 1.0) for region in regions])
+    base_sales = rng.normal(50000, 15000, n_rows) * region_factors[country_codes]
+    sales = np.maximum(1000, base_sales + rng.normal(0, 5000, n_rows))
+    profit = sales * rng.uniform(0.1, 0.3, n_rows)
+
+    data = pd.DataFrame({
+        'Country': pd.Categorical.from_codes(country_codes, countries),
+        'Region': pd.Categorical.from_codes(region_codes[country_codes], REGIONS),
+        'Product_Category': pd.Categorical.from_codes(product_codes, products),
+        'Year': years,
+        'Sales': sales.round(2),
+        'Profit': profit.round(2)
+    })
+
+    if include_date:
+        day_offsets = rng.integers(0, 365, n_rows)
+        year_starts = pd.to_datetime(years.astype(str), format='%Y')
+        data['Date'] = year_starts + pd.to_timedelta(day_offsets, unit='D')
+
+    if include_sales_person:
+        person_codes = rng.integers(0, SALES_PERSON_POOL, n_rows)
+        people = [f"Sales Rep {i + 1:04d}" for i in range(SALES_PERSON_POOL)]
+        data['Sales Person'] = pd.Categorical.from_codes(person_codes, people)
+
+    return data
+
+
+def _generate_chunk(args: Tuple[int, dict, np.random.SeedSequence]) -> pd.DataFrame:
+    n_rows, options, seed_sequence = args
+    return generate_sales_data(n_rows, seed=seed_sequence.generate_state(1)[0], **options)
+
+
+def iter_sales_chunks(n_rows: int, chunk_rows: int = DEFAULT_CHUNK_ROWS, workers: int = 1,
+                      seed: Optional[int] = 42, **options) -> Iterator[pd.DataFrame]:
+    """
+    Yield synthetic data in chunks, optionally generated in parallel processes.
+
+    Each chunk gets its own seed derived from ``seed``, so the output is the
+    same for any number of workers. At most ``2 * workers`` chunks are in
+    flight, which bounds memory regardless of ``n_rows``.
+
+    Args:
+        n_rows (int): Total number of rows
+        chunk_rows (int): Rows per chunk
+        workers (int): Number of worker processes (1 generates in-process)
+        seed (Optional[int]): Random seed
+        **options: Extra arguments for generate_sales_data
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of synthetic data
+    """
+    chunk_sizes = [min(chunk_rows, n_rows - start) for start in range(0, n_rows, chunk_rows)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    tasks = [(size, options, chunk_seed) for size, chunk_seed in zip(chunk_sizes, seeds)]
+
+    if workers <= 1:
+        for task in tasks:
+            yield _generate_chunk(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for task in tasks:
+            pending.append(executor.submit(_generate_chunk, task))
+            if len(pending) >= 2 * workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def write_synthetic_data(output_path: str, n_rows: int, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                         workers: int = 1, seed: Optional[int] = 42, **options) -> str:
+    """
+    Generate synthetic data chunk by chunk straight into a CSV or Parquet file.
+
+    Args:
+        output_path (str): Destination file ending in .csv or .parquet
+        n_rows (int): Total number of rows
+        chunk_rows (int): Rows per chunk
+        workers (int): Number of worker processes
+        seed (Optional[int]): Random seed
+        **options: Extra arguments for generate_sales_data
+
+    Returns:
+        str: The output path
+    """
+    file_extension = output_path.split('.')[-1].lower()
+    if file_extension not in ['csv', 'parquet']:
+        raise ValueError(f"Unsupported output format: {file_extension}")
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    writer = None
+    rows_written = 0
+    try:
+        for chunk in iter_sales_chunks(n_rows, chunk_rows, workers, seed, **options):
+            if file_extension == 'csv':
+                chunk.to_csv(output_path, mode='w' if rows_written == 0 else 'a',
+                             header=rows_written == 0, index=False)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                # Plain strings so every chunk shares one schema
+                table = pa.Table.from_pandas(chunk.astype({
+                    col: str for col in chunk.columns if isinstance(chunk[col].dtype, pd.CategoricalDtype)
+                }), preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+
+            rows_written += len(chunk)
+            logger.info(f"Wrote {rows_written:,} / {n_rows:,} rows to {output_path}")
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic sales data for load testing.")
+    parser.add_argument('--rows', type=int, required=True, help='Number of rows to generate')
+    parser.add_argument('--output', required=True, help='Output file (.csv or .parquet)')
+    parser.add_argument('--countries', type=int, default=20, help='Number of distinct countries')
+    parser.add_argument('--products', type=int, default=5, help='Number of distinct product categories')
+    parser.add_argument('--years', type=int, default=5, help='Number of distinct years')
+    parser.add_argument('--start-year', type=int, default=2020, help='First year')
+    parser.add_argument('--date', action='store_true', help='Include a Date column')
+    parser.add_argument('--sales-person', action='store_true', help="Include a 'Sales Person' column")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help='Rows per chunk')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    write_synthetic_data(
+        args.output, args.rows, chunk_rows=args.chunk_rows, workers=args.workers, seed=args.seed,
+        n_countries=args.countries, n_products=args.products, n_years=args.years,
+        start_year=args.start_year, include_date=args.date, include_sales_person=args.sales_person
+    )
+
+
+if __name__ == "__main__":
+    main()
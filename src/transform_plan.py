@@ -0,0 +1,242 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump when the plan layout or the detection rules change, so stored plans
+# from an older version are recompiled instead of replayed
+TRANSFORM_PLAN_VERSION = 1
+
+# Standard column -> lower-case header aliases that are renamed to it
+COLUMN_ALIASES = {
+    'Country': ['country', 'nation', 'state', 'location', 'place', 'territory', 'country_name'],
+    'Region': ['region', 'continent', 'area', 'zone', 'territory', 'geography', 'geo_region'],
+    'Sales': [
+        'sales', 'revenue', 'income', 'turnover', 'amount', 'value', 'total_sales', 'gross_sales',
+        'average consumer spending on gadgets ($)', 'consumer spending', 'spending', 'gadget spending'
+    ],
+    'Profit': ['profit', 'margin', 'net_income', 'earnings', 'gain', 'net_profit', 'profit_amount'],
+    'Year': ['year', 'yr', 'fiscal_year', 'period', 'time_period'],
+    'Product_Category': ['product', 'category', 'item', 'product_type', 'item_category', 'product_name', 'goods'],
+    # Tech-specific mappings for the Global Tech Gadget Consumption dataset
+    'Smartphone_Sales': ['smartphone sales (millions)', 'smartphone sales', 'phone sales'],
+    'Laptop_Shipments': ['laptop shipments (millions)', 'laptop shipments', 'laptop sales'],
+    'Gaming_Console_Adoption': ['gaming console adoption (%)', 'gaming adoption', 'console adoption'],
+    'Smartwatch_Penetration': ['smartwatch penetration (%)', 'smartwatch penetration', 'watch penetration'],
+    'E_Waste_Generated': ['e-waste generated (metric tons)', 'e-waste', 'electronic waste'],
+    'G5_Penetration': ['5g penetration rate (%)', '5g penetration', '5g rate']
+}
+
+# Common country name variations, applied after title-casing
+COUNTRY_NAME_FIXES = {
+    'Usa': 'United States',
+    'Us': 'United States',
+    'America': 'United States',
+    'Uk': 'United Kingdom',
+    'Britain': 'United Kingdom',
+    'Deutschland': 'Germany',
+    'Brasil': 'Brazil',
+    'Espana': 'Spain',
+    'Nippon': 'Japan'
+}
+
+# Region for countries when the data has no region column
+COUNTRY_TO_REGION = {
+    'United States': 'North America',
+    'USA': 'North America',
+    'Canada': 'North America',
+    'Mexico': 'North America',
+    'Brazil': 'South America',
+    'Argentina': 'South America',
+    'Chile': 'South America',
+    'Peru': 'South America',
+    'Colombia': 'South America',
+    'United Kingdom': 'Europe',
+    'UK': 'Europe',
+    'Germany': 'Europe',
+    'France': 'Europe',
+    'Italy': 'Europe',
+    'Spain': 'Europe',
+    'Netherlands': 'Europe',
+    'Sweden': 'Europe',
+    'Norway': 'Europe',
+    'Poland': 'Europe',
+    'Russia': 'Europe',
+    'China': 'Asia',
+    'Japan': 'Asia',
+    'India': 'Asia',
+    'South Korea': 'Asia',
+    'Thailand': 'Asia',
+    'Singapore': 'Asia',
+    'Malaysia': 'Asia',
+    'Indonesia': 'Asia',
+    'Philippines': 'Asia',
+    'Australia': 'Oceania',
+    'New Zealand': 'Oceania',
+    'South Africa': 'Africa',
+    'Nigeria': 'Africa',
+    'Egypt': 'Africa',
+    'Kenya': 'Africa',
+    'Morocco': 'Africa'
+}
+
+# Columns a Year can be extracted from, in order of preference
+DATE_COLUMN_CANDIDATES = ['Date', 'date', 'Date_Time', 'datetime', 'timestamp', 'time']
+
+# Columns holding money amounts that may use currency symbols or K/M/B notation
+MONEY_COLUMNS = ['Sales', 'Profit']
+
+# Placeholder values for required columns the data doesn't provide
+REQUIRED_COLUMN_DEFAULTS = {'Country': 'Unknown', 'Region': 'Unknown', 'Sales': 0}
+
+TECH_SPENDING_COLUMN = 'Average Consumer Spending On Gadgets ($)'
+
+# Product categories scored from tech metrics, in tie-break order, with the
+# keyword that assigns a column to each category
+TECH_CATEGORY_KEYWORDS = {
+    'Smartphones': 'smartphone',
+    'Laptops': 'laptop',
+    'Gaming Consoles': 'gaming',
+    'Smartwatches': 'smartwatch'
+}
+
+# Standard columns auto_transform_data and clean_data read when present,
+# including the date columns clean_data derives Year from
+PIPELINE_COLUMNS = ['Country', 'Region', 'Sales', 'Profit', 'Year', 'Product_Category', 'Date', 'date', 'year']
+
+
+def schema_fingerprint(columns: Sequence[str]) -> str:
+    """Return a stable fingerprint of an ordered list of column names."""
+    header = json.dumps([str(col) for col in columns])
+    return hashlib.blake2b(header.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def compile_transform_plan(columns: Sequence[str]) -> Dict[str, Any]:
+    """
+    Decide every schema-dependent step of auto_transform_data up front.
+
+    All of auto_transform_data's decisions depend only on the column names, so
+    they can be made once per header and replayed on any data (or chunk) with
+    the same columns. The plan is a plain JSON-serializable dict.
+
+    Args:
+        columns (Sequence[str]): Column names of the raw data, in order
+
+    Returns:
+        Dict[str, Any]: Transform plan for SalesDataProcessor.auto_transform_data
+    """
+    current = list(columns)
+    # Maps each current column name back to its raw name, so chained renames
+    # collapse into one raw -> final rename
+    origin = {col: col for col in current}
+    renames = {}
+
+    # Auto-detect and rename columns
+    for target_col, possible_names in COLUMN_ALIASES.items():
+        aliases = [name.lower() for name in possible_names]
+        for col in list(current):
+            if col.lower().strip() in aliases and target_col not in current:
+                current[current.index(col)] = target_col
+                origin[target_col] = origin.pop(col)
+                renames[origin[target_col]] = target_col
+                logger.info(f"Mapped '{col}' -> '{target_col}'")
+                break
+
+    plan = {
+        'version': TRANSFORM_PLAN_VERSION,
+        'schema': schema_fingerprint(columns),
+        'renames': renames,
+        'encode_country': 'Country' in current,
+        'sales_from': None,
+        'derive_region': False,
+        'money_columns': [],
+        'year_from_date': [],
+        'required_defaults': {},
+        'profit': None,
+        'current_year': False,
+        'product_category': None
+    }
+
+    # Global Tech Gadget Consumption: use consumer spending as the sales metric
+    if TECH_SPENDING_COLUMN in current and 'Sales' not in current:
+        plan['sales_from'] = TECH_SPENDING_COLUMN
+        current.append('Sales')
+
+    if 'Country' in current and 'Region' not in current:
+        plan['derive_region'] = True
+        current.append('Region')
+
+    plan['money_columns'] = [col for col in MONEY_COLUMNS if col in current]
+
+    if 'Year' not in current:
+        plan['year_from_date'] = [col for col in DATE_COLUMN_CANDIDATES if col in current]
+
+    for col, default in REQUIRED_COLUMN_DEFAULTS.items():
+        if col not in current:
+            plan['required_defaults'][col] = default
+            current.append(col)
+
+    if 'Profit' not in current:
+        if any('smartphone' in col.lower() or 'gadget' in col.lower() for col in current):
+            plan['profit'] = 'tech_by_category' if 'Product_Category' in current else 'tech_default'
+        else:
+            plan['profit'] = 'flat'
+
+    # Whether Year parses from a date column is only known per file, so the
+    # current-year fallback is decided when the plan is applied
+    plan['current_year'] = 'Year' not in current
+
+    if 'Product_Category' not in current:
+        if any('smartphone' in col.lower() for col in current):
+            plan['product_category'] = 'tech'
+        else:
+            plan['product_category'] = 'random'
+
+    return plan
+
+
+def plan_matches(plan: Dict[str, Any], columns: Sequence[str]) -> bool:
+    """Return True if ``plan`` was compiled for exactly these columns by this version."""
+    return plan.get('version') == TRANSFORM_PLAN_VERSION and plan.get('schema') == schema_fingerprint(columns)
+
+
+def plan_load_columns(plan: Dict[str, Any], columns: Sequence[str]) -> List[str]:
+    """
+    Return the raw columns the pipeline reads when transforming data with ``plan``.
+
+    These are the sources of the standard columns, the tech spending and date
+    columns the plan derives Sales and Year from, and, for tech datasets, the
+    metric columns product categories are inferred from. Every other column
+    can be skipped when loading. If skipping them would change any decision
+    of the plan, all columns are returned.
+
+    Args:
+        plan (Dict[str, Any]): Plan compiled for ``columns``
+        columns (Sequence[str]): Column names of the raw data, in order
+
+    Returns:
+        List[str]: Needed column names, in header order
+    """
+    needed = set(PIPELINE_COLUMNS) | set(plan['year_from_date'])
+    if plan['sales_from']:
+        needed.add(plan['sales_from'])
+
+    load_columns = []
+    for col in columns:
+        name = plan['renames'].get(col, col)
+        is_tech_metric = plan['product_category'] == 'tech' and any(
+            keyword in str(name).lower() for keyword in TECH_CATEGORY_KEYWORDS.values()
+        )
+        if name in needed or is_tech_metric:
+            load_columns.append(col)
+
+    # Renames of skipped columns don't matter; every other decision must stay the same
+    expected = dict(plan, renames={raw: name for raw, name in plan['renames'].items() if raw in load_columns})
+    pruned_plan = compile_transform_plan(load_columns)
+    if any(pruned_plan[key] != expected[key] for key in expected if key != 'schema'):
+        logger.info("Dropping unused columns would change the transform plan; loading all columns")
+        return list(columns)
+
+    return load_columns
@@ -357,6 +357,9 @@ class SalesVisualizer:
         """
         Calculate key performance indicators for dashboard cards.
         
+        When the dictionary has a dimension 'cube' (see SalesDataProcessor.build_cube)
+        the KPIs are computed from it instead of the row-level cleaned data.
+        
         Args:
             data (Dict[str, pd.DataFrame]): Processed data dictionary
             
@@ -365,8 +368,10 @@ class SalesVisualizer:
         """
         kpis = {}
         
-        if 'cleaned_data' in data and not data['cleaned_data'].empty:
-            cleaned_data = data['cleaned_data']
+        source_key = 'cube' if 'cube' in data and not data['cube'].empty else 'cleaned_data'
+        
+        if source_key in data and not data[source_key].empty:
+            cleaned_data = data[source_key]
             
             # Total sales
             kpis['total_sales'] = cleaned_data['Sales'].sum()
@@ -0,0 +1,73 @@
+"""
+Equivalence tests for the compute backends: every installed engine must give
+the same pipeline results as pandas. Tests for engines that aren't installed
+are skipped.
+
+Run from the project root with ``python -m pytest tests``.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from compare_backends import compare, run_pipeline
+from compute_backend import PandasBackend, get_backend
+from run_benchmarks import SHAPES, make_dataset
+
+ALTERNATIVE_BACKENDS = ['polars', 'duckdb']
+ROWS = 5_000
+
+
+@pytest.fixture(scope='module', params=SHAPES)
+def dataset(request, tmp_path_factory):
+    """Write a dataset of each benchmark shape and return its path with the pandas results."""
+    path = tmp_path_factory.mktemp('data') / f"{request.param}.csv"
+    make_dataset(request.param, ROWS).to_csv(path, index=False)
+    return str(path), run_pipeline('pandas', str(path))
+
+
+@pytest.mark.parametrize('backend', ALTERNATIVE_BACKENDS)
+def test_pipeline_matches_pandas(backend, dataset):
+    pytest.importorskip(backend)
+    path, expected = dataset
+
+    assert compare(expected, run_pipeline(backend, path)) == []
+
+
+@pytest.mark.parametrize('backend', ALTERNATIVE_BACKENDS)
+@pytest.mark.parametrize('dropna', [True, False])
+def test_group_sum_keeps_category_order_and_missing_keys(backend, dropna):
+    pytest.importorskip(backend)
+    # Categories deliberately not in alphabetical or first-seen order
+    data = pd.DataFrame({
+        'Region': pd.Categorical(['Europe', 'Asia', None, 'Europe', 'Africa', 'Asia'],
+                                 categories=['Europe', 'Africa', 'Asia']),
+        'Year': [2021, 2020, 2021, np.nan, 2020, 2020],
+        'Sales': [1.5, 2.0, 3.0, np.nan, 4.25, 1.0],
+        'Profit': [0.5, 0.25, 1.0, 2.0, 1.0, 0.5]
+    })
+    keys, metrics = ['Region', 'Year'], ['Sales', 'Profit']
+
+    expected = PandasBackend().group_sum(data, keys, metrics, dropna)
+    actual = get_backend(backend).group_sum(data, keys, metrics, dropna)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize('backend', ALTERNATIVE_BACKENDS)
+def test_read_csv_matches_pandas(backend, tmp_path):
+    pytest.importorskip(backend)
+    path = tmp_path / 'sales.csv'
+    path.write_text('Country,Region,Sales,Year\nFrance,Europe,1.5,2021\nJapan,Asia,,2020\n')
+    columns, dtypes = ['Country', 'Sales', 'Year'], {'Country': 'category'}
+
+    expected = PandasBackend().read_csv(str(path), usecols=columns, dtype=dtypes)
+    actual = get_backend(backend).read_csv(str(path), usecols=columns, dtype=dtypes)
+
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    assert isinstance(actual['Country'].dtype, pd.CategoricalDtype)
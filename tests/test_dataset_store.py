@@ -0,0 +1,171 @@
+"""
+Tests for the SQLite dataset store: results loaded from the store, and
+filtered in SQL, must match the in-memory pipeline, and datasets the store
+evicts must be recomputed rather than served empty.
+"""
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processor import SalesDataProcessor, create_sample_data, filter_cache, pipeline_cache
+from dataset_store import DatasetStore
+
+STORED_FRAMES = ['continent_data', 'country_data', 'growth_trends', 'top_countries', 'top_regions', 'cube']
+SELECTIONS = [
+    (None, None, None),
+    (['Europe', 'Asia'], None, None),
+    (['Europe'], [2022], None),
+    ([], None, None),
+    (None, None, ['Smartphones'])
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    pipeline_cache.clear()
+    filter_cache.clear()
+    yield
+    pipeline_cache.clear()
+    filter_cache.clear()
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    """Write two different sales datasets and return their paths."""
+    data = create_sample_data()
+    first, second = tmp_path / 'first.csv', tmp_path / 'second.csv'
+    data.to_csv(first, index=False)
+    data.iloc[::2].to_csv(second, index=False)
+    return str(first), str(second)
+
+
+def wait_for_saves():
+    for thread in threading.enumerate():
+        if thread.name.startswith('store-'):
+            thread.join()
+
+
+def process(path, store, **kwargs):
+    """Run the pipeline with ``store`` and wait until its background save has finished."""
+    results = SalesDataProcessor(store=store).process_full_pipeline(path, use_sidecar=False, **kwargs)
+    wait_for_saves()
+    return results
+
+
+def load_from_store(path, store):
+    """Process ``path`` once so it's stored, then return the store-backed result and the in-memory one."""
+    expected = process(path, store)
+    pipeline_cache.clear()
+    stored = process(path, store)
+    assert stored['from_store'] and not stored.is_computed('cleaned_data')
+    return stored, expected
+
+
+def test_stored_results_round_trip(tmp_path, sample_files):
+    stored, expected = load_from_store(sample_files[0], DatasetStore(str(tmp_path / 'store.sqlite')))
+
+    for name in STORED_FRAMES + ['raw_preview', 'transformed_preview']:
+        pd.testing.assert_frame_equal(stored[name], expected[name], check_index_type=False)
+    pd.testing.assert_frame_equal(stored['cleaned_data'], expected['cleaned_data'])
+    assert stored['raw_rows'] == expected['raw_rows']
+
+
+@pytest.mark.parametrize('regions, years, products', SELECTIONS)
+def test_sql_filtering_matches_in_memory(tmp_path, sample_files, regions, years, products):
+    store = DatasetStore(str(tmp_path / 'store.sqlite'))
+    stored, expected = load_from_store(sample_files[0], store)
+
+    in_memory = SalesDataProcessor()._compute_filter_results(expected, regions, years, products)
+    from_sql = SalesDataProcessor(store=store)._compute_filter_results(stored, regions, years, products)
+
+    assert not stored.is_computed('cleaned_data')
+    assert in_memory.keys() == from_sql.keys()
+    for name, frame in in_memory.items():
+        keep_index = name == 'cleaned_data'
+        pd.testing.assert_frame_equal(from_sql[name].reset_index(drop=not keep_index),
+                                      frame.reset_index(drop=not keep_index),
+                                      check_dtype=False, check_categorical=False, check_index_type=False)
+
+
+def test_save_evicts_oldest_dataset(tmp_path, sample_files):
+    store = DatasetStore(str(tmp_path / 'store.sqlite'), max_datasets=1)
+    first = process(sample_files[0], store)
+    second = process(sample_files[1], store)
+
+    assert not store.has(first['fingerprint'])
+    assert store.has(second['fingerprint'])
+
+
+def test_evicted_dataset_is_recomputed_not_served_empty(tmp_path, sample_files):
+    store = DatasetStore(str(tmp_path / 'store.sqlite'), max_datasets=1)
+    stored, expected = load_from_store(sample_files[0], store)
+    # Storing another dataset evicts the first while its store-backed result is cached
+    process(sample_files[1], store)
+    assert not store.has(expected['fingerprint'])
+
+    results = SalesDataProcessor(store=store).process_full_pipeline(sample_files[0], use_sidecar=False)
+    filtered = SalesDataProcessor(store=store).filter_results(results, regions=['Europe'])
+
+    for name in STORED_FRAMES:
+        pd.testing.assert_frame_equal(results[name], expected[name])
+    pd.testing.assert_frame_equal(results['cleaned_data'], expected['cleaned_data'])
+    in_memory = SalesDataProcessor()._compute_filter_results(expected, ['Europe'], None, None)
+    pd.testing.assert_frame_equal(filtered['cleaned_data'], in_memory['cleaned_data'])
+    assert not filtered['continent_data'].empty
+
+
+def test_evicted_dataset_is_filtered_in_memory(tmp_path, sample_files):
+    store = DatasetStore(str(tmp_path / 'store.sqlite'), max_datasets=1)
+    stored, expected = load_from_store(sample_files[0], store)
+    process(sample_files[1], store)
+
+    filtered = SalesDataProcessor(store=store).filter_results(stored, regions=['Europe'], years=[2022])
+    in_memory = SalesDataProcessor()._compute_filter_results(expected, ['Europe'], [2022], None)
+
+    for name, frame in in_memory.items():
+        pd.testing.assert_frame_equal(filtered[name], frame)
+
+
+def test_eviction_releases_pages(tmp_path, sample_files):
+    path = str(tmp_path / 'store.sqlite')
+    store = DatasetStore(path, max_datasets=None)
+    process(sample_files[0], store)
+    process(sample_files[1], store)
+    with closing(sqlite3.connect(path)) as con:
+        pages = con.execute('PRAGMA page_count').fetchone()[0]
+
+    store.max_datasets = 1
+    assert store.evict() == 1
+
+    with closing(sqlite3.connect(path)) as con:
+        assert con.execute('PRAGMA freelist_count').fetchone()[0] == 0
+        assert con.execute('PRAGMA page_count').fetchone()[0] < pages
+
+
+def test_background_save_runs_once_per_key(tmp_path, sample_files, monkeypatch):
+    store = DatasetStore(str(tmp_path / 'store.sqlite'))
+    results = SalesDataProcessor().process_full_pipeline(sample_files[0], use_sidecar=False)
+    release, saved = threading.Event(), []
+
+    def slow_save(key, stored):
+        release.wait()
+        saved.append(stored)
+    monkeypatch.setattr(store, 'save', slow_save)
+
+    processor = SalesDataProcessor(store=store)
+    processor._store_in_background('key', results)
+    processor._store_in_background('key', results)
+    threads = [thread for thread in threading.enumerate() if thread.name == 'store-key']
+    release.set()
+    wait_for_saves()
+
+    assert len(threads) == 1 and threads[0].daemon
+    # The thread saves a copy, so frames the save computes don't grow the cached result
+    assert len(saved) == 1 and saved[0] is not results
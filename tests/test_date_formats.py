@@ -0,0 +1,53 @@
+"""
+Date format inference: formats cached for one file must never be applied to
+another file that merely shares its header.
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processor import SalesDataProcessor, date_format_cache, pipeline_cache
+
+HEADER = 'Country,Sales,Date\n'
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    pipeline_cache.clear()
+    date_format_cache.clear()
+    yield
+    pipeline_cache.clear()
+    date_format_cache.clear()
+
+
+def write_csv(path, dates):
+    path.write_text(HEADER + ''.join(f"France,{i + 1}00,{date}\n" for i, date in enumerate(dates)))
+    return str(path)
+
+
+def test_same_header_files_infer_their_own_format(tmp_path):
+    day_first = write_csv(tmp_path / 'a.csv', ['13/02/2022', '01/03/2022'])
+    month_first = write_csv(tmp_path / 'b.csv', ['01/02/2022', '03/04/2022'])
+
+    first = SalesDataProcessor().process_full_pipeline(day_first)['cleaned_data']
+    second = SalesDataProcessor().process_full_pipeline(month_first)['cleaned_data']
+
+    assert list(first['Date']) == list(pd.to_datetime(['2022-02-13', '2022-03-01']))
+    # Parsed month-first, as pd.to_datetime infers from b.csv's own first value
+    assert list(second['Date']) == list(pd.to_datetime(['2022-01-02', '2022-03-04']))
+
+
+def test_clean_data_outside_a_pipeline_infers_per_frame():
+    processor = SalesDataProcessor()
+    day_first = pd.DataFrame({'Country': ['France'] * 2, 'Region': ['Europe'] * 2, 'Sales': [1.0, 2.0],
+                              'Date': ['13/02/2022', '01/03/2022']})
+    month_first = day_first.assign(Date=['01/02/2022', '03/04/2022'])
+
+    processor.clean_data(day_first)
+    cleaned = processor.clean_data(month_first)
+
+    assert list(cleaned['Date']) == list(pd.to_datetime(month_first['Date']))
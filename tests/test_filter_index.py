@@ -0,0 +1,94 @@
+"""
+Tests for FilterIndex: every selection must pick the same rows as the
+boolean isin masks it replaces, for bitmap- and code-indexed dimensions.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import filter_index
+from data_processor import SalesDataProcessor
+from filter_index import FilterIndex
+
+SELECTIONS = [
+    {},
+    {'Region': None, 'Year': None},
+    {'Region': ['Europe']},
+    {'Region': ['Europe', 'Asia'], 'Year': [2021]},
+    {'Year': [2020, 2021, 2022]},
+    {'Year': [2020, 2021, 2022, 2023]},
+    {'Region': []},
+    {'Region': ['Atlantis'], 'Product_Category': ['Laptops']},
+    {'Year': [1999, 2021]},
+    {'Product_Category': ['Laptops', 'Laptops', 'Tablets'], 'Year': [2022]},
+    {'Region': ['Europe', 'Asia', 'Africa'], 'Year': [2020, 2021, 2022], 'Product_Category': ['Laptops', 'Tablets']}
+]
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    n_rows = 1_001
+    years = rng.choice([2020.0, 2021.0, 2022.0, np.nan], n_rows)
+    return pd.DataFrame({
+        'Region': pd.Categorical(rng.choice(['Europe', 'Asia', 'Africa', None], n_rows)),
+        'Year': years,
+        'Product_Category': rng.choice(['Laptops', 'Tablets', 'Phones'], n_rows),
+        'Sales': rng.random(n_rows)
+    }, index=rng.permutation(n_rows) * 3)
+
+
+def isin_mask(data, selections):
+    mask = pd.Series(True, index=data.index)
+    for dim, selected in selections.items():
+        if selected is not None:
+            mask &= data[dim].isin(selected)
+    return data[mask]
+
+
+@pytest.mark.parametrize('max_bitmap_values', [filter_index.MAX_BITMAP_VALUES, 1])
+@pytest.mark.parametrize('selections', SELECTIONS)
+def test_take_matches_isin_masks(data, selections, max_bitmap_values, monkeypatch):
+    # A limit of 1 indexes every dimension by code instead of bitmaps
+    monkeypatch.setattr(filter_index, 'MAX_BITMAP_VALUES', max_bitmap_values)
+    index = FilterIndex(data)
+
+    pd.testing.assert_frame_equal(index.take(data, selections), isin_mask(data, selections))
+
+
+def test_missing_years_never_match(data):
+    index = FilterIndex(data)
+    all_years = [2020, 2021, 2022]
+
+    taken = index.take(data, {'Year': all_years})
+
+    assert len(taken) == data['Year'].notna().sum()
+    assert index.take(data, {'Year': [np.nan]}).empty
+
+
+def test_unfiltered_selection_returns_frame_itself(data):
+    complete = data.dropna(subset=['Region', 'Year'])
+    index = FilterIndex(complete)
+
+    assert index.take(complete, {'Region': ['Europe', 'Asia', 'Africa']}) is complete
+    assert index.positions({'Sales': [1.0]}) is None
+
+
+def test_take_rejects_other_frames(data):
+    with pytest.raises(ValueError):
+        FilterIndex(data).take(data.iloc[1:], {'Region': ['Europe']})
+
+
+def test_filter_cache_key_ignores_order_and_duplicates():
+    key = SalesDataProcessor.filter_cache_key
+
+    assert key('abc', ['Europe', 'Asia'], [2021]) == key('abc', ['Asia', 'Europe', 'Asia'], [2021])
+    assert key('abc', None) != key('abc', [])
+    assert key('abc', ['Europe']) != key('def', ['Europe'])
+    assert key('abc', ['Europe']) != key('abc', None, None, ['Europe'])
+    hash(key('abc', ['Europe'], [2021], ['Laptops']))
@@ -0,0 +1,80 @@
+"""
+Equivalence tests for the chunked and multi-file ingest paths: streaming,
+incremental and directory ingest must give the same aggregates as
+process_full_pipeline on the whole file.
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from data_processor import SalesDataProcessor
+from run_benchmarks import SHAPES, make_dataset
+
+ROWS = 5_000
+# Small enough that every file is read in several chunks
+CHUNK_SIZE = 700
+AGGREGATES = ['continent_data', 'country_data', 'growth_trends', 'top_countries', 'top_regions']
+
+
+@pytest.fixture(scope='module', params=SHAPES)
+def dataset(request, tmp_path_factory):
+    """Write a dataset of each benchmark shape and return it with its path and process_full_pipeline results."""
+    data = make_dataset(request.param, ROWS)
+    path = tmp_path_factory.mktemp('data') / f"{request.param}.csv"
+    data.to_csv(path, index=False)
+    expected = SalesDataProcessor().process_full_pipeline(str(path), use_cache=False, use_sidecar=False)
+    return data, str(path), expected
+
+
+def assert_same_aggregates(actual, expected):
+    for name in AGGREGATES:
+        left, right = actual[name].reset_index(drop=True), expected[name].reset_index(drop=True)
+        if name == 'country_data':
+            # Files are combined in completion order, so countries tied on sales may swap
+            left = left.sort_values(['Country', 'Region'], ignore_index=True)
+            right = right.sort_values(['Country', 'Region'], ignore_index=True)
+        pd.testing.assert_frame_equal(left, right, check_dtype=False, check_categorical=False, check_exact=False,
+                                      obj=name)
+
+
+def test_streaming_matches_full_pipeline(dataset):
+    _, path, expected = dataset
+
+    assert_same_aggregates(SalesDataProcessor().process_streaming_pipeline(path, chunksize=CHUNK_SIZE), expected)
+
+
+def test_incremental_matches_full_pipeline(dataset, tmp_path):
+    data, _, expected = dataset
+    header, *rows = data.to_csv(index=False).splitlines(keepends=True)
+    path = tmp_path / 'growing.csv'
+    processor = SalesDataProcessor()
+
+    path.write_text(header + ''.join(rows[:ROWS // 2]))
+    processor.process_incremental_pipeline(str(path), chunksize=CHUNK_SIZE)
+    with open(path, 'a') as f:
+        f.write(''.join(rows[ROWS // 2:]))
+    appended = processor.process_incremental_pipeline(str(path), chunksize=CHUNK_SIZE)
+    unchanged = processor.process_incremental_pipeline(str(path), chunksize=CHUNK_SIZE)
+
+    assert appended['ingest']['Mode'][0] == 'append'
+    assert unchanged['ingest']['Mode'][0] == 'unchanged'
+    assert_same_aggregates(appended, expected)
+    assert_same_aggregates(unchanged, expected)
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_directory_matches_full_pipeline(dataset, tmp_path, max_workers):
+    data, _, expected = dataset
+    for i, start in enumerate(range(0, ROWS, ROWS // 3)):
+        data.iloc[start:start + ROWS // 3].to_csv(tmp_path / f"part_{i}.csv", index=False)
+
+    results = SalesDataProcessor().process_directory_pipeline(str(tmp_path), max_workers=max_workers,
+                                                              use_sidecar=False)
+
+    assert results['files']['Error'].isna().all()
+    assert_same_aggregates(results, expected)
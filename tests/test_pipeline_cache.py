@@ -0,0 +1,111 @@
+"""
+Tests for PipelineCache expiry and eviction, and for the content-hash keys
+process_full_pipeline caches its results under.
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pipeline_cache as cache_module
+from data_processor import SalesDataProcessor, create_sample_data, pipeline_cache
+from pipeline_cache import PipelineCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's clock with one the test advances by hand."""
+    now = [0.0]
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def clear_pipeline_cache():
+    pipeline_cache.clear()
+    yield
+    pipeline_cache.clear()
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = PipelineCache(ttl=10)
+    cache.set('key', 'value')
+
+    clock[0] = 9.9
+    assert cache.get('key') == 'value'
+    clock[0] = 10
+    assert cache.get('key') is None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 0, 'memory_bytes': 0}
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = PipelineCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+
+def test_memory_budget_evicts_until_entries_fit():
+    cache = PipelineCache(max_memory_bytes=2000)
+    cache.set('a', np.zeros(100))
+    cache.set('b', np.zeros(100))
+    cache.set('c', np.zeros(100))
+
+    assert cache.get('a') is None
+    assert len(cache) == 2 and cache.stats()['memory_bytes'] == 1600
+
+
+def test_value_over_budget_is_not_cached():
+    cache = PipelineCache(max_memory_bytes=100)
+    cache.set('small', np.zeros(10))
+    cache.set('large', np.zeros(100))
+
+    assert cache.get('large') is None
+    assert cache.get('small') is not None
+
+
+def test_get_or_compute_computes_once():
+    cache = PipelineCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return 'value'
+
+    assert cache.get_or_compute('key', compute) == 'value'
+    assert cache.get_or_compute('key', compute) == 'value'
+    assert len(calls) == 1
+
+
+def test_pipeline_is_keyed_by_content(tmp_path, clear_pipeline_cache):
+    data = create_sample_data()
+    original, copy, changed = tmp_path / 'original.csv', tmp_path / 'copy.csv', tmp_path / 'changed.csv'
+    data.to_csv(original, index=False)
+    data.to_csv(copy, index=False)
+    data.iloc[1:].to_csv(changed, index=False)
+
+    first = SalesDataProcessor().process_full_pipeline(str(original), use_sidecar=False)
+    same_content = SalesDataProcessor().process_full_pipeline(str(copy), use_sidecar=False)
+    other_content = SalesDataProcessor().process_full_pipeline(str(changed), use_sidecar=False)
+
+    assert same_content['fingerprint'] == first['fingerprint']
+    assert other_content['fingerprint'] != first['fingerprint']
+    assert pipeline_cache.stats()['hits'] == 1
+
+
+def test_cache_key_tells_pruned_loads_and_settings_apart():
+    content_hash = 'abc123'
+    pruned = SalesDataProcessor(prune_columns=True)._content_cache_key('csv', content_hash)
+    full = SalesDataProcessor(prune_columns=False)._content_cache_key('csv', content_hash)
+    other_margin = SalesDataProcessor(prune_columns=True, default_margin=0.5)._content_cache_key('csv', content_hash)
+
+    assert pruned == f"{full}:pruned"
+    assert full.startswith(f"csv:{content_hash}:")
+    assert other_margin != pruned
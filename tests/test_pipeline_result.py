@@ -0,0 +1,110 @@
+"""
+Tests for PipelineResult: factories run once and on demand, and copies
+handed out by the cache can't change the cached entry.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processor import LAZY_AGGREGATES, LEAN_DROPPED_FRAMES, SalesDataProcessor, create_sample_data, pipeline_cache
+from pipeline_result import PipelineResult
+
+
+class Counter:
+    """Factory that counts its calls."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_factories_run_once_on_first_access():
+    factory = Counter(pd.DataFrame({'a': [1, 2]}))
+    result = PipelineResult({'rows': 2}, factories={'frame': factory})
+
+    assert 'frame' in result and len(result) == 2 and set(result) == {'rows', 'frame'}
+    assert factory.calls == 0 and not result.is_computed('frame')
+    assert result['frame'] is result['frame']
+    assert factory.calls == 1
+
+
+def test_dropped_values_are_recomputed():
+    factory = Counter(np.zeros(10))
+    result = PipelineResult(factories={'frame': factory})
+    result['frame']
+
+    result.drop('frame')
+
+    assert not result.is_computed('frame') and result.nbytes == 0
+    result['frame']
+    assert factory.calls == 2
+
+
+def test_copy_isolates_keys_and_unshared_values():
+    frame, aggregate = Counter(np.zeros(10)), Counter(np.ones(2))
+    original = PipelineResult({'rows': 10}, factories={'frame': frame, 'aggregate': aggregate},
+                              shared=['aggregate'], retained_bytes=5)
+
+    copy = original.copy()
+    copy['rows'] = 0
+    copy['extra'] = 1
+    del copy['aggregate']
+    copy['frame']
+
+    assert original['rows'] == 10 and 'extra' not in original and 'aggregate' in original
+    assert not original.is_computed('frame') and copy.retained_bytes == 5
+
+
+def test_shared_keys_are_computed_once_on_the_original():
+    aggregate = Counter(np.ones(2))
+    original = PipelineResult(factories={'aggregate': aggregate}, shared=['aggregate'])
+
+    first, second = original.copy(), original.copy()
+
+    assert first['aggregate'] is second['aggregate']
+    assert original.is_computed('aggregate') and aggregate.calls == 1
+
+
+def test_nbytes_counts_computed_values_and_retained_bytes():
+    result = PipelineResult({'frame': np.zeros(10)}, factories={'pending': lambda: np.zeros(100)},
+                            retained_bytes=20)
+
+    assert result.nbytes == 100
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    pipeline_cache.clear()
+    path = tmp_path / 'sales.csv'
+    create_sample_data().to_csv(path, index=False)
+    yield str(path)
+    pipeline_cache.clear()
+
+
+def test_pipeline_aggregates_are_lazy_and_shared_with_the_cache(sample_file):
+    results = SalesDataProcessor().process_full_pipeline(sample_file, use_sidecar=False)
+
+    assert not any(results.is_computed(name) for name in LAZY_AGGREGATES)
+    results['continent_data']
+
+    cached = pipeline_cache.get(results['fingerprint'])
+    assert cached.is_computed('continent_data') and not cached.is_computed('country_data')
+
+
+def test_lean_results_recompute_dropped_frames(sample_file):
+    full = SalesDataProcessor().process_full_pipeline(sample_file, use_sidecar=False)
+    lean = SalesDataProcessor().process_full_pipeline(sample_file, use_sidecar=False, lean=True)
+
+    assert not any(lean.is_computed(name) for name in LEAN_DROPPED_FRAMES)
+    for name in LEAN_DROPPED_FRAMES:
+        pd.testing.assert_frame_equal(lean[name], full[name])
+    assert full.is_computed('raw_data')